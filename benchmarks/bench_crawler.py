@@ -0,0 +1,292 @@
+# benchmarks/bench_crawler.py
+"""
+기사 수집/분석 오프라인 벤치마크
+================================
+
+실제 뉴스 사이트에 접속하지 않고, 로컬 HTTP 서버가 저장된 HTML 코퍼스
+(네이버 블로그/뉴스 형태의 합성 픽스처 + ``--corpus DIR`` 의 ``.html`` 파일)를
+지정한 지연 시간과 대역폭으로 제공한다. 이 서버를 대상으로 단계별 처리량과
+지연 시간 분포(p50/p90/p99)를 측정한다.
+
+- fetch   : :meth:`Converter_save.fetch_page` (공유 세션, 스트리밍)
+- parse   : BeautifulSoup 파싱만
+- extract : :meth:`Converter_save.extract_article` (파싱 + 광고 제거 + 본문 선택)
+- analyze : :meth:`EmphaticSentimentAnalyzer.analyze_document` (감정 분석만)
+- end2end : :meth:`EmphaticSentimentAnalyzer.analyze_url` (``--concurrency`` 스레드)
+
+``--save-baseline FILE`` 로 결과를 저장해 두고, 이후 ``--baseline FILE`` 로 비교하면
+처리량이 ``--tolerance`` 비율 이상 떨어지거나 p50 지연이 그만큼 늘어난 단계를
+REGRESSION 으로 표시하고 0 이 아닌 코드로 종료한다.
+
+사용법::
+
+    # 실제 페이지를 코퍼스로 저장 (한 번만)
+    python benchmarks/bench_crawler.py --record urls.txt --corpus corpus/
+
+    python benchmarks/bench_crawler.py --corpus corpus/ --latency-ms 50 --bandwidth-kbps 2000 \\
+        --save-baseline baseline.json
+    python benchmarks/bench_crawler.py --corpus corpus/ --latency-ms 50 --bandwidth-kbps 2000 \\
+        --baseline baseline.json --tolerance 0.2
+"""
+import argparse
+import hashlib
+import http.server
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bench_html_extract import build_fixtures, load_fixtures  # noqa: E402
+from datamood.text.텍스트추출_저장 import Converter_save  # noqa: E402
+
+PHASES = ("fetch", "parse", "extract", "analyze", "end2end")
+
+
+class FixtureServer:
+    """
+    코퍼스를 ``/<이름>`` 경로로 제공하는 로컬 HTTP 서버.
+
+    응답 전에 ``latency_ms`` 만큼 기다리고, ``bandwidth_kbps`` 가 주어지면
+    본문을 나누어 보내며 전송 속도를 제한한다.
+    """
+
+    CHUNK = 16 * 1024
+
+    def __init__(self, pages: dict, latency_ms: float = 0.0, bandwidth_kbps: float = 0.0):
+        self.pages = {name: html.encode("utf-8") for name, html in pages.items()}
+        self.latency = latency_ms / 1000.0
+        self.bytes_per_second = bandwidth_kbps * 1000 / 8 if bandwidth_kbps else 0.0
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # keep-alive 에서 헤더와 본문을 따로 쓰면 Nagle + 지연 ACK 로 응답마다
+            # ~40ms 가 더해져, 측정값이 TCP 지연을 재게 된다
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                body = server.pages.get(self.path.lstrip("/"))
+                if body is None:
+                    self.send_error(404)
+                    return
+                time.sleep(server.latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    if not server.bytes_per_second:
+                        self.wfile.write(body)
+                        return
+                    for start in range(0, len(body), server.CHUNK):
+                        chunk = body[start:start + server.CHUNK]
+                        self.wfile.write(chunk)
+                        time.sleep(len(chunk) / server.bytes_per_second)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}/{name}"
+
+
+def record_corpus(url_file: str, directory: str) -> None:
+    """URL 목록의 페이지를 받아 코퍼스 디렉터리에 .html 로 저장한다."""
+    os.makedirs(directory, exist_ok=True)
+    with open(url_file, encoding="utf-8") as f:
+        urls = f.read().split()
+    for url in urls:
+        try:
+            html = Converter_save.fetch_html(url)
+        except Exception as e:
+            print(f"[skip] {url}: {e}")
+            continue
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12] + ".html"
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"[saved] {url} -> {name}")
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """정렬된 값에서 q 분위수(0~1)를 구한다."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: list, wall_seconds: float) -> dict:
+    """지연 시간 목록(초)과 벽시계 시간으로 처리량/분위수를 계산한다."""
+    values = sorted(v * 1000 for v in latencies)
+    return {
+        "count": len(values),
+        "pages_per_second": round(len(values) / wall_seconds, 2) if wall_seconds else 0.0,
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p90_ms": round(percentile(values, 0.90), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "mean_ms": round(statistics.fmean(values), 3) if values else 0.0,
+    }
+
+
+def run_serial(func, items: list, repeat: int) -> dict:
+    """items 각각에 func 를 repeat 번 실행하고 요약한다."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            t = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - t)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def run_concurrent(func, items: list, repeat: int, concurrency: int) -> dict:
+    """items 를 concurrency 개 스레드로 처리하고 요약한다."""
+    def timed(item):
+        t = time.perf_counter()
+        func(item)
+        return time.perf_counter() - t
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(timed, items * repeat))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def benchmark(pages: dict, args) -> dict:
+    """단계별 벤치마크를 실행하고 {단계: 요약} 을 반환한다."""
+    from bs4 import BeautifulSoup
+
+    names = list(pages)
+    results = {}
+    with FixtureServer(pages, args.latency_ms, args.bandwidth_kbps) as server:
+        urls = [server.url(name) for name in names]
+        results["fetch"] = run_concurrent(Converter_save.fetch_page, urls, args.repeat, args.concurrency)
+
+        htmls = list(pages.values())
+        parser = Converter_save.resolve_parser(args.parser)
+        results["parse"] = run_serial(lambda html: BeautifulSoup(html, parser), htmls, args.repeat)
+        results["extract"] = run_serial(
+            lambda html: Converter_save.extract_article(html, parser=args.parser), htmls, args.repeat
+        )
+
+        if not args.skip_analyze:
+            from datamood.text import EmphaticSentimentAnalyzer
+
+            analyzer = EmphaticSentimentAnalyzer.shared()
+            documents = [Converter_save.extract_article(html, parser=args.parser) for html in htmls]
+            results["analyze"] = run_serial(
+                lambda doc: analyzer.analyze_document(doc["title"], doc["body"], ""),
+                documents,
+                args.repeat,
+            )
+            results["end2end"] = run_concurrent(analyzer.analyze_url, urls, args.repeat, args.concurrency)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """기준값 대비 회귀한 단계 목록을 반환한다."""
+    regressions = []
+    for phase, current in results.items():
+        base = baseline.get(phase)
+        if not base:
+            continue
+        slower = current["p50_ms"] > base["p50_ms"] * (1 + tolerance)
+        lower = current["pages_per_second"] < base["pages_per_second"] * (1 - tolerance)
+        if slower or lower:
+            regressions.append(phase)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기사 수집/분석 오프라인 벤치마크")
+    parser.add_argument("--corpus", help="코퍼스 .html 디렉터리 (합성 픽스처에 추가)")
+    parser.add_argument("--record", metavar="URL_FILE",
+                        help="URL 목록의 페이지를 --corpus 디렉터리에 저장하고 종료")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="응답 지연(ms) (기본: 20)")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0,
+                        help="연결당 전송 속도 제한(kbit/s), 0 이면 제한 없음 (기본: 0)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="fetch/end2end 동시 요청 수 (기본: 8)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본: 3)")
+    parser.add_argument("--parser", default=None, help="HTML 파서 (기본: Converter_save.PARSER)")
+    parser.add_argument("--skip-analyze", action="store_true",
+                        help="analyze/end2end 단계 생략 (형태소 분석기 없이 실행)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", help="결과를 기준값 JSON 으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="회귀 판정 허용 비율 (기본: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.corpus:
+            parser.error("--record 에는 --corpus 디렉터리가 필요합니다.")
+        record_corpus(args.record, args.corpus)
+        return
+
+    pages = build_fixtures()
+    if args.corpus:
+        pages.update(load_fixtures(args.corpus))
+
+    results = benchmark(pages, args)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+
+    print(f"pages={len(pages)} latency={args.latency_ms}ms bandwidth={args.bandwidth_kbps or '-'}kbps "
+          f"concurrency={args.concurrency} repeat={args.repeat}")
+    print(f"{'phase':<10}{'pages/s':>10}{'p50':>10}{'p90':>10}{'p99':>10}  vs baseline")
+    for phase in PHASES:
+        if phase not in results:
+            continue
+        r = results[phase]
+        note = ""
+        if phase in baseline:
+            base = baseline[phase]
+            note = (f"{r['pages_per_second'] / base['pages_per_second']:.2f}x pages/s, "
+                    f"p50 {r['p50_ms'] / base['p50_ms']:.2f}x"
+                    if base["pages_per_second"] and base["p50_ms"] else "")
+            note += "  REGRESSION" if phase in regressions else "  OK"
+        print(f"{phase:<10}{r['pages_per_second']:>10.1f}{r['p50_ms']:>8.2f}ms"
+              f"{r['p90_ms']:>8.2f}ms{r['p99_ms']:>8.2f}ms  {note}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": {
+                    "pages": len(pages),
+                    "latency_ms": args.latency_ms,
+                    "bandwidth_kbps": args.bandwidth_kbps,
+                    "concurrency": args.concurrency,
+                    "repeat": args.repeat,
+                },
+                "results": results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.save_baseline}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
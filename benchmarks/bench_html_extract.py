@@ -0,0 +1,223 @@
+# benchmarks/bench_html_extract.py
+"""
+HTML 본문 추출 벤치마크
+=======================
+
+기존 다중 패스 추출기(패턴마다 ``find_all`` 두 번, 셀렉터마다 ``find`` 한 번)와
+단일 패스 추출기(:meth:`Converter_save.extract_from_html`)의 결과가 같은지
+확인하고, 문서당 처리 시간을 파서별로 비교한다.
+
+픽스처는 네이버 블로그, 일반 뉴스(article_body), 셀렉터가 없는 페이지,
+'ad' 부분 문자열이 들어간 class/id, 깊게 중첩된 광고 블록, 큰 페이지 등을
+합성해 만들며, ``--fixtures DIR`` 로 저장해 둔 실제 ``.html`` 파일을 추가할 수 있다.
+결과가 하나라도 다르면 0 이 아닌 코드로 종료한다.
+
+사용법::
+
+    python benchmarks/bench_html_extract.py --repeat 20
+    python benchmarks/bench_html_extract.py --fixtures saved_pages/ --parser html.parser --parser lxml
+"""
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from datamood.text.텍스트추출_저장 import Converter_save  # noqa: E402
+
+
+def legacy_extract(html: str, parser: str = "html.parser") -> tuple:
+    """기존 추출기 구현 (비교 기준)."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, parser)
+
+    title_tag = soup.find('h1')
+    title = title_tag.get_text(strip=True) if title_tag else "제목을 찾을 수 없습니다"
+
+    unwanted_patterns = [
+        'ad', 'banner', 'share', 'sns', 'footer', 'copyright',
+        'related', 'aside', 'caption', 'byline', 'journalist'
+    ]
+    for pattern in unwanted_patterns:
+        for tag in soup.find_all(lambda tag: tag.has_attr('class') and any(pattern in c.lower() for c in tag['class'])):
+            tag.extract()
+        for tag in soup.find_all(lambda tag: tag.has_attr('id') and pattern in tag['id'].lower()):
+            tag.extract()
+    for tag_name in ['script', 'style', 'img', 'iframe', 'button', 'a']:
+        for tag in soup.find_all(tag_name):
+            tag.extract()
+
+    selectors = [
+        {"class": "se-main-container"},
+        {"class": "se_doc_viewer"},
+        {"id": "article_content"},
+        {"class": "article_body"},
+        {"class": "article_content"},
+        {"name": "div", "attrs": {"id": lambda x: x and "article" in x.lower()}},
+        {"name": "div", "attrs": {"class": lambda x: x and "article" in x.lower()}},
+    ]
+    article_text = None
+    for sel in selectors:
+        if 'name' in sel:
+            article_div = soup.find(sel['name'], **sel['attrs'])
+        else:
+            article_div = soup.find("div", **sel)
+        if article_div:
+            article_text = article_div.get_text("\n", strip=True)
+            break
+
+    if not article_text:
+        article_text = soup.get_text("\n")
+
+    result_lines = []
+    cleaned_text = re.sub(r'\n+', '\n', article_text).strip()
+    forbidden_patterns = ["저작권", "ⓒ", "@", "무단전재", "배포금지"]
+    for line in cleaned_text.split("\n"):
+        line = line.strip()
+        if len(line) > 5 and not any(pattern in line for pattern in forbidden_patterns):
+            if len(line.split()) == 0 or len(line) / len(line.split()) > 3:
+                result_lines.append(line)
+    return title, "\n".join(result_lines)
+
+
+PARAGRAPH = "오늘 발표된 정책은 시민들에게 큰 기대를 안겨 주었다. 많은 사람들이 긍정적인 반응을 보였다."
+
+
+def _paragraphs(n: int) -> str:
+    return "\n".join(f"<p>{i}번째 문단입니다. {PARAGRAPH}</p>" for i in range(n))
+
+
+def _page(body: str, title: str = "테스트 기사 제목") -> str:
+    return (
+        "<html><head><title>t</title><style>.x{color:red}</style>"
+        "<script>var a = 1;</script></head><body>"
+        f"<div class='header'><h1>{title}</h1><a href='/'>홈으로 가기 링크</a></div>"
+        f"{body}"
+        "<div class='footer'>회사 소개 및 이용 약관 안내</div>"
+        "<div id='copyright'>ⓒ 무단전재 및 재배포 금지</div>"
+        "</body></html>"
+    )
+
+
+def build_fixtures() -> dict:
+    """합성 픽스처 {이름: html} 을 만든다."""
+    ads = (
+        "<div class='ad_area'>광고 영역 텍스트입니다</div>"
+        "<div class='Banner-Top'><span>배너 광고 문구입니다</span></div>"
+        "<ul class='sns_share'><li><button>공유하기 버튼</button></li></ul>"
+        "<div id='relatedNews'>관련 기사 목록이 여기에 표시됩니다</div>"
+        "<figure><img src='x.png'><figcaption class='img_caption'>사진 설명 캡션입니다</figcaption></figure>"
+    )
+    fixtures = {
+        "naver_blog": _page(
+            "<div class='se_doc_viewer'><p>예전 편집기 본문이 여기에 있습니다</p></div>"
+            f"<div class='se-main-container'>{ads}{_paragraphs(20)}</div>"
+        ),
+        "news_article_body": _page(
+            f"<div id='article_content_wrap'><div class='article_body'>{ads}{_paragraphs(30)}"
+            "<p class='byline'>홍길동 기자 hong@example.com</p></div></div>"
+        ),
+        "news_id_article_content": _page(
+            f"<div class='article_content'>보조 본문 영역의 문장입니다</div>"
+            f"<div id='article_content'>{_paragraphs(15)}{ads}</div>"
+        ),
+        "article_contains_id": _page(
+            f"<div id='newsArticleText'>{_paragraphs(10)}</div>"
+            f"<div class='MainArticle'>{_paragraphs(3)}</div>"
+        ),
+        "article_contains_class": _page(
+            f"<section><div class='view_Article_Wrap extra'>{_paragraphs(12)}{ads}</div></section>"
+        ),
+        "fallback_no_selector": _page(
+            f"<main><section>{_paragraphs(8)}</section>{ads}"
+            "<p>짧음</p><p>a b c d e f g h</p><p>연락처 문의 help@example.com 으로</p></main>"
+        ),
+        # 'ad' 부분 문자열이 본문 컨테이너를 통째로 지우는 경우 (head, loading, shadow ...)
+        "aggressive_ad_substring": _page(
+            f"<div class='content-head'>머리말 영역의 문장입니다</div>"
+            f"<div class='article_body loading'>{_paragraphs(5)}</div>"
+            f"<div id='article_main'><div class='shadow-box'>{_paragraphs(4)}</div>{_paragraphs(6)}</div>"
+        ),
+        "no_title_empty_article": (
+            "<html><body><div class='article_body'></div>"
+            f"<div id='story'>{_paragraphs(6)}</div></body></html>"
+        ),
+        "deeply_nested": _page(
+            "<div class='article_body'>"
+            + "".join(f"<div class='level{i}'>" for i in range(60))
+            + _paragraphs(10) + ads
+            + "</div>" * 60
+            + "</div>"
+        ),
+        "large_page": _page(
+            "".join(
+                f"<div class='block{i}'><div class='ad-slot-{i}'>광고 {i} 문구입니다</div>"
+                f"<a href='#{i}'>링크 {i} 텍스트</a>{_paragraphs(3)}</div>"
+                for i in range(300)
+            )
+            + f"<div class='article_body'>{_paragraphs(80)}{ads * 20}</div>"
+        ),
+    }
+    return fixtures
+
+
+def load_fixtures(directory: str) -> dict:
+    """디렉터리의 .html/.htm 파일을 {파일명: html} 로 읽는다."""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.htm*"))):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+
+def time_call(func, html: str, parser: str, repeat: int) -> float:
+    """func(html, parser) 의 중앙값 실행 시간(ms)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html, parser)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML 본문 추출 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (기본: 10)")
+    parser.add_argument("--fixtures", help="추가로 비교할 .html 파일 디렉터리")
+    parser.add_argument("--parser", action="append", dest="parsers",
+                        help="비교할 파서 (여러 번 지정 가능, 기본: html.parser 와 설치되어 있으면 lxml)")
+    args = parser.parse_args()
+
+    parsers = args.parsers or ["html.parser"] + (["lxml"] if Converter_save.resolve_parser("auto") == "lxml" else [])
+    fixtures = build_fixtures()
+    if args.fixtures:
+        fixtures.update(load_fixtures(args.fixtures))
+
+    failed = False
+    for name in parsers:
+        print(f"\n[{name}]")
+        print(f"{'fixture':<28}{'legacy':>10}{'single':>10}{'speedup':>9}  result")
+        total_legacy = total_single = 0.0
+        for fixture, html in fixtures.items():
+            expected = legacy_extract(html, name)
+            actual = Converter_save.extract_from_html(html, parser=name)
+            same = expected == actual
+            failed |= not same
+            legacy_ms = time_call(legacy_extract, html, name, args.repeat)
+            single_ms = time_call(lambda h, p: Converter_save.extract_from_html(h, parser=p), html, name, args.repeat)
+            total_legacy += legacy_ms
+            total_single += single_ms
+            print(f"{fixture:<28}{legacy_ms:>8.2f}ms{single_ms:>8.2f}ms{legacy_ms / single_ms:>8.1f}x  "
+                  f"{'same' if same else 'DIFFERENT'}")
+        print(f"{'(total)':<28}{total_legacy:>8.2f}ms{total_single:>8.2f}ms{total_legacy / total_single:>8.1f}x")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_import.py
+"""
+import 시간 벤치마크
+====================
+
+새 인터프리터에서 ``import datamood`` 와 ``datamood --help`` 의 벽시계 시간을
+반복 측정하고, ``import datamood`` 직후 무거운 의존성이 로드되지 않았는지 확인한다.
+중앙값이 기준값을 넘거나 무거운 모듈이 로드되면 0 이 아닌 코드로 종료하므로
+CI 의 회귀 검사로 사용할 수 있다.
+
+사용법::
+
+    python benchmarks/bench_import.py --repeat 10 --max-import-ms 150 --max-help-ms 300
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# import datamood 시점에 로드되면 안 되는 모듈
+HEAVY_MODULES = ("yt_dlp", "pydub", "speech_recognition", "konlpy", "bs4", "requests", "numpy")
+
+CASES = {
+    "import datamood": "import datamood",
+    "datamood --help": (
+        "import sys; sys.argv = ['datamood', '--help']\n"
+        "from datamood.cli import main\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass"
+    ),
+}
+
+
+def time_snippet(code: str, repeat: int) -> list:
+    """새 인터프리터에서 code 를 repeat 번 실행하고 각 실행 시간(ms)을 반환한다."""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def loaded_heavy_modules() -> list:
+    """import datamood 직후 sys.modules 에 올라온 무거운 모듈 목록을 반환한다."""
+    code = (
+        "import sys, datamood\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="datamood import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (기본: 10)")
+    parser.add_argument("--max-import-ms", type=float, default=150.0,
+                        help="import datamood 중앙값 기준(ms) (기본: 150)")
+    parser.add_argument("--max-help-ms", type=float, default=300.0,
+                        help="datamood --help 중앙값 기준(ms) (기본: 300)")
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_snippet("pass", args.repeat))
+    limits = {"import datamood": args.max_import_ms, "datamood --help": args.max_help_ms}
+
+    failed = False
+    print(f"{'case':<18}{'median':>10}{'p90':>10}{'limit':>10}")
+    print(f"{'(interpreter)':<18}{baseline:>8.1f}ms")
+    for name, code in CASES.items():
+        timings = sorted(time_snippet(code, args.repeat))
+        median = statistics.median(timings)
+        p90 = timings[min(len(timings) - 1, int(len(timings) * 0.9))]
+        ok = median <= limits[name]
+        failed |= not ok
+        print(f"{name:<18}{median:>8.1f}ms{p90:>8.1f}ms{limits[name]:>8.0f}ms  {'OK' if ok else 'SLOW'}")
+
+    heavy = loaded_heavy_modules()
+    if heavy:
+        failed = True
+        print(f"\nimport datamood 시점에 로드된 무거운 모듈: {', '.join(heavy)}")
+    else:
+        print("\nimport datamood 시점에 로드된 무거운 모듈 없음")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_youtube_decode.py
+"""
+YouTube 오디오 변환 경로 벤치마크
+=================================
+
+다운로드된 원본 오디오 스트림(webm/m4a 등) 하나를 입력으로
+기존 경로와 단일 패스 경로의 벽시계 시간과 디스크 기록량을 비교한다.
+
+- legacy : FFmpeg → MP3(192kbps) 재인코딩 → pydub 로 MP3 디코딩 → WAV 저장
+- single : FFmpeg 로 16kHz 모노 PCM 한 번 디코딩 (파일 기록 없음)
+- single+wav : 위 PCM 을 재인코딩 없이 WAV 로 저장 (download_and_convert 경로)
+
+사용법::
+
+    python benchmarks/bench_youtube_decode.py downloaded.webm --repeat 3
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from datamood.audio.ffmpeg_io import decode_to_pcm, ffmpeg_executable, write_wav  # noqa: E402
+
+
+def run_legacy(source: str, workdir: str) -> int:
+    """기존 MP3 재인코딩 경로를 재현하고, 기록한 바이트 수를 반환한다."""
+    from pydub import AudioSegment
+
+    mp3_path = os.path.join(workdir, "temp_audio.mp3")
+    wav_path = os.path.join(workdir, "output_recognition.wav")
+    subprocess.run(
+        [ffmpeg_executable(), "-nostdin", "-loglevel", "error", "-y", "-i", source,
+         "-vn", "-codec:a", "libmp3lame", "-b:a", "192k", mp3_path],
+        check=True,
+    )
+    audio = AudioSegment.from_file(mp3_path, format="mp3")
+    audio.set_channels(1).set_frame_rate(16000).export(wav_path, format="wav")
+    return os.path.getsize(mp3_path) + os.path.getsize(wav_path)
+
+
+def run_single(source: str, workdir: str) -> int:
+    """단일 패스 PCM 디코딩. 디스크에는 아무것도 기록하지 않는다."""
+    decode_to_pcm(source)
+    return 0
+
+
+def run_single_wav(source: str, workdir: str) -> int:
+    """단일 패스 디코딩 후 WAV 저장."""
+    return write_wav(os.path.join(workdir, "output_recognition.wav"), decode_to_pcm(source))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YouTube 오디오 변환 경로 벤치마크")
+    parser.add_argument("source", help="다운로드된 원본 오디오 파일 (webm/m4a/opus ...)")
+    parser.add_argument("--repeat", type=int, default=3, help="경로별 반복 횟수 (기본: 3)")
+    args = parser.parse_args()
+
+    cases = [("legacy", run_legacy), ("single", run_single), ("single+wav", run_single_wav)]
+    print(f"{'path':<12} {'best(s)':>9} {'mean(s)':>9} {'written(MB)':>12}")
+    for name, func in cases:
+        timings = []
+        written = 0
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix="datamood_bench_") as workdir:
+                started = time.perf_counter()
+                written = func(args.source, workdir)
+                timings.append(time.perf_counter() - started)
+        print(
+            f"{name:<12} {min(timings):>9.3f} {sum(timings) / len(timings):>9.3f} "
+            f"{written / 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# benchmarks/bench_youtube_pipeline.py
+"""
+YouTube 일괄 분석 파이프라인 오프라인 벤치마크
+=============================================
+
+네트워크/Google STT 없이 파이프라인의 단계 겹침 효과를 측정한다.
+
+- FixtureExtractor : ``fixture://playlist/<N>`` 을 N 개의 영상 URL 로 펼치고,
+  영상마다 다운로드 지연을 흉내 낸 뒤 합성 PCM(발화 + 무음)을 돌려준다.
+- FixtureRecognizer : 오디오 길이에 비례해 대기한 뒤 고정 문장을 돌려주는 STT 대역.
+- FixtureAnalyzer : JVM 없이 동작하는 감정 분석 대역 (``--real-analyzer`` 로 실제 분석기 사용).
+
+사용법::
+
+    python benchmarks/bench_youtube_pipeline.py --videos 24 --download-workers 4 --stt-workers 2
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from datamood.audio import AudioPreprocessor  # noqa: E402
+from datamood.youtube_pipeline import YouTubeBatchPipeline  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+
+class FixtureExtractor:
+    """재생목록 펼치기와 오디오 다운로드를 흉내 내는 로컬 추출기."""
+
+    def __init__(self, download_latency: float, audio_seconds: float):
+        self.download_latency = download_latency
+        self.audio_seconds = audio_seconds
+
+    def expand(self, url):
+        if url.startswith("fixture://playlist/"):
+            n = int(url.rsplit("/", 1)[1])
+            for i in range(n):
+                yield f"fixture://video/{i}"
+        else:
+            yield url
+
+    def fetch_pcm(self, url):
+        time.sleep(self.download_latency)
+        n = int(SAMPLE_RATE * self.audio_seconds)
+        t = np.arange(n) / SAMPLE_RATE
+        # 앞 절반은 발화(톤), 뒤 절반은 무음
+        signal = np.where(t < self.audio_seconds / 2, 0.3 * np.sin(2 * np.pi * 220 * t), 0.0)
+        return (signal * 32767).astype("<i2").tobytes()
+
+
+class FixtureRecognizer:
+    """오디오 1초당 ``seconds_per_audio_second`` 만큼 대기하는 STT 대역."""
+
+    def __init__(self, seconds_per_audio_second: float):
+        self.seconds_per_audio_second = seconds_per_audio_second
+
+    def recognize_google(self, audio_data, language=None):
+        duration = len(audio_data.frame_data) / (audio_data.sample_rate * audio_data.sample_width)
+        time.sleep(duration * self.seconds_per_audio_second)
+        return "오늘 영상 정말 좋았어요"
+
+
+class FixtureAnalyzer:
+    """JVM 없이 동작하는 감정 분석 대역."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def analyze(self, text):
+        time.sleep(self.latency)
+        return {"text": text, "label": "긍정적", "score": 1.0, "percentage": 60.0}
+
+
+def run(sorter, extractor, videos, download_workers, stt_workers, queue_size):
+    pipeline = YouTubeBatchPipeline(
+        sorter,
+        extractor=extractor,
+        download_workers=download_workers,
+        stt_workers=stt_workers,
+        queue_size=queue_size,
+    )
+    started = time.perf_counter()
+    first = None
+    count = 0
+    for result in pipeline.run([f"fixture://playlist/{videos}"]):
+        if first is None:
+            first = time.perf_counter() - started
+        count += 1
+    total = time.perf_counter() - started
+    return count, first, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YouTube 일괄 분석 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--videos", type=int, default=24)
+    parser.add_argument("--audio-seconds", type=float, default=20.0)
+    parser.add_argument("--download-latency", type=float, default=0.3)
+    parser.add_argument("--stt-factor", type=float, default=0.02, help="오디오 1초당 STT 대기 시간(초)")
+    parser.add_argument("--sentiment-latency", type=float, default=0.02)
+    parser.add_argument("--download-workers", type=int, default=4)
+    parser.add_argument("--stt-workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=4)
+    parser.add_argument("--real-analyzer", action="store_true", help="실제 EmphaticSentimentAnalyzer 사용")
+    args = parser.parse_args()
+
+    preprocessor = AudioPreprocessor()
+    preprocessor.recognizer = FixtureRecognizer(args.stt_factor)
+    if args.real_analyzer:
+        from datamood.text import EmphaticSentimentAnalyzer
+
+        analyzer = EmphaticSentimentAnalyzer()
+    else:
+        analyzer = FixtureAnalyzer(args.sentiment_latency)
+    sorter = SimpleNamespace(audio_preprocessor=preprocessor, text_analyzer=analyzer)
+    extractor = FixtureExtractor(args.download_latency, args.audio_seconds)
+
+    print(f"{'mode':<12} {'videos':>7} {'first(s)':>9} {'total(s)':>9} {'videos/s':>9}")
+    for mode, dl, stt, qs in (
+        ("sequential", 1, 1, 1),
+        ("pipelined", args.download_workers, args.stt_workers, args.queue_size),
+    ):
+        count, first, total = run(sorter, extractor, args.videos, dl, stt, qs)
+        print(f"{mode:<12} {count:>7} {first:>9.2f} {total:>9.2f} {count / total:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,49 @@
-from .audio import AudioPreprocessor
-from .text import EmphaticSentimentAnalyzer
-from .mood_sorter import MoodSorter
-from .utils import get_file_type, build_output_path, move_or_copy
+import importlib
+from typing import TYPE_CHECKING
+
+# 무거운 의존성(yt_dlp, pydub, speech_recognition, konlpy, bs4, requests)은
+# 실제로 사용하는 시점에만 로드되도록 공개 이름을 지연 import 한다.
+_EXPORTS = {
+    "AudioPreprocessor": ".audio",
+    "EmphaticSentimentAnalyzer": ".text",
+    "MoodSorter": ".mood_sorter",
+    "SortManifest": ".manifest",
+    "LabelIndex": ".label_index",
+    "get_file_type": ".utils",
+    "build_output_path": ".utils",
+    "move_or_copy": ".utils",
+    "close_shared": ".registry",
+}
+
+if TYPE_CHECKING:
+    from .audio import AudioPreprocessor
+    from .text import EmphaticSentimentAnalyzer
+    from .mood_sorter import MoodSorter
+    from .manifest import SortManifest
+    from .label_index import LabelIndex
+    from .utils import get_file_type, build_output_path, move_or_copy
+    from .registry import close_shared
 
 __all__ = [
     "AudioPreprocessor",
     "EmphaticSentimentAnalyzer",
     "MoodSorter",
+    "SortManifest",
+    "LabelIndex",
     "get_file_type",
     "build_output_path",
     "move_or_copy",
+    "close_shared",
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,30 @@
 # datamood/audio/__init__.py
+import importlib
+from typing import TYPE_CHECKING
 
-from .audio_mood import AudioPreprocessor, YouTubeDownloader
+# 하위 모듈은 처음 접근할 때 로드한다 (speech_recognition, numpy 등 지연 로딩)
+_EXPORTS = {
+    "AudioPreprocessor": ".audio_mood",
+    "YouTubeDownloader": ".audio_mood",
+    "TranscriptCache": ".transcript_cache",
+    "AcousticMoodEstimator": ".acoustic",
+}
 
-__all__ = ["AudioPreprocessor", "YouTubeDownloader"]
+if TYPE_CHECKING:
+    from .audio_mood import AudioPreprocessor, YouTubeDownloader
+    from .transcript_cache import TranscriptCache
+    from .acoustic import AcousticMoodEstimator
+
+__all__ = ["AudioPreprocessor", "YouTubeDownloader", "TranscriptCache", "AcousticMoodEstimator"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,382 @@
+# datamood/audio/acoustic.py
+import time
+import wave
+from typing import Optional
+
+import numpy as np
+
+from .vad import frame_features, read_wav_pcm, speech_frame_mask
+
+"""
+datamood.audio.acoustic
+-----------------------
+음성 인식 없이 음향 특징만으로 감정을 빠르게 추정하는 모듈
+
+NumPy 벡터 연산으로 RMS 에너지, 피치(F0), 스펙트럼 무게중심, 템포, 휴지 비율을
+계산하고, 이를 각성도(arousal)/정서가(valence) 2차원 모델에 넣어 레이블을 정합니다.
+음성이 없거나 인식할 수 없는 언어의 클립도 레이블을 붙일 수 있고, STT 를
+실행할 가치가 있는지 미리 판단하는 프리스크린으로도 사용할 수 있습니다.
+
+주요 함수/클래스
+- extract_acoustic_features(samples, sample_rate): 음향 특징 딕셔너리 계산
+- estimate_mood(features): 특징 → 각성도/정서가/레이블
+- AcousticMoodEstimator: 파일/샘플 단위 추정기 (프리스크린 / 폴백 용)
+"""
+
+# 피치 탐색 범위 (Hz)
+_PITCH_MIN_HZ = 60.0
+_PITCH_MAX_HZ = 400.0
+# 자기상관 최대값 대비 이 비율 이상이어야 유성음 프레임으로 본다
+_VOICING_THRESHOLD = 0.3
+# 템포 탐색 범위 (BPM)
+_TEMPO_MIN_BPM = 40.0
+_TEMPO_MAX_BPM = 240.0
+# 온셋 포락선 프레임 길이 (ms)
+_ONSET_FRAME_MS = 10.0
+
+
+def _frames(samples: np.ndarray, frame_len: int) -> np.ndarray:
+    """샘플 배열을 겹치지 않는 (프레임 수, frame_len) float32 배열로 나눈다."""
+    n_frames = len(samples) // frame_len
+    return samples[: n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float32)
+
+
+def _scale(value: float, low: float, high: float) -> float:
+    """value 를 [low, high] 구간 기준으로 [-1, 1] 에 선형 사상한다 (범위 밖은 잘라냄)."""
+    if value is None:
+        return 0.0
+    return float(np.clip(2.0 * (value - low) / (high - low) - 1.0, -1.0, 1.0))
+
+
+def _pitch_and_centroid(frames: np.ndarray, sample_rate: int):
+    """
+    프레임별 피치(Hz, 무성음은 NaN)와 스펙트럼 무게중심(Hz)을 한 번의 FFT 로 계산한다.
+    """
+    n_frames, frame_len = frames.shape
+    window = np.hanning(frame_len).astype(np.float32)
+    windowed = (frames - frames.mean(axis=1, keepdims=True)) * window
+
+    n_fft = 1 << int(np.ceil(np.log2(2 * frame_len)))
+    spectrum = np.fft.rfft(windowed, n=n_fft, axis=1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+
+    # 스펙트럼 무게중심
+    magnitude = np.sqrt(power)
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    mag_sum = magnitude.sum(axis=1)
+    centroid = (magnitude @ freqs) / np.maximum(mag_sum, 1e-10)
+
+    # Wiener–Khinchin: 파워 스펙트럼의 역변환 = 자기상관
+    autocorr = np.fft.irfft(power, n=n_fft, axis=1)[:, :frame_len]
+    min_lag = max(1, int(sample_rate / _PITCH_MAX_HZ))
+    max_lag = min(frame_len - 1, int(sample_rate / _PITCH_MIN_HZ))
+    pitch = np.full(n_frames, np.nan)
+    if max_lag <= min_lag:
+        return pitch, centroid
+
+    search = autocorr[:, min_lag:max_lag + 1]
+    best = np.argmax(search, axis=1)
+    peak = search[np.arange(n_frames), best]
+    voiced = peak > _VOICING_THRESHOLD * np.maximum(autocorr[:, 0], 1e-10)
+    pitch[voiced] = sample_rate / (best[voiced] + min_lag)
+    return pitch, centroid
+
+
+def _tempo_and_onset_rate(samples: np.ndarray, sample_rate: int):
+    """
+    10ms 에너지 포락선의 양의 변화량(온셋 강도)으로 템포(BPM)와 초당 온셋 수를 추정한다.
+    """
+    frame_len = max(1, int(sample_rate * _ONSET_FRAME_MS / 1000))
+    frames = _frames(samples, frame_len)
+    if len(frames) < 4:
+        return None, 0.0
+
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_len)
+    log_env = np.log1p(rms)
+    onset = np.maximum(np.diff(log_env), 0.0)
+    if not onset.any():
+        return None, 0.0
+
+    # 초당 온셋 수: 평균 + 1 표준편차를 넘는 국소 최대값
+    threshold = onset.mean() + onset.std()
+    peaks = (onset[1:-1] > threshold) & (onset[1:-1] >= onset[:-2]) & (onset[1:-1] > onset[2:])
+    duration = len(samples) / sample_rate
+    onset_rate = float(np.count_nonzero(peaks) / duration) if duration else 0.0
+
+    # 온셋 포락선의 자기상관에서 템포 주기 탐색
+    centered = onset - onset.mean()
+    n_fft = 1 << int(np.ceil(np.log2(2 * len(centered))))
+    spec = np.fft.rfft(centered, n=n_fft)
+    autocorr = np.fft.irfft(spec.real ** 2 + spec.imag ** 2, n=n_fft)[: len(centered)]
+
+    frame_sec = frame_len / sample_rate
+    min_lag = max(1, int(round(60.0 / _TEMPO_MAX_BPM / frame_sec)))
+    max_lag = min(len(autocorr) - 1, int(round(60.0 / _TEMPO_MIN_BPM / frame_sec)))
+    if max_lag <= min_lag or autocorr[0] <= 0:
+        return None, onset_rate
+
+    lag = min_lag + int(np.argmax(autocorr[min_lag:max_lag + 1]))
+    return float(60.0 / (lag * frame_sec)), onset_rate
+
+
+def extract_acoustic_features(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: float = 40.0,
+) -> dict:
+    """
+    int16 모노 PCM 샘플에서 감정 추정용 음향 특징을 계산합니다.
+
+    모든 계산은 프레임 배열에 대한 NumPy 벡터 연산으로 처리하며, 피치와
+    스펙트럼 무게중심은 프레임당 한 번의 FFT 결과를 공유합니다.
+
+    Parameters
+    ----------
+    samples : numpy.ndarray
+        int16 모노 PCM 샘플 배열.
+    sample_rate : int
+        샘플링 레이트(Hz).
+    frame_ms : float, optional
+        분석 프레임 길이(밀리초). 피치 탐색을 위해 최소 30ms 이상이어야 합니다.
+        기본값은 40ms.
+
+    Returns
+    -------
+    dict
+        다음 키를 포함하는 딕셔너리. 발화가 없으면 피치 관련 값은 ``None``.
+
+        - duration_seconds: 전체 길이(초)
+        - speech_seconds: 발화 프레임 길이 합(초)
+        - pause_ratio: 발화가 아닌 프레임 비율 (0~1)
+        - rms_db: 발화 프레임 평균 RMS 에너지(dBFS)
+        - rms_db_std: 발화 프레임 RMS 에너지 표준편차(dB)
+        - pitch_hz: 유성음 프레임 피치 중앙값(Hz)
+        - pitch_std_semitones: 피치 변동폭(반음 단위 표준편차)
+        - spectral_centroid_hz: 발화 프레임 평균 스펙트럼 무게중심(Hz)
+        - tempo_bpm: 온셋 포락선 기반 템포(BPM)
+        - onset_rate: 초당 온셋(음절 근사) 수
+    """
+    duration = len(samples) / sample_rate if sample_rate else 0.0
+    features = {
+        "duration_seconds": round(duration, 3),
+        "speech_seconds": 0.0,
+        "pause_ratio": 1.0,
+        "rms_db": None,
+        "rms_db_std": None,
+        "pitch_hz": None,
+        "pitch_std_semitones": None,
+        "spectral_centroid_hz": None,
+        "tempo_bpm": None,
+        "onset_rate": 0.0,
+    }
+
+    energy_db, zcr = frame_features(samples, sample_rate, frame_ms)
+    if energy_db.size == 0:
+        return features
+
+    is_speech = speech_frame_mask(energy_db, zcr)
+    frame_sec = frame_ms / 1000.0
+    features["speech_seconds"] = round(float(np.count_nonzero(is_speech) * frame_sec), 3)
+    features["pause_ratio"] = round(1.0 - float(is_speech.mean()), 4)
+    if not is_speech.any():
+        return features
+
+    speech_energy = energy_db[is_speech]
+    features["rms_db"] = round(float(speech_energy.mean()), 2)
+    features["rms_db_std"] = round(float(speech_energy.std()), 2)
+
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    speech_frames = _frames(samples, frame_len)[is_speech]
+    pitch, centroid = _pitch_and_centroid(speech_frames, sample_rate)
+    features["spectral_centroid_hz"] = round(float(centroid.mean()), 1)
+
+    voiced = pitch[~np.isnan(pitch)]
+    if voiced.size:
+        median = float(np.median(voiced))
+        semitones = 12.0 * np.log2(voiced / median)
+        features["pitch_hz"] = round(median, 1)
+        features["pitch_std_semitones"] = round(float(semitones.std()), 2)
+
+    tempo, onset_rate = _tempo_and_onset_rate(samples, sample_rate)
+    features["tempo_bpm"] = round(tempo, 1) if tempo is not None else None
+    features["onset_rate"] = round(onset_rate, 2)
+    return features
+
+
+def estimate_mood(features: dict) -> dict:
+    """
+    음향 특징으로 각성도(arousal)/정서가(valence)를 계산하고 감정 레이블을 정합니다.
+
+    각 특징을 음성 감정 연구에서 흔히 쓰는 범위로 [-1, 1] 에 정규화한 뒤
+    가중합합니다. 각성도는 에너지·말 빠르기·피치 변동·밝기가 클수록,
+    휴지가 적을수록 높아집니다. 정서가는 피치 변동과 높이, 말 빠르기가 클수록
+    높고, 휴지가 많거나 지나치게 큰 목소리(분노 등)일수록 낮아집니다.
+
+    Parameters
+    ----------
+    features : dict
+        :func:`extract_acoustic_features` 의 결과.
+
+    Returns
+    -------
+    dict
+        다음 키를 포함하는 딕셔너리.
+
+        - arousal: 각성도 (-1~1)
+        - valence: 정서가 (-1~1)
+        - mood: 2차원 사분면 이름 ("활기참", "긴장/분노", "차분함", "우울함", "무음")
+        - label: 감정 레이블 ("긍정적", "부정적", "중립적")
+        - confidence: 추정 신뢰도 (0~1, 발화 길이와 정서가 크기에 비례)
+    """
+    if features.get("rms_db") is None:
+        return {"arousal": 0.0, "valence": 0.0, "mood": "무음", "label": "중립적", "confidence": 0.0}
+
+    energy = _scale(features["rms_db"], -40.0, -10.0)
+    pitch_var = _scale(features["pitch_std_semitones"], 0.5, 5.0)
+    pitch_height = _scale(features["pitch_hz"], 100.0, 250.0)
+    brightness = _scale(features["spectral_centroid_hz"], 500.0, 3000.0)
+    rate = _scale(features["onset_rate"], 1.0, 6.0)
+    fluency = -_scale(features["pause_ratio"], 0.1, 0.6)
+
+    arousal = 0.3 * energy + 0.2 * pitch_var + 0.15 * brightness + 0.2 * rate + 0.15 * fluency
+    valence = (
+        0.35 * pitch_var
+        + 0.2 * pitch_height
+        + 0.25 * rate
+        + 0.2 * fluency
+        - 0.5 * max(0.0, energy - 0.6)
+    )
+    arousal = float(np.clip(arousal, -1.0, 1.0))
+    valence = float(np.clip(valence, -1.0, 1.0))
+
+    if arousal >= 0:
+        mood = "활기참" if valence >= 0 else "긴장/분노"
+    else:
+        mood = "차분함" if valence >= 0 else "우울함"
+
+    if valence >= 0.2:
+        label = "긍정적"
+    elif valence <= -0.2:
+        label = "부정적"
+    else:
+        label = "중립적"
+
+    coverage = min(1.0, features["speech_seconds"] / 5.0)
+    return {
+        "arousal": round(arousal, 3),
+        "valence": round(valence, 3),
+        "mood": mood,
+        "label": label,
+        "confidence": round(coverage * min(1.0, abs(valence) * 2.0), 3),
+    }
+
+
+class AcousticMoodEstimator:
+    """
+    음성 인식 없이 음향 특징만으로 오디오의 감정을 추정하는 클래스.
+
+    수 밀리초 안에 결과를 내므로, STT 전에 발화가 충분한지 판단하는
+    프리스크린이나 STT 실패 시의 폴백 레이블로 사용할 수 있습니다.
+
+    Parameters
+    ----------
+    min_speech_seconds : float, optional
+        STT 를 실행할 가치가 있다고 판단할 최소 발화 길이(초). 기본값은 1초.
+    min_speech_ratio : float, optional
+        STT 를 실행할 가치가 있다고 판단할 최소 발화 비율. 기본값은 0.1.
+
+    Examples
+    --------
+    >>> estimator = AcousticMoodEstimator()
+    >>> result = estimator.analyze_file("clip.wav")
+    >>> result["label"], result["should_transcribe"]
+    ('중립적', False)
+    """
+
+    def __init__(self, min_speech_seconds: float = 1.0, min_speech_ratio: float = 0.1):
+        self.min_speech_seconds = min_speech_seconds
+        self.min_speech_ratio = min_speech_ratio
+
+    def analyze_samples(self, samples: np.ndarray, sample_rate: int) -> dict:
+        """
+        PCM 샘플 배열의 감정을 추정합니다.
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            int16 모노 PCM 샘플 배열.
+        sample_rate : int
+            샘플링 레이트(Hz).
+
+        Returns
+        -------
+        dict
+            :func:`estimate_mood` 의 결과에 다음 키를 더한 딕셔너리.
+
+            - features: :func:`extract_acoustic_features` 의 결과
+            - should_transcribe: 발화가 충분해 STT 를 실행할 가치가 있는지 여부
+            - elapsed_ms: 추정에 걸린 시간(밀리초)
+        """
+        start = time.perf_counter()
+        features = extract_acoustic_features(samples, sample_rate)
+        result = estimate_mood(features)
+
+        speech_ratio = 1.0 - features["pause_ratio"]
+        result["features"] = features
+        result["should_transcribe"] = (
+            features["speech_seconds"] >= self.min_speech_seconds
+            and speech_ratio >= self.min_speech_ratio
+        )
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    def analyze_pcm(self, pcm: bytes, sample_rate: int = 16000) -> dict:
+        """
+        16-bit 모노 PCM 바이트의 감정을 추정합니다. (복사 없이 배열로 감쌈)
+
+        Parameters
+        ----------
+        pcm : bytes
+            리틀 엔디언 16-bit 모노 PCM 바이트열.
+        sample_rate : int, optional
+            샘플링 레이트. 기본값은 16000Hz.
+
+        Returns
+        -------
+        dict
+            :meth:`analyze_samples` 와 같은 형식의 결과.
+        """
+        usable = len(pcm) - len(pcm) % 2
+        return self.analyze_samples(np.frombuffer(pcm[:usable], dtype="<i2"), sample_rate)
+
+    def analyze_file(self, audio_file_path: str) -> Optional[dict]:
+        """
+        오디오 파일의 감정을 추정합니다.
+
+        WAV 는 직접 읽고, 그 밖의 형식(flac, aiff 등)은 ffmpeg 로 16kHz 모노
+        PCM 으로 디코딩합니다.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            분석할 오디오 파일 경로.
+
+        Returns
+        -------
+        dict or None
+            :meth:`analyze_samples` 와 같은 형식의 결과. 파일을 읽을 수 없으면 ``None``.
+        """
+        try:
+            samples, sample_rate = read_wav_pcm(audio_file_path)
+        except (wave.Error, ValueError, EOFError):
+            from .ffmpeg_io import PCM_SAMPLE_RATE, decode_to_pcm
+
+            try:
+                return self.analyze_pcm(decode_to_pcm(audio_file_path), PCM_SAMPLE_RATE)
+            except (OSError, RuntimeError) as e:
+                print(f"❌ 음향 특징 추출 실패: {e}")
+                return None
+        except OSError as e:
+            print(f"❌ 음향 특징 추출 실패: {e}")
+            return None
+        return self.analyze_samples(samples, sample_rate)
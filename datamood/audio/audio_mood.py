@@ -1,28 +1,27 @@
 import os 
-import yt_dlp
-from pydub import AudioSegment
-import speech_recognition as sr
+import contextlib
+import tempfile
+import threading
+import time
+import wave
 import shutil
+import numpy as np
+
+from .vad import read_wav_pcm, detect_speech_segments, plan_chunks, summarize_segments
+from .transcript_cache import NORMALIZED_SAMPLE_RATE, normalize_pcm, transcript_key, transcript_hasher
+from .ffmpeg_io import PCM_SAMPLE_RATE, FFmpegNotFoundError, decode_to_pcm, iter_pcm_chunks, write_wav
+from ..utils import is_compressed_audio
 
 """
 datamood 모듈
 =============
 
 YouTube 오디오 다운로드 → WAV 변환 → 텍스트 추출을 위한 기능을 제공하는 모듈입니다.
-"""
 
-# -------------------------------------------------------------
-# FFmpeg 환경 설정
-# -------------------------------------------------------------
-FFMPEG_BIN_PATH = r"C:\Users\jinui\ffmpeg-2025-12-04-git-d6458f6a8b-full_build\bin" 
-
-# 사용자 환경에 맞게 FFmpeg 실행 파일이 있는 디렉토리를 시스템 PATH 환경 변수에 추가
-print(f"✅ FFmpeg 경로 설정 시도: {FFMPEG_BIN_PATH}")
-os.environ["PATH"] += os.pathsep + FFMPEG_BIN_PATH
-# pydub 라이브러리가 FFmpeg 실행 파일의 위치를 찾도록 환경 변수를 설정
-os.environ["FFMPEG_PATH"] = os.path.join(FFMPEG_BIN_PATH, "ffmpeg.exe")
-os.environ["FFPROBE_PATH"] = os.path.join(FFMPEG_BIN_PATH, "ffprobe.exe")
-print(f"✅ FFMPEG_PATH 확인: {os.environ.get('FFMPEG_PATH')}")
+``yt_dlp`` 와 ``speech_recognition`` 은 실제로 다운로드/음성 인식을 할 때 로드하며,
+FFmpeg 실행 파일은 첫 디코딩 시점에 :func:`datamood.audio.ffmpeg_io.ffmpeg_executable`
+로 찾습니다 (``FFMPEG_PATH`` 환경 변수 또는 ``PATH``).
+"""
 
 # 오디오 파일을 받아서 텍스트로 추출하는 클래스
 class AudioPreprocessor:
@@ -33,21 +32,85 @@ class AudioPreprocessor:
     ----------
     language : str, optional
         음성 인식에 사용할 언어 코드입니다. 기본값은 ``'ko-KR'`` 입니다.
+    use_vad : bool, optional
+        ``True`` 이면 음성 구간 검출(VAD)로 무음/음악 구간을 제거한 뒤
+        발화 구간만 음성 인식에 전송합니다. 기본값은 ``True`` 입니다.
+    vad_options : dict, optional
+        :func:`datamood.audio.vad.detect_speech_segments` 에 전달할 추가 옵션.
+    max_chunk_seconds : float, optional
+        음성 인식 요청 하나에 담을 최대 발화 길이(초). 기본값은 50초.
+    cache : TranscriptCache, optional
+        음성 인식 결과 캐시. 지정하면 16kHz 모노로 정규화한 PCM 의 지문이
+        같은 오디오는 음성 인식을 건너뛰고 캐시된 텍스트를 반환합니다.
+    backend : str, optional
+        음성 인식 백엔드 이름. 캐시 키에 포함됩니다. 기본값은 ``'google'``.
+
+    Attributes
+    ----------
+    last_vad_report : dict or None
+        현재 스레드에서 마지막으로 처리한 파일의 STT 절감 리포트
+        (total_seconds, speech_seconds, saved_seconds, segments).
+        VAD 를 적용하지 못한 경우 ``None`` 입니다.
+    last_cache_hit : bool or None
+        현재 스레드에서 마지막으로 처리한 파일이 캐시에 적중했는지 여부.
+        캐시를 사용하지 않으면 ``None`` 입니다.
+
+    Notes
+    -----
+    ``last_*`` 속성은 스레드별로 저장되므로, 하나의 인스턴스를 여러 스레드에서
+    동시에 사용해도 각 스레드는 자신이 처리한 결과만 봅니다.
     """
-    def __init__(self, language='ko-KR'):
+    def __init__(self, language='ko-KR', use_vad=True, vad_options=None, max_chunk_seconds=50.0,
+                 cache=None, backend='google'):
+        import speech_recognition as sr
+
         # Recognizer 객체 초기화
         self.recognizer = sr.Recognizer()
         # 음성 인식 언어 설정 (기본값: 한국어)
         self.language = language
+        # 음성 구간 검출(VAD) 설정
+        self.use_vad = use_vad
+        self.vad_options = vad_options or {}
+        self.max_chunk_seconds = max_chunk_seconds
+        # 음성 인식 결과 캐시 설정
+        self.cache = cache
+        self.backend = backend
+        # 스레드별 처리 결과 저장소 (last_vad_report, last_cache_hit)
+        self._local = threading.local()
+
+    @property
+    def last_vad_report(self):
+        return getattr(self._local, "vad_report", None)
+
+    @last_vad_report.setter
+    def last_vad_report(self, value):
+        self._local.vad_report = value
+
+    @property
+    def last_cache_hit(self):
+        return getattr(self._local, "cache_hit", None)
+
+    @last_cache_hit.setter
+    def last_cache_hit(self, value):
+        self._local.cache_hit = value
 
     def extract_text_from_audio(self, audio_file_path):
         """
         주어진 오디오 파일을 분석하여 텍스트를 추출합니다.
 
+        ``use_vad`` 가 켜져 있고 파일이 WAV 이면 발화 구간만 잘라
+        무음 경계 기준의 청크 단위로 인식하며, 절감된 STT 시간은
+        :attr:`last_vad_report` 에 기록됩니다.
+
+        ``cache`` 가 지정되어 있으면 오디오를 16kHz 모노 PCM 으로 한 번 디코딩해
+        지문을 계산하고, 캐시에 적중하면 음성 인식 없이 바로 반환합니다.
+        캐시 미스 시에는 같은 PCM 을 그대로 인식에 사용합니다.
+
         Parameters
         ----------
         audio_file_path : str
             텍스트를 추출할 WAV 또는 음성 파일 경로.
+            mp3/m4a/ogg/opus 등 압축 포맷은 ffmpeg 로 메모리에서 디코딩합니다.
 
         Returns
         -------
@@ -60,18 +123,153 @@ class AudioPreprocessor:
         FileNotFoundError
             파일을 찾을 수 없을 때 발생합니다.
         """
+        if self.cache is None:
+            return self._run_recognition(self._recognize_file, audio_file_path)
+
+        def recognize_normalized(path):
+            # 정규화된 PCM 지문으로 캐시 조회
+            print(f"-> 오디오 파일 '{path}' 디코딩 중...")
+            return self._recognize_cached_pcm(normalize_pcm(path), NORMALIZED_SAMPLE_RATE)
+
+        return self._run_recognition(recognize_normalized, audio_file_path)
+
+    def extract_text_from_pcm(self, pcm, sample_rate=NORMALIZED_SAMPLE_RATE):
+        """
+        이미 디코딩된 16-bit 모노 PCM 바이트에서 텍스트를 추출합니다.
+
+        16kHz PCM 이면 ``cache`` 조회/저장도 함께 수행합니다.
+
+        Parameters
+        ----------
+        pcm : bytes
+            리틀 엔디언 16-bit 모노 PCM 바이트열.
+        sample_rate : int, optional
+            샘플링 레이트. 기본값은 16000Hz.
+
+        Returns
+        -------
+        str or None
+            인식된 텍스트 문자열. 인식 실패 시 ``None``.
+        """
+        return self._run_recognition(self._recognize_cached_pcm, pcm, sample_rate)
+
+    def extract_text_from_stream(self, pcm_chunks, sample_rate=NORMALIZED_SAMPLE_RATE, window_seconds=60.0):
+        """
+        순차적으로 도착하는 16-bit 모노 PCM 조각에서 텍스트를 추출합니다.
+
+        ``window_seconds`` 만큼 쌓일 때마다 VAD 로 발화 구간을 찾아 바로 인식하므로,
+        디코딩/다운로드가 끝나기 전에 음성 인식이 시작되고 메모리 사용량도
+        창 크기로 제한됩니다. 창 끝에서 이어지는 발화는 다음 창으로 넘겨
+        단어 중간에서 잘리지 않도록 합니다.
+
+        전체 PCM 을 미리 알 수 없으므로 캐시 조회는 하지 않지만,
+        인식이 끝나면 증분 해시로 계산한 키로 결과를 ``cache`` 에 저장합니다.
+
+        Parameters
+        ----------
+        pcm_chunks : Iterable[bytes]
+            16-bit 모노 PCM 바이트 조각들
+            (예: :func:`datamood.audio.ffmpeg_io.iter_pcm_chunks`).
+        sample_rate : int, optional
+            샘플링 레이트. 기본값은 16000Hz.
+        window_seconds : float, optional
+            VAD/인식을 수행할 창 길이(초). 기본값은 60초.
+
+        Returns
+        -------
+        str or None
+            인식된 텍스트 문자열. 인식 실패 시 ``None``.
+        """
+        return self._run_recognition(self._recognize_stream, pcm_chunks, sample_rate, window_seconds)
+
+    def iter_transcript_stream(self, pcm_chunks, sample_rate=NORMALIZED_SAMPLE_RATE, window_seconds=60.0):
+        """
+        PCM 조각을 창 단위로 인식하며, 인식된 청크를 시각 정보와 함께 바로 내보냅니다.
+
+        :meth:`extract_text_from_stream` 과 같은 방식으로 처리하지만 전체 인식이
+        끝날 때까지 기다리지 않고 청크마다 결과를 돌려주므로, 앞부분의 감정 분석을
+        뒷부분의 디코딩/인식과 겹쳐서 진행할 수 있습니다. 스트림이 끝나면
+        :attr:`last_vad_report` 를 기록하고 전체 텍스트를 ``cache`` 에 저장합니다.
+        네트워크 오류 등으로 인식이 중단되면 오류를 출력하고 생성을 멈춥니다.
+
+        Parameters
+        ----------
+        pcm_chunks : Iterable[bytes]
+            16-bit 모노 PCM 바이트 조각들.
+        sample_rate : int, optional
+            샘플링 레이트. 기본값은 16000Hz.
+        window_seconds : float, optional
+            VAD/인식을 수행할 창 길이(초). 기본값은 60초.
+
+        Yields
+        ------
+        dict
+            start(초), end(초), text 키를 가진 딕셔너리.
+        """
+        import speech_recognition as sr
+
+        self.last_vad_report = None
+        self.last_cache_hit = None
+        state = {}
+        texts = []
         try:
-            with sr.AudioFile(audio_file_path) as source:
-                print(f"-> 오디오 파일 '{audio_file_path}' 로드 중...")
-                audio_data = self.recognizer.record(source)
-                
-            print("-> 음성 인식을 시도합니다...")
-            text = self.recognizer.recognize_google(
-                audio_data, 
-                language=self.language
-            )
-            print(f"인식 성공: '{text[:50]}...'")
-            return text
+            for start, end, text in self._iter_stream_transcripts(
+                pcm_chunks, sample_rate, window_seconds, state
+            ):
+                texts.append(text)
+                yield {"start": round(start, 3), "end": round(end, 3), "text": text}
+        except sr.RequestError as e:
+            print(f"요청 오류: Google API 연결 문제 발생; {e}")
+            return
+        except RuntimeError as e:
+            print(f"기타 오류 발생: {e}")
+            return
+        self._finish_stream(texts, sample_rate, state)
+
+    def iter_transcript_from_audio(self, audio_file_path, window_seconds=60.0):
+        """
+        오디오 파일을 창 단위로 인식하며, 인식된 청크를 시각 정보와 함께 바로 내보냅니다.
+
+        WAV 는 직접 읽어 창 크기로 나누고, 그 밖의 형식은 ffmpeg 디코딩 출력을
+        스트리밍합니다. 결과 형식은 :meth:`iter_transcript_stream` 과 같습니다.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            텍스트를 추출할 오디오 파일 경로.
+        window_seconds : float, optional
+            VAD/인식을 수행할 창 길이(초). 기본값은 60초.
+
+        Yields
+        ------
+        dict
+            start(초), end(초), text 키를 가진 딕셔너리.
+        """
+        if not os.path.exists(audio_file_path):
+            print(f"파일 오류: 지정된 파일 '{audio_file_path}'을 찾을 수 없습니다.")
+            return
+
+        try:
+            samples, sample_rate = read_wav_pcm(audio_file_path)
+        except (wave.Error, ValueError, EOFError):
+            print(f"-> 오디오 파일 '{audio_file_path}' 디코딩 중...")
+            chunks, sample_rate = iter_pcm_chunks(audio_file_path), PCM_SAMPLE_RATE
+        else:
+            step = max(1, int(window_seconds * sample_rate))
+            chunks = (samples[i:i + step] for i in range(0, len(samples), step))
+
+        yield from self.iter_transcript_stream(chunks, sample_rate, window_seconds)
+
+    def _run_recognition(self, recognize, source, *args):
+        """
+        인식 함수를 실행하고, 공통 예외를 처리하여 실패 시 ``None`` 을 반환합니다.
+        """
+        import speech_recognition as sr
+
+        self.last_vad_report = None
+        self.last_cache_hit = None
+        try:
+            return recognize(source, *args)
             
         # 인식기가 음성을 이해하지 못 했을 때
         except sr.UnknownValueError:
@@ -81,15 +279,241 @@ class AudioPreprocessor:
         except sr.RequestError as e:
             print(f"요청 오류: Google API 연결 문제 발생; {e}")
             return None
+        # ffmpeg 가 설치되어 있지 않을 때 (입력 파일 문제가 아님)
+        except FFmpegNotFoundError as e:
+            print(f"ffmpeg 오류: {e}")
+            return None
         # 파일이 존재하지 않을 때
         except FileNotFoundError:
-            print(f"파일 오류: 지정된 파일 '{audio_file_path}'을 찾을 수 없습니다.")
+            print(f"파일 오류: 지정된 파일 '{source}'을 찾을 수 없습니다.")
             return None
         # 그 외의 모든 예외처리
         except Exception as e:
             print(f"기타 오류 발생: {e}")
             return None
 
+    def _recognize_cached_pcm(self, pcm, sample_rate):
+        """
+        PCM 바이트를 캐시 조회 후 음성 인식합니다. 16kHz 가 아니면 캐시를 건너뜁니다.
+        """
+        if self.cache is None or sample_rate != NORMALIZED_SAMPLE_RATE:
+            return self._recognize_pcm(np.frombuffer(pcm, dtype="<i2"), sample_rate)
+
+        key = transcript_key(pcm, self.backend, self.language)
+        cached = self.cache.get(key)
+        self.last_cache_hit = cached is not None
+        if cached is not None:
+            print(f"캐시 적중: 음성 인식을 건너뜁니다. '{cached[:50]}...'")
+            return cached
+
+        text = self._recognize_pcm(np.frombuffer(pcm, dtype="<i2"), sample_rate)
+        if text:
+            self.cache.put(key, text)
+        return text
+
+    def _recognize_file(self, audio_file_path):
+        """
+        오디오 파일 하나를 음성 인식합니다.
+
+        압축 포맷(mp3, m4a, ogg, opus ...)은 ffmpeg 파이프로 16kHz 모노 PCM 을
+        메모리에 바로 디코딩해 :meth:`_recognize_pcm` 으로 인식합니다 (임시 WAV 없음).
+        VAD 를 적용할 수 있는 WAV 도 :meth:`_recognize_pcm` 으로,
+        그 외에는 ``speech_recognition.AudioFile`` 로 파일 전체를 인식합니다.
+        """
+        if is_compressed_audio(audio_file_path):
+            if not os.path.exists(audio_file_path):
+                raise FileNotFoundError(audio_file_path)
+            print(f"-> 오디오 파일 '{audio_file_path}' 디코딩 중...")
+            samples = np.frombuffer(decode_to_pcm(audio_file_path), dtype="<i2")
+            return self._recognize_pcm(samples, PCM_SAMPLE_RATE)
+
+        if self.use_vad:
+            try:
+                samples, sample_rate = read_wav_pcm(audio_file_path)
+            except (wave.Error, ValueError, EOFError):
+                # WAV 가 아니거나 지원하지 않는 형식이면 전체 인식으로 대체
+                pass
+            else:
+                return self._recognize_pcm(samples, sample_rate)
+
+        import speech_recognition as sr
+
+        with sr.AudioFile(audio_file_path) as source:
+            print(f"-> 오디오 파일 '{audio_file_path}' 로드 중...")
+            audio_data = self.recognizer.record(source)
+
+        print("-> 음성 인식을 시도합니다...")
+        text = self.recognizer.recognize_google(
+            audio_data, 
+            language=self.language
+        )
+        print(f"인식 성공: '{text[:50]}...'")
+        return text
+
+    def _recognize_pcm(self, samples, sample_rate):
+        """
+        int16 모노 PCM 샘플을 음성 인식합니다.
+
+        ``use_vad`` 가 켜져 있으면 발화 구간만, 아니면 전체 샘플을 한 번에 전송합니다.
+        """
+        if self.use_vad:
+            return self._recognize_speech_segments(samples, sample_rate)
+
+        import speech_recognition as sr
+
+        print("-> 음성 인식을 시도합니다...")
+        audio_data = sr.AudioData(samples.tobytes(), sample_rate, 2)
+        text = self.recognizer.recognize_google(audio_data, language=self.language)
+        print(f"인식 성공: '{text[:50]}...'")
+        return text
+
+    def _recognize_speech_segments(self, samples, sample_rate):
+        """
+        VAD 로 검출한 발화 구간만 청크 단위로 음성 인식합니다.
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            int16 모노 PCM 샘플 배열.
+        sample_rate : int
+            샘플링 레이트(Hz).
+
+        Returns
+        -------
+        str or None
+            청크별 인식 결과를 이어 붙인 텍스트. 발화가 없거나 모든 청크가
+            인식에 실패하면 ``None``.
+
+        Raises
+        ------
+        speech_recognition.RequestError
+            Google API 호출이 실패했을 때 발생합니다.
+        """
+        segments = detect_speech_segments(samples, sample_rate, **self.vad_options)
+        self._report_vad(segments, len(samples) / sample_rate)
+
+        if not segments:
+            print("인식 실패: 발화 구간이 검출되지 않았습니다.")
+            return None
+
+        return self._join_texts(self._transcribe_segments(samples, sample_rate, segments))
+
+    def _recognize_stream(self, pcm_chunks, sample_rate, window_seconds):
+        """
+        PCM 조각을 창 단위로 모아 VAD → 인식을 반복합니다.
+        """
+        state = {}
+        texts = [text for _, _, text in self._iter_stream_transcripts(
+            pcm_chunks, sample_rate, window_seconds, state
+        )]
+        return self._finish_stream(texts, sample_rate, state)
+
+    def _iter_stream_transcripts(self, pcm_chunks, sample_rate, window_seconds, state):
+        """
+        PCM 조각을 창 단위로 VAD → 인식하며 (시작 초, 끝 초, 텍스트)를 청크마다 내보냅니다.
+
+        스트림이 끝나면 ``state`` 에 전체 발화 구간(segments), 전체 샘플 수
+        (total_samples), 증분 해시(hasher)를 기록합니다.
+        """
+        window = int(window_seconds * sample_rate)
+        hasher = transcript_hasher(self.backend, self.language) if self.cache is not None else None
+        pending = np.empty(0, dtype=np.int16)
+        offset = 0.0
+        total_samples = 0
+        all_segments = []
+
+        def process(final):
+            nonlocal pending, offset
+            segments = detect_speech_segments(pending, sample_rate, **self.vad_options)
+            cut = len(pending)
+            if not final and segments:
+                last_start, last_end = segments[-1]
+                # 창 끝까지 이어지는 발화는 다음 창에서 이어서 처리
+                if last_start > 0 and last_end >= len(pending) / sample_rate:
+                    segments = segments[:-1]
+                    cut = int(last_start * sample_rate)
+            window_samples, window_offset = pending, offset
+            all_segments.extend((offset + s, offset + e) for s, e in segments)
+            pending = pending[cut:]
+            offset += cut / sample_rate
+            yield from self._iter_chunk_transcripts(
+                window_samples, sample_rate, segments, window_offset
+            )
+
+        for data in pcm_chunks:
+            if hasher is not None:
+                hasher.update(data)
+            chunk = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype="<i2")
+            total_samples += len(chunk)
+            pending = np.concatenate((pending, chunk))
+            if len(pending) >= window:
+                yield from process(final=False)
+        yield from process(final=True)
+
+        state["segments"] = all_segments
+        state["total_samples"] = total_samples
+        state["hasher"] = hasher
+
+    def _finish_stream(self, texts, sample_rate, state):
+        """스트림 인식 결과로 VAD 리포트를 남기고, 텍스트를 합쳐 캐시에 저장한다."""
+        all_segments = state.get("segments", [])
+        self._report_vad(all_segments, state.get("total_samples", 0) / sample_rate)
+        if not all_segments:
+            print("인식 실패: 발화 구간이 검출되지 않았습니다.")
+            return None
+
+        text = self._join_texts(texts)
+        hasher = state.get("hasher")
+        if text and hasher is not None and sample_rate == NORMALIZED_SAMPLE_RATE:
+            self.cache.put(hasher.hexdigest(), text)
+        return text
+
+    def _report_vad(self, segments, total_seconds):
+        """VAD 결과로 :attr:`last_vad_report` 를 기록하고 출력한다."""
+        self.last_vad_report = summarize_segments(segments, total_seconds)
+        print(
+            f"-> VAD: 발화 {self.last_vad_report['speech_seconds']}초 / "
+            f"전체 {self.last_vad_report['total_seconds']}초 "
+            f"(STT 절감 {self.last_vad_report['saved_seconds']}초)"
+        )
+
+    def _transcribe_segments(self, samples, sample_rate, segments):
+        """
+        발화 구간을 청크로 묶어 인식하고, 청크별 텍스트 목록을 반환합니다.
+        """
+        return [text for _, _, text in self._iter_chunk_transcripts(samples, sample_rate, segments)]
+
+    def _iter_chunk_transcripts(self, samples, sample_rate, segments, offset=0.0):
+        """
+        발화 구간을 청크로 묶어 인식하고, 청크마다 (시작 초, 끝 초, 텍스트)를 내보냅니다.
+
+        시각은 ``samples`` 시작 기준 초에 ``offset`` 을 더한 값입니다.
+        인식하지 못한 청크는 건너뜁니다.
+        """
+        import speech_recognition as sr
+
+        for chunk in plan_chunks(segments, self.max_chunk_seconds):
+            pcm = np.concatenate(
+                [samples[int(start * sample_rate):int(end * sample_rate)] for start, end in chunk]
+            )
+            audio_data = sr.AudioData(pcm.tobytes(), sample_rate, 2)
+            try:
+                text = self.recognizer.recognize_google(audio_data, language=self.language)
+            except sr.UnknownValueError:
+                # 해당 청크만 건너뜀
+                continue
+            yield offset + chunk[0][0], offset + chunk[-1][1], text
+
+    def _join_texts(self, texts):
+        """청크별 인식 결과를 하나의 텍스트로 합친다. 결과가 없으면 ``None``."""
+        if not texts:
+            print("인식 실패: 음성을 이해할 수 없거나 명확하지 않습니다.")
+            return None
+
+        text = " ".join(texts)
+        print(f"인식 성공: '{text[:50]}...'")
+        return text
+
     def save_text_to_file(self, text_content, output_file_path):
         """
         추출된 텍스트를 파일로 저장합니다.
@@ -119,119 +543,250 @@ class AudioPreprocessor:
 # YouTube 다운로드 및 WAV 변환 클래스
 class YouTubeDownloader:
     """
-    YouTube 영상에서 오디오를 다운로드하고 WAV 파일로 변환한 뒤,
+    YouTube 영상에서 오디오를 다운로드하고 16kHz 모노 PCM 으로 디코딩한 뒤,
     텍스트 인식까지 자동으로 처리하는 클래스입니다.
 
+    다운로드한 원본 오디오 스트림(webm/m4a 등)은 ffmpeg 로 한 번만 디코딩하며,
+    MP3 재인코딩이나 중간 WAV 파일을 만들지 않습니다.
+
+    작업(영상) 하나마다 ``tempfile`` 로 격리된 임시 디렉토리를 만들어 사용하므로,
+    하나의 인스턴스로 여러 스레드에서 동시에 다운로드해도 파일이 섞이지 않습니다.
+    생성자에서는 디렉토리를 만들지 않습니다.
+
     Parameters
     ----------
     output_dir : str, optional
-        임시 파일을 저장할 디렉토리 이름입니다.  
-        기본값은 ``'audio_temp'`` 입니다.
+        작업별 임시 디렉토리를 만들 상위 디렉토리입니다.  
+        기본값 ``None`` 이면 시스템 임시 디렉토리를 사용합니다.
+
+    Attributes
+    ----------
+    last_metrics : dict or None
+        현재 스레드에서 마지막으로 처리한 영상의 단계별 소요 시간과 디스크 I/O 측정값.
+        (download_seconds, decode_seconds, recognize_seconds, total_seconds,
+        bytes_downloaded, bytes_written)
     """
     
-    def __init__(self, output_dir="audio_temp"):
-        # 임시 파일을 저장할 디렉토리 이름 설정
+    def __init__(self, output_dir=None):
+        # 작업별 임시 디렉토리를 만들 상위 디렉토리 (None 이면 시스템 임시 디렉토리)
         self.output_dir = output_dir
-        # 디렉토리가 없으면 새로 생성
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-        
-        # 임시 MP3 파일과 최종 WAV 파일의 경로를 정의
-        self.temp_mp3_path = os.path.join(self.output_dir, "temp_audio.mp3")
-        self.output_wav_path = os.path.join(self.output_dir, "output_recognition.wav")
+        # cleanup() 으로 정리할, 이 인스턴스가 만든 작업 디렉토리 목록
+        self._job_dirs = []
+        self._lock = threading.Lock()
+        # 스레드별 측정값 저장소
+        self._local = threading.local()
+
+    @property
+    def last_metrics(self):
+        return getattr(self._local, "metrics", None)
 
-    def download_and_convert(self, youtube_url):
+    def _new_job_dir(self):
+        """격리된 작업 디렉토리를 새로 만든다."""
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+        return tempfile.mkdtemp(prefix="datamood_yt_", dir=self.output_dir)
+
+    @contextlib.contextmanager
+    def job(self):
         """
-        YouTube URL에서 오디오를 다운로드하고 WAV 파일로 변환합니다.
+        작업 하나에 사용할 격리된 임시 디렉토리를 제공하고, 블록을 벗어나면
+        예외 여부와 관계없이 삭제합니다.
+
+        Yields
+        ------
+        str
+            작업 디렉토리 경로.
+
+        Examples
+        --------
+        >>> downloader = YouTubeDownloader()
+        >>> with downloader.job() as job_dir:
+        ...     wav_path = downloader.download_and_convert(url, job_dir=job_dir)
+        """
+        job_dir = self._new_job_dir()
+        try:
+            yield job_dir
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    def _resolve_job_dir(self, job_dir):
+        """job_dir 가 없으면 새로 만들고 cleanup() 대상으로 등록한다."""
+        if job_dir is not None:
+            return job_dir
+        job_dir = self._new_job_dir()
+        with self._lock:
+            self._job_dirs.append(job_dir)
+        return job_dir
+
+    def download_audio(self, youtube_url, job_dir=None):
+        """
+        YouTube URL에서 오디오 스트림을 재인코딩 없이 그대로 다운로드합니다.
 
         Parameters
         ----------
         youtube_url : str
             오디오를 다운로드할 YouTube 영상 URL.
+        job_dir : str, optional
+            파일을 저장할 작업 디렉토리. 지정하지 않으면 새로 만들고
+            :meth:`cleanup` 에서 삭제합니다.
 
         Returns
         -------
         str or None
-            변환된 WAV 파일 경로.  
-            다운로드 또는 변환 오류 시 ``None`` 반환.
-
-        Notes
-        -----
-        - ``yt-dlp`` 를 사용해 MP3로 추출합니다.  
-        - ``pydub`` + ``FFmpeg`` 을 이용하여 WAV로 변환합니다.
+            다운로드된 오디오 파일 경로. 오류 시 ``None`` 반환.
         """
+        import yt_dlp
+
+        job_dir = self._resolve_job_dir(job_dir)
         ydl_opts = {
             # yt-dlp에게 최적의 오디오 형식으로 다운로드하도록 지시
             'format': 'bestaudio/best', 
-            # 다운로드된 파일의 출력 템플릿을 설정, %(ext)s는 파일 확장자
-            'outtmpl': self.temp_mp3_path.replace(".mp3", ".%(ext)s"),
-            # 다운로드 후 FFmpeg을 사용하여 오디오를 추출하고 MP3 코덱을 사용하도록 후처리(postprocessor)를 설정
-            'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'mp3', 'preferredquality': '192'}],
+            # 작업 디렉토리 안에 저장, %(ext)s는 파일 확장자
+            'outtmpl': os.path.join(job_dir, "audio.%(ext)s"),
             # 다운로드 과정중 불필요한 정보를 걸러서 콘솔 출력을 최소화
             'quiet': True 
         }
-        
-        print(f"✅ 1. '{youtube_url}'에서 오디오 다운로드 및 MP3 추출 중...")
+
+        self._local.metrics = {
+            "download_seconds": 0.0,
+            "decode_seconds": 0.0,
+            "recognize_seconds": 0.0,
+            "total_seconds": 0.0,
+            "bytes_downloaded": 0,
+            "bytes_written": 0,
+        }
+
+        print(f"✅ 1. '{youtube_url}'에서 오디오 다운로드 중...")
+        started = time.perf_counter()
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # 지정된 YouTube URL에서 다운로드 실행
-                ydl.download([youtube_url]) 
-            
-            # yt-dlp가 생성한 실제 mp3 파일 이름을 찾아 self.temp_mp3_path를 업데이트
-            # 이 과정은 yt-dlp의 동작에 따라 필요할 수 있음
-            for file in os.listdir(self.output_dir):
-                if file.endswith(".mp3"):
-                    self.temp_mp3_path = os.path.join(self.output_dir, file)
-                    break
-
+                # 지정된 YouTube URL에서 다운로드 실행 후 실제 저장 경로 확인
+                info = ydl.extract_info(youtube_url, download=True)
+                audio_path = ydl.prepare_filename(info)
+            # 파일이 실제로 만들어지지 않았으면 OSError → 다운로드 실패로 처리
+            size = os.path.getsize(audio_path)
         except Exception as e:
             print(f"❌ 오디오 다운로드 중 오류 발생: {e}")
             return None
-            
-        print("✅ 2. 오디오를 WAV 형식으로 변환 중...")
+
+        self.last_metrics["download_seconds"] = round(time.perf_counter() - started, 3)
+        self.last_metrics["bytes_downloaded"] = size
+        self.last_metrics["bytes_written"] = size
+        return audio_path
+
+    def download_pcm(self, youtube_url, job_dir=None):
+        """
+        YouTube 오디오를 다운로드하고 16kHz 모노 16-bit PCM 바이트로 디코딩합니다.
+
+        디스크에는 다운로드한 원본 스트림 파일 하나만 기록됩니다.
+
+        Parameters
+        ----------
+        youtube_url : str
+            오디오를 다운로드할 YouTube 영상 URL.
+        job_dir : str, optional
+            다운로드 파일을 저장할 작업 디렉토리.
+            지정하지 않으면 임시 디렉토리를 만들어 사용한 뒤 바로 삭제합니다.
+
+        Returns
+        -------
+        bytes or None
+            PCM 바이트열. 다운로드 또는 디코딩 오류 시 ``None`` 반환.
+        """
+        if job_dir is None:
+            with self.job() as tmp_dir:
+                return self.download_pcm(youtube_url, job_dir=tmp_dir)
+
+        audio_path = self.download_audio(youtube_url, job_dir=job_dir)
+        if not audio_path:
+            return None
+        return self._decode(audio_path)
+
+    def download_and_convert(self, youtube_url, job_dir=None):
+        """
+        YouTube URL에서 오디오를 다운로드하고 WAV 파일로 변환합니다.
+
+        Parameters
+        ----------
+        youtube_url : str
+            오디오를 다운로드할 YouTube 영상 URL.
+        job_dir : str, optional
+            파일을 저장할 작업 디렉토리. 지정하지 않으면 새로 만들고
+            :meth:`cleanup` 에서 삭제합니다.
+
+        Returns
+        -------
+        str or None
+            변환된 WAV 파일 경로.  
+            다운로드 또는 변환 오류 시 ``None`` 반환.
+
+        Notes
+        -----
+        - ``yt-dlp`` 로 원본 오디오 스트림을 그대로 받습니다.  
+        - ``FFmpeg`` 로 한 번만 디코딩하여 16kHz 모노 WAV 로 저장합니다.
+        - WAV 파일이 필요 없다면 :meth:`download_pcm` 을 사용하세요.
+        """
+        job_dir = self._resolve_job_dir(job_dir)
+        pcm = self.download_pcm(youtube_url, job_dir=job_dir)
+        if pcm is None:
+            return None
+
+        output_wav_path = os.path.join(job_dir, "output_recognition.wav")
         try:
-            # pydub을 사용하여 MP3 파일을 로드
-            audio = AudioSegment.from_file(self.temp_mp3_path, format="mp3")
-            # 음성 인식 성능 향상을 위해 오디오를 모노(단일 채널)로 설정하고 샘플링 레이트를 16000Hz로 리샘플링(1초에 16000번 측정)
-            audio = audio.set_channels(1).set_frame_rate(16000) 
-            # 변환된 오디오를 WAV 형식으로 저장
-            audio.export(self.output_wav_path, format="wav") 
-            print(f"   -> WAV 파일 저장 완료: {self.output_wav_path}")
-            return self.output_wav_path
+            self.last_metrics["bytes_written"] += write_wav(output_wav_path, pcm)
+            print(f"   -> WAV 파일 저장 완료: {output_wav_path}")
+            return output_wav_path
         except Exception as e:
             print(f"❌ WAV 변환 중 오류 발생: {e}")
             return None
 
     def cleanup(self):
         """
-        다운로드 및 변환 과정에서 생성된 임시 디렉토리와 파일을 삭제합니다.
+        이 인스턴스가 만든 작업 디렉토리와 파일을 삭제합니다.
+
+        다른 작업(다른 인스턴스나 :meth:`job` 블록)이 사용 중인 디렉토리와
+        상위 ``output_dir`` 은 건드리지 않습니다.
 
         Notes
         -----
         작업 후 자동 정리할 때 호출됩니다.
         """
         print("\n✅ 4. 임시 파일 정리 중...")
-        try:
-            # shutil.rmtree를 사용하여 디렉토리와 그 내용을 재귀적으로 삭제
-            shutil.rmtree(self.output_dir)
-            print(f"   -> 임시 디렉토리 ({self.output_dir}) 정리 완료.")
-        except OSError as e:
-            print(f"   -> 디렉토리 삭제 중 오류 발생: {e}")
+        with self._lock:
+            job_dirs, self._job_dirs = self._job_dirs, []
+        for job_dir in job_dirs:
+            try:
+                # shutil.rmtree를 사용하여 디렉토리와 그 내용을 재귀적으로 삭제
+                shutil.rmtree(job_dir)
+                print(f"   -> 임시 디렉토리 ({job_dir}) 정리 완료.")
+            except OSError as e:
+                print(f"   -> 디렉토리 삭제 중 오류 발생: {e}")
             
-    def extract_text_from_youtube(self, youtube_url, cleanup=True, output_txt_path = "output_transcript.txt"):
+    def extract_text_from_youtube(self, youtube_url, cleanup=True, output_txt_path=None,
+                                  preprocessor=None):
         """
         YouTube URL을 입력받아  
-        **오디오 다운로드 → WAV 변환 → 텍스트 인식 → 텍스트 파일 저장**  
+        **오디오 다운로드 → PCM 디코딩 → 텍스트 인식 → 텍스트 파일 저장**  
         전체 프로세스를 자동으로 수행합니다.
 
+        전사 캐시가 없으면 ffmpeg 디코딩 출력을 그대로 스트리밍하여
+        디코딩과 음성 인식을 겹쳐 수행합니다. 캐시가 있으면 지문 계산을 위해
+        PCM 전체를 메모리로 디코딩한 뒤 캐시 조회 → 인식 순서로 진행합니다.
+        단계별 소요 시간과 디스크 기록량은 :attr:`last_metrics` 에 남습니다.
+
         Parameters
         ----------
         youtube_url : str
             처리할 YouTube 영상 URL.
         cleanup : bool, optional
             작업 완료 후 임시 파일을 삭제할지 여부. 기본값 ``True``.
-        output_txt_path : str, optional
-            저장할 텍스트 파일 경로.
+            ``False`` 이면 작업 디렉토리를 남겨 두고 :meth:`cleanup` 에서 삭제합니다.
+        output_txt_path : str or None, optional
+            저장할 텍스트 파일 경로. 기본값 ``None`` 이면 파일로 저장하지 않습니다.
+            동시에 여러 작업을 실행할 때는 작업마다 다른 경로를 지정해야 합니다.
+        preprocessor : AudioPreprocessor, optional
+            음성 인식에 사용할 전처리기. 지정하지 않으면 한국어
+            ``AudioPreprocessor`` 를 새로 만듭니다.
 
         Returns
         -------
@@ -239,31 +794,94 @@ class YouTubeDownloader:
             인식된 텍스트.  
             실패 시 ``None``.
         """
+        if not cleanup:
+            return self._extract_text(youtube_url, self._resolve_job_dir(None), output_txt_path, preprocessor)
+
+        with self.job() as job_dir:
+            return self._extract_text(youtube_url, job_dir, output_txt_path, preprocessor)
+
+    def iter_transcript_from_youtube(self, youtube_url, preprocessor=None, window_seconds=60.0):
+        """
+        YouTube 오디오를 다운로드한 뒤 디코딩 출력을 스트리밍 인식하며,
+        인식된 청크를 시각 정보와 함께 바로 내보냅니다.
+
+        작업 디렉토리는 생성이 끝나거나 중단되면 삭제됩니다.
+
+        Parameters
+        ----------
+        youtube_url : str
+            처리할 YouTube 영상 URL.
+        preprocessor : AudioPreprocessor, optional
+            음성 인식에 사용할 전처리기. 지정하지 않으면 한국어
+            ``AudioPreprocessor`` 를 새로 만듭니다.
+        window_seconds : float, optional
+            VAD/인식을 수행할 창 길이(초). 기본값은 60초.
+
+        Yields
+        ------
+        dict
+            start(초), end(초), text 키를 가진 딕셔너리
+            (:meth:`AudioPreprocessor.iter_transcript_stream` 참고).
+        """
+        if preprocessor is None:
+            preprocessor = AudioPreprocessor(language='ko-KR')
+
+        with self.job() as job_dir:
+            audio_path = self.download_audio(youtube_url, job_dir=job_dir)
+            if not audio_path:
+                print("❌ YouTube 오디오 처리 실패로 파이프라인 중단.")
+                return
+            yield from preprocessor.iter_transcript_stream(
+                iter_pcm_chunks(audio_path), PCM_SAMPLE_RATE, window_seconds
+            )
+
+    def _extract_text(self, youtube_url, job_dir, output_txt_path, preprocessor):
+        """작업 디렉토리 하나에서 다운로드 → 디코딩 → 인식 → 저장을 수행한다."""
         print(f"YouTube URL 처리 시작: {youtube_url}")
+        started = time.perf_counter()
+
+        # AudioPreprocessor 객체 준비
+        if preprocessor is None:
+            preprocessor = AudioPreprocessor(language='ko-KR') 
 
-        # 다운로드 및 변환 단계
-        wav_path = self.download_and_convert(youtube_url)
+        # 다운로드 단계
+        audio_path = self.download_audio(youtube_url, job_dir=job_dir)
 
-        if not wav_path:
+        if not audio_path:
             print("❌ YouTube 오디오 처리 실패로 파이프라인 중단.")
-            if cleanup:
-                self.cleanup()
             return None
 
-        # 텍스트 추출 및 저장 단계
+        # 디코딩 + 텍스트 추출 단계
         print("YouTube 오디오 → 텍스트 변환 시도")
+        recognize_started = time.perf_counter()
+        if preprocessor.cache is not None:
+            pcm = self._decode(audio_path)
+            recognize_started = time.perf_counter()
+            recognized_text = preprocessor.extract_text_from_pcm(pcm) if pcm is not None else None
+        else:
+            # 디코딩 결과를 스트리밍하여 창 단위로 바로 인식
+            recognized_text = preprocessor.extract_text_from_stream(iter_pcm_chunks(audio_path))
+        self.last_metrics["recognize_seconds"] = round(time.perf_counter() - recognize_started, 3)
         
-        # AudioPreprocessor 객체 생성
-        preprocessor = AudioPreprocessor(language='ko-KR') 
-        
-        # 생성된 객체를 통해 메서드 호출
-        recognized_text = preprocessor.extract_text_from_audio(wav_path) 
-        
-        if recognized_text:
+        if recognized_text and output_txt_path:
             preprocessor.save_text_to_file(recognized_text, output_txt_path)
-            
-        # 정리 단계 (생략)
-        if cleanup:
-            self.cleanup()
 
+        self.last_metrics["total_seconds"] = round(time.perf_counter() - started, 3)
+        print(
+            f"   -> 처리 시간 {self.last_metrics['total_seconds']}초 "
+            f"(다운로드 {self.last_metrics['download_seconds']}초), "
+            f"디스크 기록 {self.last_metrics['bytes_written'] / 1e6:.1f}MB"
+        )
         return recognized_text
+
+    def _decode(self, audio_path):
+        """다운로드한 파일을 PCM 으로 디코딩하고 소요 시간을 기록한다. 실패 시 ``None``."""
+        print("✅ 2. 오디오를 16kHz 모노 PCM 으로 디코딩 중...")
+        started = time.perf_counter()
+        try:
+            pcm = decode_to_pcm(audio_path)
+        except Exception as e:
+            print(f"❌ 오디오 디코딩 중 오류 발생: {e}")
+            return None
+        self.last_metrics["decode_seconds"] = round(time.perf_counter() - started, 3)
+        return pcm
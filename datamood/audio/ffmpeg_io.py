@@ -0,0 +1,275 @@
+# datamood/audio/ffmpeg_io.py
+import contextlib
+import functools
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+from typing import Iterator
+
+"""
+datamood.audio.ffmpeg_io
+------------------------
+FFmpeg 서브프로세스를 이용한 단일 패스 오디오 디코딩 모듈
+
+압축 오디오(webm/opus, m4a, mp3 ...)를 중간 파일 없이 파이프로
+16kHz 모노 16-bit PCM 으로 바로 디코딩합니다.
+
+주요 함수
+- ffmpeg_executable(): 사용할 ffmpeg 실행 파일 경로 (첫 사용 시 탐색)
+- require_ffmpeg(): ffmpeg 가 없으면 FFmpegNotFoundError
+- configure_pydub(): pydub 이 같은 ffmpeg 를 사용하도록 설정
+- decode_to_pcm(path): 파일 전체를 PCM 바이트로 디코딩
+- iter_pcm_chunks(path): 디코딩 결과를 일정 크기씩 스트리밍
+- write_wav(path, pcm): PCM 바이트를 재인코딩 없이 WAV 컨테이너로 저장
+- set_max_concurrent_decodes(n): 동시에 실행할 ffmpeg 디코딩 수 제한
+
+동시에 실행되는 ffmpeg 프로세스 수는 ``DATAMOOD_MAX_DECODES`` 환경 변수
+(기본값: CPU 코어 수)로 제한되며, 초과한 호출은 앞선 디코딩이 끝날 때까지 대기합니다.
+"""
+
+# 음성 인식용 기본 포맷 (16kHz / 모노 / 16-bit)
+PCM_SAMPLE_RATE = 16000
+PCM_SAMPLE_WIDTH = 2
+
+
+class _DecodeLimiter:
+    """동시에 실행되는 디코딩 수를 제한하는 조정 가능한 세마포어."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._cond = threading.Condition()
+
+    @contextlib.contextmanager
+    def slot(self):
+        with self._cond:
+            while self.active >= self.limit:
+                self._cond.wait()
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.active -= 1
+                self._cond.notify()
+
+    def set_limit(self, limit: int) -> None:
+        with self._cond:
+            self.limit = max(1, limit)
+            self._cond.notify_all()
+
+
+_decode_limiter = _DecodeLimiter(
+    int(os.environ.get("DATAMOOD_MAX_DECODES") or os.cpu_count() or 4)
+)
+
+
+def set_max_concurrent_decodes(limit: int) -> None:
+    """
+    동시에 실행할 수 있는 ffmpeg 디코딩 프로세스 수를 설정합니다.
+
+    Parameters
+    ----------
+    limit : int
+        최대 동시 디코딩 수 (1 이상).
+    """
+    _decode_limiter.set_limit(limit)
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_executable() -> str:
+    """
+    사용할 ffmpeg 실행 파일 경로를 찾아 반환합니다.
+
+    ``FFMPEG_PATH`` 환경 변수가 실제 파일을 가리키면 그 경로를, 아니면
+    ``PATH`` 에서 찾은 ``ffmpeg`` 를 사용합니다. 탐색은 첫 호출 때 한 번만
+    수행하며, import 시점에는 환경 변수나 ``PATH`` 를 변경하지 않습니다.
+
+    Returns
+    -------
+    str
+        ffmpeg 실행 파일 경로.
+    """
+    env_path = os.environ.get("FFMPEG_PATH")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+    return shutil.which("ffmpeg") or "ffmpeg"
+
+
+class FFmpegNotFoundError(RuntimeError):
+    """ffmpeg 실행 파일을 찾을 수 없을 때 발생합니다 (입력 파일이 없는 경우와 구분)."""
+
+
+def require_ffmpeg() -> str:
+    """
+    ffmpeg 실행 파일 경로를 반환하고, 찾을 수 없으면 FFmpegNotFoundError 를 발생시킵니다.
+
+    Returns
+    -------
+    str
+        ffmpeg 실행 파일 경로.
+
+    Raises
+    ------
+    FFmpegNotFoundError
+        ``FFMPEG_PATH`` 도 ``PATH`` 에도 ffmpeg 가 없을 때.
+    """
+    path = ffmpeg_executable()
+    if os.path.isfile(path) or shutil.which(path):
+        return path
+    raise FFmpegNotFoundError(
+        "ffmpeg 실행 파일을 찾을 수 없습니다. ffmpeg 를 설치해 PATH 에 추가하거나 "
+        "FFMPEG_PATH 환경 변수로 경로를 지정하세요."
+    )
+
+
+def configure_pydub() -> None:
+    """
+    pydub 이 :func:`ffmpeg_executable` 로 찾은 ffmpeg 를 사용하도록 설정합니다.
+
+    pydub 을 처음 사용하는 시점에 호출합니다.
+    """
+    from pydub import AudioSegment
+
+    AudioSegment.converter = ffmpeg_executable()
+
+
+def _ffmpeg_pcm_command(source: str, sample_rate: int) -> list:
+    """source 를 s16le 모노 PCM 으로 stdout 에 출력하는 ffmpeg 명령을 만든다."""
+    return [
+        require_ffmpeg(),
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-i", source,
+        "-vn",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
+        "pipe:1",
+    ]
+
+
+def decode_to_pcm(source: str, sample_rate: int = PCM_SAMPLE_RATE) -> bytes:
+    """
+    오디오/영상 파일을 한 번의 디코딩으로 모노 16-bit PCM 바이트로 변환합니다.
+
+    Parameters
+    ----------
+    source : str
+        디코딩할 파일 경로 (ffmpeg 가 읽을 수 있는 모든 형식).
+    sample_rate : int, optional
+        출력 샘플링 레이트. 기본값은 16000Hz.
+
+    Returns
+    -------
+    bytes
+        리틀 엔디언 16-bit 모노 PCM 바이트열.
+
+    Raises
+    ------
+    RuntimeError
+        ffmpeg 가 0 이 아닌 종료 코드를 반환했을 때 발생합니다.
+    """
+    with _decode_limiter.slot():
+        proc = subprocess.run(
+            _ffmpeg_pcm_command(source, sample_rate),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg 디코딩 실패: {proc.stderr.decode('utf-8', 'replace').strip()}")
+    return proc.stdout
+
+
+def iter_pcm_chunks(
+    source: str,
+    sample_rate: int = PCM_SAMPLE_RATE,
+    chunk_seconds: float = 10.0,
+) -> Iterator[bytes]:
+    """
+    ffmpeg 디코딩 결과를 ``chunk_seconds`` 길이의 PCM 바이트로 나누어 순차 반환합니다.
+
+    디코딩이 끝나기 전에 앞부분부터 소비할 수 있어, 음성 인식과 디코딩이
+    겹쳐서 진행되고 메모리 사용량도 청크 크기로 제한됩니다.
+
+    ffmpeg 프로세스는 호출한 쪽이 청크를 음성 인식하는 동안에도 (파이프가 차서
+    멈춘 채로) 살아 있으므로, 제너레이터가 끝나거나 닫힐 때까지 동시 디코딩 슬롯
+    하나를 점유합니다. 따라서 :func:`set_max_concurrent_decodes` 는 스트리밍 전사
+    전체(디코딩 + 인식)의 동시 실행 수를 제한합니다. ffmpeg 의 stderr 는 임시 파일로
+    받으므로 오류 출력이 많아도 파이프가 막히지 않습니다.
+
+    Parameters
+    ----------
+    source : str
+        디코딩할 파일 경로.
+    sample_rate : int, optional
+        출력 샘플링 레이트. 기본값은 16000Hz.
+    chunk_seconds : float, optional
+        한 번에 반환할 PCM 길이(초). 기본값은 10초.
+
+    Yields
+    ------
+    bytes
+        16-bit 모노 PCM 바이트열 (마지막 청크는 더 짧을 수 있음).
+
+    Raises
+    ------
+    RuntimeError
+        ffmpeg 가 0 이 아닌 종료 코드를 반환했을 때 발생합니다.
+    """
+    chunk_bytes = max(PCM_SAMPLE_WIDTH, int(sample_rate * chunk_seconds) * PCM_SAMPLE_WIDTH)
+    with _decode_limiter.slot():
+        # stderr 를 파이프로 받으면 stdout 을 다 읽기 전에 버퍼(~64KB)가 차서
+        # ffmpeg 가 멈출 수 있으므로 임시 파일로 받는다
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(
+                _ffmpeg_pcm_command(source, sample_rate),
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+            try:
+                while True:
+                    data = proc.stdout.read(chunk_bytes)
+                    if not data:
+                        break
+                    yield data
+                if proc.wait() != 0:
+                    stderr.seek(0)
+                    message = stderr.read().decode("utf-8", "replace").strip()
+                    raise RuntimeError(f"ffmpeg 디코딩 실패: {message}")
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+
+def write_wav(path: str, pcm: bytes, sample_rate: int = PCM_SAMPLE_RATE) -> int:
+    """
+    16-bit 모노 PCM 바이트를 재인코딩 없이 WAV 파일로 저장합니다.
+
+    Parameters
+    ----------
+    path : str
+        저장할 WAV 파일 경로.
+    pcm : bytes
+        16-bit 모노 PCM 바이트열.
+    sample_rate : int, optional
+        샘플링 레이트. 기본값은 16000Hz.
+
+    Returns
+    -------
+    int
+        디스크에 기록된 파일 크기(바이트).
+    """
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(PCM_SAMPLE_WIDTH)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return os.path.getsize(path)
@@ -0,0 +1,254 @@
+# datamood/audio/transcript_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+"""
+datamood.audio.transcript_cache
+-------------------------------
+디코딩된 오디오 지문(fingerprint) 기반 음성 인식 결과 캐시
+
+모든 형식을 같은 ffmpeg 디코딩 경로로 16kHz 모노 PCM 으로 정규화한 뒤 해시하므로,
+같은 파일이 다른 이름으로 들어오거나 무손실 포맷(wav, flac ...) 사이에서 다시
+인코딩되어도 같은 키를 얻습니다. mp3 등 손실 압축으로 다시 인코딩한 파일은 디코딩된
+PCM 이 달라지므로 다른 키가 됩니다.
+
+주요 함수/클래스
+- normalize_pcm(path): 오디오 파일을 16kHz 모노 16-bit PCM 바이트로 디코딩
+- transcript_key(pcm, backend, language): PCM + 인식 백엔드 + 언어로 캐시 키 생성
+- transcript_hasher(backend, language): 스트리밍 PCM 용 증분 해시 객체 생성
+- TranscriptCache: SQLite 기반, 크기 제한 LRU 캐시
+"""
+
+# 지문 계산에 사용하는 정규화 포맷
+NORMALIZED_SAMPLE_RATE = 16000
+NORMALIZED_SAMPLE_WIDTH = 2
+
+
+def normalize_pcm(audio_file_path: str) -> bytes:
+    """
+    오디오 파일을 16kHz / 모노 / 16-bit PCM 바이트로 디코딩합니다.
+
+    Parameters
+    ----------
+    audio_file_path : str
+        디코딩할 오디오 파일 경로.
+
+    Returns
+    -------
+    bytes
+        리틀 엔디언 16-bit 모노 PCM 바이트열.
+
+    Notes
+    -----
+    형식에 관계없이 ffmpeg 파이프(:func:`datamood.audio.ffmpeg_io.decode_to_pcm`)로
+    디코딩합니다. 디코더/리샘플러가 하나이므로 같은 오디오는 어떤 무손실 컨테이너로
+    들어와도 같은 PCM 바이트가 되며, 스트리밍 경로(:func:`iter_pcm_chunks`)의 지문과도
+    일치합니다. 중간 파일은 만들지 않습니다.
+    """
+    from .ffmpeg_io import decode_to_pcm
+
+    return decode_to_pcm(audio_file_path, NORMALIZED_SAMPLE_RATE)
+
+
+def transcript_key(pcm: bytes, backend: str, language: str) -> str:
+    """
+    정규화된 PCM 과 인식 백엔드, 언어 코드로 캐시 키를 만듭니다.
+
+    Parameters
+    ----------
+    pcm : bytes
+        :func:`normalize_pcm` 으로 얻은 PCM 바이트열.
+    backend : str
+        음성 인식 백엔드 이름 (예: ``'google'``).
+    language : str
+        음성 인식 언어 코드 (예: ``'ko-KR'``).
+
+    Returns
+    -------
+    str
+        SHA-256 16진수 문자열.
+    """
+    h = transcript_hasher(backend, language)
+    h.update(pcm)
+    return h.hexdigest()
+
+
+def transcript_hasher(backend: str, language: str):
+    """
+    PCM 을 나누어 받을 때 사용할 증분 해시 객체를 만듭니다.
+
+    모든 PCM 바이트를 ``update()`` 한 뒤의 ``hexdigest()`` 는
+    :func:`transcript_key` 의 결과와 같습니다.
+
+    Parameters
+    ----------
+    backend : str
+        음성 인식 백엔드 이름.
+    language : str
+        음성 인식 언어 코드.
+
+    Returns
+    -------
+    hashlib._Hash
+        백엔드/언어 정보가 먼저 반영된 SHA-256 해시 객체.
+    """
+    h = hashlib.sha256()
+    h.update(f"{backend}\0{language}\0".encode("utf-8"))
+    return h
+
+
+class TranscriptCache:
+    """
+    음성 인식 결과를 SQLite 파일에 저장하는 크기 제한 LRU 캐시.
+
+    저장된 텍스트의 총 바이트 수가 ``max_bytes`` 를 넘으면 가장 오래 사용되지
+    않은 항목부터 삭제합니다. 여러 스레드에서 함께 사용해도 안전합니다.
+
+    Parameters
+    ----------
+    path : str, optional
+        캐시 SQLite 파일 경로. 기본값은 ``~/.cache/datamood/transcripts.sqlite``.
+    max_bytes : int, optional
+        캐시에 보관할 텍스트의 최대 총 크기(바이트). 기본값은 64MB.
+
+    Examples
+    --------
+    >>> cache = TranscriptCache("cache.sqlite")
+    >>> preprocessor = AudioPreprocessor(cache=cache)
+    >>> preprocessor.extract_text_from_audio("a.wav")   # STT 수행
+    >>> preprocessor.extract_text_from_audio("renamed_copy_of_a.wav")  # 캐시 적중 (내용이 같음)
+    >>> cache.stats()["hit_rate"]
+    0.5
+    """
+
+    DEFAULT_PATH = os.path.join("~", ".cache", "datamood", "transcripts.sqlite")
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024):
+        self.path = os.path.expanduser(path or self.DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_transcripts_access ON transcripts (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시에서 인식 결과를 조회합니다. 적중 시 접근 시각을 갱신합니다.
+
+        Parameters
+        ----------
+        key : str
+            :func:`transcript_key` 로 만든 캐시 키.
+
+        Returns
+        -------
+        str or None
+            캐시된 텍스트. 없으면 ``None``.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM transcripts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE transcripts SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        """
+        인식 결과를 캐시에 저장하고, 용량을 넘으면 LRU 순서로 정리합니다.
+
+        Parameters
+        ----------
+        key : str
+            캐시 키.
+        text : str
+            저장할 인식 결과 텍스트.
+        """
+        size = len(text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (key, text, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """총 크기가 ``max_bytes`` 이하가 될 때까지 오래된 항목을 삭제한다."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM transcripts").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM transcripts ORDER BY last_access ASC"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM transcripts WHERE key = ?", stale)
+
+    def stats(self) -> dict:
+        """
+        캐시 적중 통계를 반환합니다.
+
+        Returns
+        -------
+        dict
+            hits, misses, hit_rate, entries, bytes 키를 포함하는 딕셔너리.
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM transcripts"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def clear(self) -> None:
+        """캐시의 모든 항목을 삭제하고 통계를 초기화합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM transcripts")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,309 @@
+# datamood/audio/vad.py
+import wave
+from typing import List, Tuple
+
+import numpy as np
+
+"""
+datamood.audio.vad
+------------------
+NumPy 기반 음성 구간 검출(VAD, Voice Activity Detection) 모듈
+
+주요 함수
+- read_wav_pcm(path): WAV 파일의 PCM 샘플을 NumPy 배열로 읽기
+- speech_frame_mask(energy_db, zcr): 프레임별 발화 여부 판정
+- detect_speech_segments(samples, sample_rate): 에너지/영교차율 기반 발화 구간 검출
+- plan_chunks(segments, max_chunk_seconds): 무음 경계를 기준으로 STT 요청 단위 구성
+- summarize_segments(segments, total_seconds): STT 절감 시간 리포트 생성
+"""
+
+# (시작 초, 끝 초) 형태의 구간
+Segment = Tuple[float, float]
+
+# int16 PCM 의 최대 진폭 (dBFS 계산 기준)
+_INT16_FULL_SCALE = 32768.0
+
+
+def read_wav_pcm(path: str) -> Tuple[np.ndarray, int]:
+    """
+    WAV 파일을 읽어 16-bit 모노 PCM 샘플 배열과 샘플링 레이트를 반환합니다.
+
+    16-bit 모노 WAV 는 파일에서 읽은 바이트 버퍼를 ``np.frombuffer`` 로
+    그대로 감싸므로 추가 복사가 발생하지 않습니다. 그 외 형식(8/32-bit, 스테레오)은
+    int16 모노로 한 번만 변환합니다.
+
+    Parameters
+    ----------
+    path : str
+        읽을 WAV 파일 경로.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, int]
+        (int16 모노 샘플 배열, 샘플링 레이트) 튜플.
+
+    Raises
+    ------
+    wave.Error
+        WAV 형식이 아닌 파일일 때 발생합니다.
+    ValueError
+        지원하지 않는 샘플 폭(예: 24-bit)일 때 발생합니다.
+    """
+    with wave.open(path, "rb") as wf:
+        channels = wf.getnchannels()
+        sample_width = wf.getsampwidth()
+        sample_rate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+
+    if sample_width == 2:
+        samples = np.frombuffer(frames, dtype="<i2")
+    elif sample_width == 1:
+        # 8-bit WAV 는 부호 없는 정수(0~255)로 저장됨
+        samples = ((np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128) << 8)
+    elif sample_width == 4:
+        samples = (np.frombuffer(frames, dtype="<i4") >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"지원하지 않는 샘플 폭입니다: {sample_width * 8}-bit")
+
+    if channels > 1:
+        # 채널 평균으로 다운믹스
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+
+    return samples, sample_rate
+
+
+def frame_features(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: float = 30.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    샘플 배열을 겹치지 않는 프레임으로 나누어 프레임별 에너지(dBFS)와
+    영교차율(zero-crossing rate)을 계산합니다.
+
+    프레임 분할은 ``reshape`` 뷰로 처리하므로 샘플 버퍼를 복사하지 않습니다.
+
+    Parameters
+    ----------
+    samples : numpy.ndarray
+        int16 모노 PCM 샘플 배열.
+    sample_rate : int
+        샘플링 레이트(Hz).
+    frame_ms : float, optional
+        프레임 길이(밀리초). 기본값은 30ms.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        (프레임별 에너지(dBFS), 프레임별 영교차율) 튜플.
+    """
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        return np.empty(0), np.empty(0)
+
+    frames = samples[: n_frames * frame_len].reshape(n_frames, frame_len)
+
+    # 제곱합을 float64 로 누적 (int16 오버플로 방지)
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_len
+    rms = np.sqrt(energy) / _INT16_FULL_SCALE
+    energy_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame_len
+
+    return energy_db, zcr
+
+
+def speech_frame_mask(
+    energy_db: np.ndarray,
+    zcr: np.ndarray,
+    threshold_margin_db: float = 12.0,
+    min_threshold_db: float = -50.0,
+    zcr_threshold: float = 0.25,
+) -> np.ndarray:
+    """
+    프레임별 에너지/영교차율로 발화 프레임 여부를 판정합니다.
+
+    하위 10% 프레임 에너지를 잡음 바닥으로 추정하고, 여기에
+    ``threshold_margin_db`` 를 더한 값(하한 ``min_threshold_db``)을 임계값으로 씁니다.
+
+    Parameters
+    ----------
+    energy_db : numpy.ndarray
+        :func:`frame_features` 의 프레임별 에너지(dBFS).
+    zcr : numpy.ndarray
+        :func:`frame_features` 의 프레임별 영교차율.
+    threshold_margin_db : float, optional
+        잡음 바닥 대비 발화 판정 여유(dB).
+    min_threshold_db : float, optional
+        임계값의 하한(dBFS).
+    zcr_threshold : float, optional
+        무성음 판정에 사용할 영교차율 임계값.
+
+    Returns
+    -------
+    numpy.ndarray
+        프레임별 발화 여부(bool) 배열.
+    """
+    if energy_db.size == 0:
+        return np.zeros(0, dtype=bool)
+    noise_floor = float(np.percentile(energy_db, 10))
+    threshold = max(noise_floor + threshold_margin_db, min_threshold_db)
+    return (energy_db > threshold) | ((energy_db > threshold - 6.0) & (zcr > zcr_threshold))
+
+
+def detect_speech_segments(
+    samples: np.ndarray,
+    sample_rate: int,
+    frame_ms: float = 30.0,
+    padding_ms: float = 200.0,
+    min_speech_ms: float = 120.0,
+    min_silence_ms: float = 300.0,
+    threshold_margin_db: float = 12.0,
+    min_threshold_db: float = -50.0,
+    zcr_threshold: float = 0.25,
+) -> List[Segment]:
+    """
+    에너지와 영교차율을 이용해 발화 구간을 검출합니다.
+
+    1. 하위 10% 프레임 에너지를 잡음 바닥(noise floor)으로 추정하고,
+       여기에 ``threshold_margin_db`` 를 더한 값을 임계값으로 사용합니다.
+    2. 임계값을 넘는 프레임, 또는 임계값보다 6dB 이내이면서 영교차율이 높은
+       프레임(무성 자음 등)을 발화 프레임으로 판정합니다.
+    3. ``min_speech_ms`` 보다 짧은 구간은 버리고, 앞뒤로 ``padding_ms`` 만큼
+       여유를 준 뒤 ``min_silence_ms`` 보다 짧은 무음으로 떨어진 구간은 병합합니다.
+
+    Parameters
+    ----------
+    samples : numpy.ndarray
+        int16 모노 PCM 샘플 배열.
+    sample_rate : int
+        샘플링 레이트(Hz).
+    frame_ms : float, optional
+        분석 프레임 길이(밀리초).
+    padding_ms : float, optional
+        각 발화 구간 앞뒤에 덧붙일 여유 구간(밀리초).
+    min_speech_ms : float, optional
+        발화로 인정할 최소 길이(밀리초).
+    min_silence_ms : float, optional
+        구간을 나누는 최소 무음 길이(밀리초).
+    threshold_margin_db : float, optional
+        잡음 바닥 대비 발화 판정 여유(dB).
+    min_threshold_db : float, optional
+        임계값의 하한(dBFS). 완전 무음 파일에서 잡음을 발화로 보지 않도록 합니다.
+    zcr_threshold : float, optional
+        무성음 판정에 사용할 영교차율 임계값.
+
+    Returns
+    -------
+    list of tuple[float, float]
+        (시작 초, 끝 초) 형태의 발화 구간 목록. 발화가 없으면 빈 리스트.
+    """
+    energy_db, zcr = frame_features(samples, sample_rate, frame_ms)
+    if energy_db.size == 0:
+        return []
+
+    is_speech = speech_frame_mask(
+        energy_db, zcr, threshold_margin_db, min_threshold_db, zcr_threshold
+    )
+    if not is_speech.any():
+        return []
+
+    # 발화 프레임 구간의 시작/끝 인덱스 (np.diff 로 경계 검출)
+    edges = np.diff(np.concatenate(([0], is_speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    frame_sec = frame_ms / 1000.0
+    total_sec = len(samples) / sample_rate
+    pad = padding_ms / 1000.0
+    min_speech = min_speech_ms / 1000.0
+    min_silence = min_silence_ms / 1000.0
+
+    segments: List[Segment] = []
+    for s, e in zip(starts, ends):
+        start, end = float(s * frame_sec), float(e * frame_sec)
+        if end - start < min_speech:
+            continue
+        start, end = max(0.0, start - pad), min(total_sec, end + pad)
+        if segments and start - segments[-1][1] < min_silence:
+            segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+
+    return segments
+
+
+def plan_chunks(segments: List[Segment], max_chunk_seconds: float = 50.0) -> List[List[Segment]]:
+    """
+    발화 구간을 STT 요청 단위(청크)로 묶습니다.
+
+    청크는 연속된 발화 구간의 묶음이며, 인식 시에는 각 구간의 샘플만 이어 붙여
+    전송하므로 구간 사이의 무음은 전송되지 않습니다. 발화 길이의 합이
+    ``max_chunk_seconds`` 를 넘으면 새 청크를 시작하므로 청크 경계는 항상 무음
+    구간에 놓입니다. 하나의 발화 구간이 ``max_chunk_seconds`` 보다 길면 같은 길이로
+    나눕니다.
+
+    Parameters
+    ----------
+    segments : list of tuple[float, float]
+        :func:`detect_speech_segments` 의 결과.
+    max_chunk_seconds : float, optional
+        청크 하나에 담을 최대 발화 길이(초). 기본값은 50초.
+
+    Returns
+    -------
+    list of list of tuple[float, float]
+        청크별 (시작 초, 끝 초) 구간 목록.
+    """
+    chunks: List[List[Segment]] = []
+    chunk_seconds = 0.0
+    for start, end in segments:
+        if end - start > max_chunk_seconds:
+            n = int(np.ceil((end - start) / max_chunk_seconds))
+            step = (end - start) / n
+            pieces = [(start + i * step, start + (i + 1) * step) for i in range(n)]
+        else:
+            pieces = [(start, end)]
+
+        for piece in pieces:
+            duration = piece[1] - piece[0]
+            if chunks and chunk_seconds + duration <= max_chunk_seconds:
+                chunks[-1].append(piece)
+                chunk_seconds += duration
+            else:
+                chunks.append([piece])
+                chunk_seconds = duration
+
+    return chunks
+
+
+def summarize_segments(segments: List[Segment], total_seconds: float) -> dict:
+    """
+    발화 구간 목록으로부터 STT 절감 리포트를 만듭니다.
+
+    Parameters
+    ----------
+    segments : list of tuple[float, float]
+        STT 에 실제로 전송된 구간 목록.
+    total_seconds : float
+        원본 오디오 전체 길이(초).
+
+    Returns
+    -------
+    dict
+        다음 키를 포함하는 딕셔너리.
+
+        - total_seconds: 원본 길이(초)
+        - speech_seconds: STT 로 전송된 길이(초)
+        - saved_seconds: 전송을 생략한 길이(초)
+        - segments: 구간 개수
+    """
+    speech = sum(end - start for start, end in segments)
+    return {
+        "total_seconds": round(total_seconds, 2),
+        "speech_seconds": round(speech, 2),
+        "saved_seconds": round(max(0.0, total_seconds - speech), 2),
+        "segments": len(segments),
+    }
@@ -1,18 +1,271 @@
 # cli.py
 import argparse
+import sys
+import threading
+import time
 from pathlib import Path
 
-from datamood import MoodSorter
 from datamood.utils import iter_input_files
+from datamood.youtube_pipeline import is_youtube_collection_url
+
+
+def print_timeline_entry(entry: dict) -> None:
+    """타임라인 항목 하나를 [mm:ss-mm:ss] 형식으로 출력한다."""
+    start, end = int(entry["start"]), int(entry["end"])
+    print(
+        f"[{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}] "
+        f"{entry['label']} ({entry['percentage']}) {entry['text'][:40]}"
+    )
+
+
+def query_main(argv: list) -> None:
+    """``datamood query``: 레이블 인덱스에서 조건에 맞는 파일을 찾고, 필요하면 정렬한다."""
+    parser = argparse.ArgumentParser(
+        prog="datamood query",
+        description="--index-only 로 만든 레이블 인덱스에서 조건에 맞는 파일 경로를 출력",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="sorted",
+        help="인덱스가 있는 출력 루트 디렉토리 (기본: ./sorted)",
+    )
+    parser.add_argument("--index", help="인덱스 파일 경로 (기본: <output>/.datamood_index.sqlite)")
+    parser.add_argument("--label", action="append", help="감정 레이블 (여러 번 지정하면 그중 하나)")
+    parser.add_argument("--type", choices=["text", "audio", "unknown"], help="파일 타입")
+    parser.add_argument("--min-score", type=float, help="최소 감정 점수")
+    parser.add_argument("--max-score", type=float, help="최대 감정 점수")
+    parser.add_argument("--min-percentage", type=float, help="최소 백분율")
+    parser.add_argument("--max-percentage", type=float, help="최대 백분율")
+    parser.add_argument("--limit", type=int, help="최대 결과 수")
+    parser.add_argument(
+        "-l", "--long", action="store_true", help="경로와 함께 타입/레이블/점수/백분율 출력"
+    )
+    parser.add_argument("--counts", action="store_true", help="레이블별 파일 수만 출력")
+    parser.add_argument(
+        "--sort-to",
+        metavar="DIR",
+        help="결과 파일을 DIR/<레이블>/ 아래로 정렬 (다시 분석하지 않음)",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=["copy", "move", "hardlink", "reflink", "symlink"],
+        default="copy",
+        help="--sort-to 에서 파일을 배치하는 방식 (기본: copy)",
+    )
+    args = parser.parse_args(argv)
+
+    from datamood import LabelIndex
+
+    index_path = Path(args.index) if args.index else Path(args.output) / LabelIndex.FILENAME
+    if not index_path.exists():
+        parser.error(f"인덱스 파일이 없습니다: {index_path} (먼저 --index-only 로 분석하세요)")
+
+    filters = {
+        "label": args.label,
+        "type": args.type,
+        "min_score": args.min_score,
+        "max_score": args.max_score,
+        "min_percentage": args.min_percentage,
+        "max_percentage": args.max_percentage,
+        "limit": args.limit,
+    }
+    with LabelIndex(index_path) as index:
+        if args.counts:
+            for label, count in index.labels().items():
+                print(f"{label}\t{count}")
+            return
+
+        if args.sort_to:
+            from datamood import MoodSorter
+
+            count = 0
+            for result in MoodSorter().sort_from_index(
+                index, args.sort_to, link_mode=args.link_mode, **filters
+            ):
+                if result["sorted_path"]:
+                    count += 1
+                    print(f"{result['path']} -> {result['link_mode']}: {result['sorted_path']}")
+            print(f"완료: {count}개 파일 정렬")
+            return
+
+        for entry in index.query(**filters):
+            if args.long:
+                print(
+                    f"{entry['path']}\t{entry['type']}\t{entry['label']}\t"
+                    f"{entry['score']}\t{entry['percentage']}"
+                )
+            else:
+                print(entry["path"])
+
+
+def watch_main(argv: list) -> None:
+    """``datamood watch``: 디렉토리를 감시하며 들어오는 파일을 바로 분석/정렬한다."""
+    parser = argparse.ArgumentParser(
+        prog="datamood watch",
+        description="디렉토리에 파일이 들어오는 대로 감정 레이블별로 정렬 (Ctrl+C 로 종료)",
+    )
+    parser.add_argument("directory", help="감시할 수신 디렉토리")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="정렬된 파일을 저장할 루트 디렉토리 (기본: <directory>/sorted)",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=["copy", "move", "hardlink", "reflink", "symlink"],
+        help="정렬 폴더에 파일을 배치하는 방식 (기본: copy)",
+    )
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="파일을 정렬하지 않고 레이블 인덱스에만 기록 (조회: datamood query)",
+    )
+    parser.add_argument("--index", help="--index-only 인덱스 파일 경로")
+    parser.add_argument("--include", action="append", metavar="GLOB", help="처리할 파일 glob")
+    parser.add_argument("--exclude", action="append", metavar="GLOB", help="제외할 파일/디렉토리 glob")
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=0.5,
+        help="파일이 완성된 것으로 볼 때까지 변화가 없어야 하는 시간(초) (기본: 0.5)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="폴링 방식일 때 디렉토리를 다시 읽는 간격(초) (기본: 2.0)",
+    )
+    parser.add_argument("--polling", action="store_true", help="inotify 대신 항상 폴링으로 감시")
+    parser.add_argument("--batch-size", type=int, default=64, help="한 번에 처리할 최대 파일 수 (기본: 64)")
+    parser.add_argument(
+        "--skip-existing", action="store_true", help="감시 시작 전에 있던 파일은 처리하지 않음"
+    )
+    parser.add_argument(
+        "--acoustic",
+        choices=["prescreen", "fallback"],
+        help="오디오에 음향 기반 감정 추정 사용",
+    )
+    parser.add_argument("--results-file", metavar="PATH", help="결과를 구조화된 레코드로 저장할 파일")
+    parser.add_argument(
+        "--output-format",
+        choices=["jsonl", "csv"],
+        help="--results-file 형식 (기본: 확장자, 알 수 없으면 jsonl). 묶음마다 파일에 기록",
+    )
+    args = parser.parse_args(argv)
+    if args.output_format and not args.results_file:
+        parser.error("--output-format 에는 --results-file 이 필요합니다.")
+    if args.results_file:
+        from datamood.results import result_format
+
+        # Parquet 은 종료할 때 footer 를 쓰므로, 감시 중 강제 종료되면 결과를 모두 잃는다
+        if result_format(args.results_file, args.output_format) == "parquet":
+            parser.error("watch 에서는 parquet 결과 파일을 쓸 수 없습니다. jsonl 또는 csv 를 사용하세요.")
+
+    from datamood import MoodSorter
+    from datamood.watch import InboxWatcher
+
+    directory = Path(args.directory)
+    output_root = Path(args.output) if args.output else directory / "sorted"
+
+    # 정렬 결과가 감시 디렉토리 안에 있으면 다시 감지하지 않도록 제외
+    exclude = list(args.exclude or [])
+    try:
+        exclude.append(output_root.resolve().relative_to(directory.resolve()).as_posix())
+    except ValueError:
+        pass
+
+    watcher = InboxWatcher(
+        directory,
+        settle_seconds=args.settle,
+        poll_interval=args.poll_interval,
+        include=args.include,
+        exclude=exclude,
+        use_inotify=False if args.polling else None,
+        existing=not args.skip_existing,
+    )
+
+    # 분석기를 한 번만 만들어 두고 계속 재사용 (파일마다 JVM 기동 없음)
+    sorter = MoodSorter(acoustic_mode=args.acoustic)
+    started = time.perf_counter()
+    sorter.warm_up()
+    print(f"[INFO] 분석기 준비: {time.perf_counter() - started:.2f}s")
+
+    if args.index_only:
+        from datamood import LabelIndex
+
+        store = LabelIndex(args.index) if args.index else LabelIndex.for_output(output_root)
+    else:
+        from datamood import SortManifest
+
+        store = SortManifest(output_root)
+
+    writer = None
+    if args.results_file:
+        from datamood.results import open_result_writer
+
+        writer = open_result_writer(args.results_file, args.output_format)
+
+    print(f"[INFO] 감시 시작 ({watcher.mode}): {directory} -> {output_root}")
+    count = 0
+    try:
+        for batch in watcher.batches(max_batch=args.batch_size):
+            started = time.perf_counter()
+            for p in batch:
+                try:
+                    if args.index_only:
+                        result = sorter.index_file(p, store)
+                        detail = "인덱스" if result["indexed"] else "변경 없음"
+                    else:
+                        result = sorter.sort_file(
+                            p, output_root, link_mode=args.link_mode, manifest=store
+                        )
+                        detail = (
+                            "변경 없음" if result["manifest"] == "unchanged"
+                            else f"{result['link_mode']}: {result['sorted_path']}"
+                        )
+                except Exception as e:
+                    print(f"[ERROR] {p}: {e}")
+                    continue
+                count += 1
+                if writer is not None:
+                    writer.write(result)
+                print(f"[{count}] [{result['type']}] {p.name} -> {result['emotion_label']} ({detail})")
+            # 묶음마다 기록을 저장해 중단되어도 처리한 파일은 다시 분석하지 않음
+            store.flush()
+            if writer is not None:
+                writer.flush()
+            elapsed = time.perf_counter() - started
+            print(f"[INFO] {len(batch)}개 처리 ({elapsed * 1000 / len(batch):.1f}ms/파일)")
+    except KeyboardInterrupt:
+        print(f"\n감시 종료: 총 {count}개 파일 처리")
+    finally:
+        store.close()
+        watcher.close()
+        if writer is not None:
+            writer.close()
+
+
+# 하위 명령: 첫 번째 인자가 이 이름이면 해당 함수로 처리
+COMMANDS = {
+    "query": query_main,
+    "watch": watch_main,
+}
 
 
 def main() -> None:
     """datamood 명령행 인터페이스의 엔트리 포인트."""
 
+    argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
 
     parser = argparse.ArgumentParser(
         prog="datamood",
         description="텍스트 / 오디오 파일 또는 YouTube URL을 감정 레이블별로 분석/정렬하는 CLI",
+        epilog="하위 명령: datamood query --help (레이블 인덱스 조회/정렬), "
+               "datamood watch --help (수신 디렉토리 감시)",
     )
 
 
@@ -26,7 +279,110 @@ def main() -> None:
     # YouTube URL 분석 기능 추가
     parser.add_argument(
         "--youtube",
-        help="YouTube URL에서 오디오를 추출하여 감정 분석",
+        action="append",
+        help="YouTube URL(영상/재생목록/채널)에서 오디오를 추출하여 감정 분석 (여러 번 지정 가능)",
+    )
+
+    parser.add_argument(
+        "--youtube-list",
+        help="분석할 YouTube URL 목록 파일 (한 줄에 하나)",
+    )
+
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=4,
+        help="YouTube 일괄 분석 시 동시 다운로드 수 (기본: 4)",
+    )
+
+    parser.add_argument(
+        "--stt-workers",
+        type=int,
+        default=2,
+        help="YouTube 일괄 분석 시 동시 음성 인식 수 (기본: 2)",
+    )
+
+    parser.add_argument(
+        "--url-list",
+        help="감정 분석할 기사 URL 목록 파일 (한 줄에 하나, 동시에 수집/분석)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="기사 URL 일괄 분석 시 전체 동시 요청 수 (기본: 16)",
+    )
+
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=4,
+        help="기사 URL 일괄 분석 시 호스트별 동시 요청 수 (기본: 4)",
+    )
+
+    parser.add_argument(
+        "--http-cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="기사 URL 디스크 캐시 사용 (조건부 GET, 304 이면 파싱 생략). "
+             "경로 생략 시 ~/.cache/datamood/http.sqlite",
+    )
+
+    parser.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=7.0,
+        help="HTTP 캐시 항목 보관 기간(일) (기본: 7)",
+    )
+
+    parser.add_argument(
+        "--selector-cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="사이트별로 본문 셀렉터를 학습해 먼저 시도. "
+             "경로 생략 시 ~/.cache/datamood/selectors.sqlite",
+    )
+
+    parser.add_argument(
+        "--timeline",
+        action="store_true",
+        help="단일 YouTube URL 분석 시 구간별 감정 타임라인을 인식되는 대로 출력",
+    )
+
+    parser.add_argument(
+        "--max-decodes",
+        type=int,
+        help="동시에 실행할 ffmpeg 디코딩 수 (기본: CPU 코어 수)",
+    )
+
+    parser.add_argument(
+        "--acoustic",
+        choices=["prescreen", "fallback"],
+        help="오디오에 음향 기반 감정 추정 사용: prescreen=발화가 부족하면 STT 생략, "
+             "fallback=STT 실패 시에만 사용",
+    )
+
+    parser.add_argument(
+        "--sort",
+        action="store_true",
+        help="입력 디렉토리를 이름순으로 순회 (기본: 파일 시스템 순서로 바로 시작)",
+    )
+
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="이 glob 과 일치하는 파일만 처리 (상대 경로 또는 파일 이름, 여러 번 지정 가능)",
+    )
+
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="GLOB",
+        help="이 glob 과 일치하는 파일/디렉토리는 건너뜀 (여러 번 지정 가능)",
     )
 
     parser.add_argument(
@@ -39,28 +395,187 @@ def main() -> None:
     parser.add_argument(
         "--move",
         action="store_true",
-        help="복사 대신 파일을 이동시키기 (기본: 복사)",
+        help="복사 대신 파일을 이동시키기 (기본: 복사, --link-mode move 와 같음)",
+    )
+
+    parser.add_argument(
+        "--link-mode",
+        choices=["copy", "move", "hardlink", "reflink", "symlink"],
+        help="정렬 폴더에 파일을 배치하는 방식 (기본: copy). hardlink/reflink/symlink 를 "
+             "만들 수 없는 파일은 자동으로 복사",
+    )
+
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="파일을 정렬하지 않고 레이블/점수/백분율만 인덱스에 기록 "
+             "(조회/정렬: datamood query)",
+    )
+
+    parser.add_argument(
+        "--index",
+        help="--index-only 인덱스 파일 경로 (기본: <output>/.datamood_index.sqlite)",
+    )
+
+    parser.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help="출력 폴더의 정렬 기록(.datamood_manifest.sqlite)을 사용하지 않음 "
+             "(기본: 바뀌지 않은 파일은 건너뛰고 중단된 실행을 이어서 처리)",
+    )
+
+    parser.add_argument(
+        "--copy-workers",
+        type=int,
+        default=4,
+        metavar="N",
+        help="copy 방식일 때 분석과 별도로 동시에 복사할 작업자 수 (기본: 4, 0 이면 순서대로 복사)",
+    )
+
+    parser.add_argument(
+        "--verify",
+        choices=["size", "hash"],
+        help="복사 후 원본과 크기(size) 또는 내용 해시(hash)를 비교해 검증 (기본: 검증 안 함)",
+    )
+
+    parser.add_argument(
+        "--results-file",
+        metavar="PATH",
+        help="결과를 구조화된 레코드로 저장할 파일 (형식은 --output-format 또는 확장자로 결정)",
+    )
+
+    parser.add_argument(
+        "--output-format",
+        choices=["jsonl", "csv", "parquet"],
+        help="--results-file 형식 (기본: 확장자, 알 수 없으면 jsonl). parquet 은 pyarrow 필요",
     )
 
     args = parser.parse_args()
 
-    sorter = MoodSorter()
+    writer = None
+    if args.results_file:
+        from datamood.results import open_result_writer
+
+        writer = open_result_writer(args.results_file, args.output_format)
+    elif args.output_format:
+        parser.error("--output-format 에는 --results-file 이 필요합니다.")
+
+    try:
+        _run(parser, args, writer)
+    finally:
+        if writer is not None:
+            writer.close()
+            print(f"결과 {writer.count}건 저장 ({writer.format}): {writer.path}")
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace, writer) -> None:
+    """인자에 따라 YouTube / 기사 URL / 파일 모드를 실행한다. writer 가 있으면 결과를 기록한다."""
+    # 분석 컴포넌트는 인자 파싱 이후에 로드 (--help 를 가볍게 유지)
+    from datamood import MoodSorter
+
+    if args.max_decodes:
+        from datamood.audio.ffmpeg_io import set_max_concurrent_decodes
+
+        set_max_concurrent_decodes(args.max_decodes)
+
+    http_cache = None
+    if args.http_cache is not None:
+        from datamood.text import HttpCache
+
+        http_cache = HttpCache(args.http_cache or None, ttl_seconds=args.http_cache_ttl * 86400)
+
+    selector_cache = None
+    if args.selector_cache is not None:
+        from datamood.text import SelectorCache
+
+        selector_cache = SelectorCache(args.selector_cache or None)
+
+    sorter = MoodSorter(
+        acoustic_mode=args.acoustic, http_cache=http_cache, selector_cache=selector_cache
+    )
 
     # -----------------------------
     #   YouTube 분석 모드
     # -----------------------------
-    if args.youtube:
-        print(f"[INFO] YouTube URL 분석 시작: {args.youtube}")
-        result = sorter.analyze_youtube(args.youtube)
+    youtube_urls = list(args.youtube or [])
+    if args.youtube_list:
+        youtube_urls += Path(args.youtube_list).read_text(encoding="utf-8").split()
+
+    if len(youtube_urls) == 1 and not is_youtube_collection_url(youtube_urls[0]):
+        print(f"[INFO] YouTube URL 분석 시작: {youtube_urls[0]}")
+        if args.timeline:
+            result = sorter.analyze_youtube(
+                youtube_urls[0], timeline=True, on_segment=print_timeline_entry
+            )
+        else:
+            result = sorter.analyze_youtube(youtube_urls[0])
+        if writer is not None:
+            writer.write(result)
         print(
             f"[YouTube] {result['url']} -> {result['emotion_label']}\n"
-            f"인식된 텍스트 일부: {result['raw'].get('recognized_text', '')[:50]}..."
+            f"인식된 텍스트 일부: {(result['raw'].get('recognized_text') or '')[:50]}..."
         )
         return
 
+    # 여러 URL 또는 재생목록/채널: 파이프라인으로 처리하며 끝나는 대로 출력
+    if youtube_urls:
+        print(f"[INFO] YouTube 일괄 분석 시작: 입력 {len(youtube_urls)}개")
+        done = 0
+        for result in sorter.analyze_youtube_batch(
+            youtube_urls,
+            download_workers=args.download_workers,
+            stt_workers=args.stt_workers,
+        ):
+            done += 1
+            if writer is not None:
+                writer.write(result)
+            raw = result["raw"]
+            detail = raw.get("error") or f"{(raw.get('recognized_text') or '')[:30]}..."
+            print(f"[YouTube {done}] {result['url']} -> {result['emotion_label']} ({detail})")
+        return
+
+    # -----------------------------
+    #   기사 URL 일괄 분석 모드
+    # -----------------------------
+    if args.url_list:
+        urls = Path(args.url_list).read_text(encoding="utf-8").split()
+        print(f"[INFO] 기사 URL 일괄 분석 시작: {len(urls)}개")
+        done = failed = skipped = 0
+        for result in sorter.analyze_urls(
+            urls, max_concurrency=args.concurrency, per_host=args.per_host
+        ):
+            done += 1
+            if writer is not None:
+                writer.write(result)
+            if result["status"] == "error":
+                failed += 1
+                print(f"[URL {done}] {result['url']} -> 실패 ({result['raw']['error']})")
+            elif result["status"] == "skipped":
+                skipped += 1
+                print(f"[URL {done}] {result['url']} -> 건너뜀 ({result['raw']['skipped']})")
+            else:
+                truncated = result["raw"].get("truncated")
+                note = f" (잘림: {truncated})" if truncated else ""
+                print(f"[URL {done}] {result['url']} -> {result['emotion_label']}{note}")
+        print(f"완료: {done}개 (실패 {failed}개, 건너뜀 {skipped}개)")
+        if http_cache is not None:
+            stats = http_cache.stats()
+            print(
+                f"HTTP 캐시: 304 {stats['not_modified']}개, 신규 {stats['miss']}개, "
+                f"적중률 {stats['hit_rate']:.0%}"
+            )
+        if selector_cache is not None:
+            selector_cache.flush()
+            stats = selector_cache.stats()
+            print(
+                f"셀렉터 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회, "
+                f"학습된 사이트 {stats['learned']}개"
+            )
+        return
+
     # YouTube가 아닌 경우 input은 필수
     if not args.input:
-        parser.error("input 경로 또는 --youtube 중 하나는 반드시 지정해야 합니다.")
+        parser.error("input 경로, --youtube 또는 --url-list 중 하나는 반드시 지정해야 합니다.")
 
     input_path = Path(args.input)
     output_root = Path(args.output)
@@ -68,19 +583,101 @@ def main() -> None:
     # -----------------------------
     #   파일 정렬 모드
     # -----------------------------
-    files = list(iter_input_files(input_path))
-    if not files:
-        print(f"[WARN] 입력 경로에서 파일을 찾지 못했습니다: {input_path}")
+    # 출력 폴더가 입력 폴더 안에 있으면 정렬된 결과를 다시 순회하지 않도록 제외
+    exclude = list(args.exclude or [])
+    try:
+        exclude.append(output_root.resolve().relative_to(input_path.resolve()).as_posix())
+    except ValueError:
+        pass
+
+    if args.index_only:
+        from datamood import LabelIndex
+
+        index = LabelIndex(args.index) if args.index else LabelIndex.for_output(output_root)
+        print("파일 분석 시작 (인덱스만 기록)...")
+        count = indexed = 0
+        try:
+            for p in iter_input_files(input_path, sort=args.sort, include=args.include, exclude=exclude):
+                count += 1
+                result = sorter.index_file(p, index)
+                if writer is not None:
+                    writer.write(result)
+                if result["indexed"]:
+                    indexed += 1
+                    print(f"[{count}] [{result['type']}] {p.name} -> {result['emotion_label']}")
+                else:
+                    print(f"[{count}] {p.name} -> 변경 없음, 건너뜀 ({result['emotion_label']})")
+        finally:
+            index.close()
+        if not count:
+            print(f"[WARN] 입력 경로에서 파일을 찾지 못했습니다: {input_path}")
+            return
+        print(f"완료: 총 {count}개 파일 (분석 {indexed}개, 건너뜀 {count - indexed}개) -> {index.path}")
         return
 
-    print(f"총 {len(files)}개 파일 처리 시작...")
+    manifest = None
+    if not args.no_manifest:
+        from datamood import SortManifest
 
-    for p in files:
-        result = sorter.sort_file(p, output_root, move=args.move)
+        manifest = SortManifest(output_root)
+
+    # copy 방식이면 복사는 별도 작업자에게 맡기고 분석을 계속 진행
+    copier = None
+    if (args.link_mode or ("move" if args.move else "copy")) == "copy":
+        from datamood.utils import CopyEngine
+
+        copier = CopyEngine(workers=args.copy_workers, verify=args.verify)
+
+    # 복사가 끝난 최종 결과만 기록 (복사 작업자 스레드에서도 호출됨)
+    write_lock = threading.Lock()
+
+    def placed(result) -> None:
+        with write_lock:
+            writer.write(result)
+
+    # 파일을 미리 세지 않고 찾는 대로 바로 처리
+    print("파일 처리 시작...")
+    count = 0
+    try:
+        for p in iter_input_files(input_path, sort=args.sort, include=args.include, exclude=exclude):
+            count += 1
+            result = sorter.sort_file(
+                p, output_root, move=args.move, link_mode=args.link_mode,
+                manifest=manifest, copier=copier,
+                on_placed=placed if writer is not None else None,
+            )
+            if result.get("manifest") == "unchanged":
+                print(f"[{count}] {p.name} -> 변경 없음, 건너뜀 ({result['sorted_path']})")
+                continue
+            print(
+                f"[{count}] [{result['type']}] {p.name} -> {result['emotion_label']} "
+                f"({result['link_mode']}: {result['sorted_path']})"
+            )
+    finally:
+        # 중단(Ctrl+C)되어도 처리한 파일까지의 기록은 저장 (진행 중인 복사를 마친 뒤)
+        if copier is not None:
+            copier.close()
+        if manifest is not None:
+            manifest.close()
+
+    if not count:
+        print(f"[WARN] 입력 경로에서 파일을 찾지 못했습니다: {input_path}")
+        return
+    stats = copier.stats() if copier is not None else None
+    if stats and stats["files"] + stats["failed"]:
+        print(
+            f"복사: {stats['files']}개, {stats['bytes'] / 1e6:.1f} MB, "
+            f"{stats['seconds']:.2f}초, {stats['mb_per_second']} MB/s"
+            + (f" (실패 {stats['failed']}개)" if stats["failed"] else "")
+        )
+    if manifest is not None:
+        counts = manifest.counts
         print(
-            f"[{result['type']}] {p.name} -> {result['emotion_label']} "
-            f"({result['sorted_path']})"
+            f"완료: 총 {count}개 파일 (신규 {counts['new']}개, 변경 {counts['changed']}개, "
+            f"건너뜀 {counts['unchanged']}개)"
         )
+    else:
+        print(f"완료: 총 {count}개 파일")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+"""
+datamood.label_index
+--------------------
+감정 분석 결과 인덱스
+
+파일을 레이블 폴더로 복사하지 않고, 파일별 레이블/점수/백분율/타입을 색인된 SQLite
+테이블에 기록한다. "부정적이고 백분율이 30 미만인 파일" 같은 질의는 폴더 목록을
+읽는 대신 인덱스에서 바로 답하며, 실제 정렬(복사/링크)은 필요할 때 인덱스를 보고
+나중에 수행한다 (:meth:`MoodSorter.sort_from_index`).
+
+주요 클래스/함수
+- LabelIndex: 분석 결과 기록(일괄 쓰기) 및 질의
+- result_scores: 분석 결과 딕셔너리에서 (점수, 백분율) 추출
+"""
+
+_COLUMNS = ("path", "type", "label", "score", "percentage", "size", "mtime_ns", "indexed_at")
+
+
+def result_scores(result: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    :meth:`MoodSorter.analyze_file` 결과에서 감정 점수와 백분율을 꺼낸다.
+
+    텍스트 파일은 ``raw``, 오디오 파일은 ``raw["text_analysis"]``, 타임라인 모드는
+    ``raw["overall"]`` 에서 찾는다 (타임라인은 점수 없이 백분율만 있음).
+
+    Returns
+    -------
+    tuple[float or None, float or None]
+        (score, percentage). 없으면 None.
+    """
+    raw = result.get("raw") or {}
+    for source in (raw, raw.get("text_analysis"), raw.get("overall")):
+        if isinstance(source, dict) and "percentage" in source:
+            return source.get("score"), source["percentage"]
+    return None, None
+
+
+class LabelIndex:
+    """
+    파일별 감정 분석 결과를 저장하고 조건으로 조회하는 인덱스.
+
+    기록은 ``batch_size`` 개 또는 ``flush_seconds`` 초마다 한 트랜잭션으로 저장되며,
+    조회 전과 :meth:`close` 시에도 남은 기록을 저장한다. 크기와 mtime 이 기록과 같은
+    파일은 :meth:`is_current` 가 True 를 반환하므로 다시 분석하지 않아도 된다.
+    여러 스레드에서 함께 사용해도 안전합니다.
+
+    Parameters
+    ----------
+    path : str or Path
+        인덱스 SQLite 파일 경로.
+    batch_size : int, optional
+        한 번에 저장할 기록 수. 기본값 200.
+    flush_seconds : float, optional
+        기록이 batch_size 에 못 미쳐도 저장하는 간격(초). 기본값 2.0.
+
+    Examples
+    --------
+    >>> with LabelIndex("sorted/.datamood_index.sqlite") as index:
+    ...     for path in iter_input_files(Path("data")):
+    ...         sorter.index_file(path, index)
+    ...     index.query(label="부정적", max_percentage=30)
+    [{'path': '/data/a.txt', 'type': 'text', 'label': '부정적', 'score': -2.4, ...}]
+    """
+
+    FILENAME = ".datamood_index.sqlite"
+
+    def __init__(self, path: str | Path, batch_size: int = 200, flush_seconds: float = 2.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+
+        self._pending: Dict[str, Tuple] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " type TEXT,"
+            " label TEXT,"
+            " score REAL,"
+            " percentage REAL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " indexed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_files_label ON files (label, percentage)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_files_score ON files (score)")
+        self._conn.commit()
+
+    @classmethod
+    def for_output(cls, output_root: str | Path, **kwargs) -> "LabelIndex":
+        """output_root 안의 기본 위치(``.datamood_index.sqlite``)에 인덱스를 엽니다."""
+        return cls(Path(output_root) / cls.FILENAME, **kwargs)
+
+    @staticmethod
+    def _key(path: str | Path) -> str:
+        return os.path.abspath(path)
+
+    def get(self, path: str | Path) -> Optional[Dict[str, Any]]:
+        """
+        파일 하나의 기록을 반환합니다.
+
+        Returns
+        -------
+        dict or None
+            path, type, label, score, percentage, size, mtime_ns, indexed_at 키를 가진
+            딕셔너리. 기록이 없으면 ``None``.
+        """
+        key = self._key(path)
+        with self._lock:
+            row = self._pending.get(key)
+            if row is None:
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM files WHERE path = ?", (key,)
+                ).fetchone()
+        return dict(zip(_COLUMNS, row)) if row else None
+
+    def is_current(self, path: str | Path) -> bool:
+        """파일의 크기와 mtime 이 기록과 같으면 True (다시 분석할 필요 없음)."""
+        entry = self.get(path)
+        if entry is None:
+            return False
+        st = os.stat(path)
+        return entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+
+    def add(self, result: Dict[str, Any], stat: Optional[os.stat_result] = None) -> None:
+        """
+        분석 결과를 기록합니다 (일괄 저장 대기열에 추가).
+
+        Parameters
+        ----------
+        result : dict
+            :meth:`MoodSorter.analyze_file` 결과 (path, type, emotion_label, raw).
+        stat : os.stat_result, optional
+            분석 시점의 파일 상태. 없으면 지금 읽는다.
+        """
+        path = result["path"]
+        st = stat or os.stat(path)
+        score, percentage = result_scores(result)
+        key = self._key(path)
+        row = (
+            key, result.get("type"), result.get("emotion_label"), score, percentage,
+            st.st_size, st.st_mtime_ns, time.time(),
+        )
+        with self._lock:
+            self._pending[key] = row
+            if (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            ):
+                self._flush()
+
+    def remove(self, path: str | Path) -> None:
+        """파일의 기록을 삭제합니다."""
+        key = self._key(path)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._conn.execute("DELETE FROM files WHERE path = ?", (key,))
+            self._conn.commit()
+
+    def rename(self, old: str | Path, new: str | Path) -> None:
+        """이동한 파일의 기록을 새 경로로 옮깁니다."""
+        old_key, new_key = self._key(old), self._key(new)
+        with self._lock:
+            self._flush()
+            self._conn.execute("UPDATE OR REPLACE files SET path = ? WHERE path = ?", (new_key, old_key))
+            self._conn.commit()
+
+    def query(
+        self,
+        label: str | Iterable[str] | None = None,
+        type: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        min_percentage: Optional[float] = None,
+        max_percentage: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 파일 기록을 경로순으로 반환합니다.
+
+        Parameters
+        ----------
+        label : str or iterable of str, optional
+            감정 레이블 (여러 개면 그중 하나).
+        type : {"text", "audio", "unknown"}, optional
+            파일 타입.
+        min_score, max_score : float, optional
+            감정 점수 범위 (양 끝 포함). 점수가 없는 기록은 제외된다.
+        min_percentage, max_percentage : float, optional
+            백분율 범위 (양 끝 포함).
+        limit : int, optional
+            최대 반환 개수.
+
+        Returns
+        -------
+        list of dict
+            :meth:`get` 과 같은 형식의 기록 목록.
+        """
+        where, params = [], []
+        if label is not None:
+            labels = [label] if isinstance(label, str) else list(label)
+            where.append(f"label IN ({', '.join('?' * len(labels))})")
+            params += labels
+        if type is not None:
+            where.append("type = ?")
+            params.append(type)
+        for column, op, value in (
+            ("score", ">=", min_score),
+            ("score", "<=", max_score),
+            ("percentage", ">=", min_percentage),
+            ("percentage", "<=", max_percentage),
+        ):
+            if value is not None:
+                where.append(f"{column} {op} ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM files"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def labels(self) -> Dict[str, int]:
+        """레이블별 파일 수를 반환합니다."""
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(
+                "SELECT label, COUNT(*) FROM files GROUP BY label ORDER BY label"
+            ).fetchall()
+        return dict(rows)
+
+    def _flush(self) -> None:
+        """대기 중인 기록을 한 트랜잭션으로 저장한다."""
+        if self._pending:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO files ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    list(self._pending.values()),
+                )
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """대기 중인 기록을 저장합니다."""
+        with self._lock:
+            self._flush()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        """남은 기록을 저장하고 SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def __enter__(self) -> "LabelIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .label_index import result_scores
+from .utils.copy_engine import file_digest
+
+"""
+datamood.manifest
+-----------------
+재개 가능한 정렬 매니페스트
+
+정렬한 파일마다 원본 경로, 크기, 수정 시각(mtime), 레이블, 점수, 배치 경로(선택적으로 내용
+해시)를 ``output_root/.datamood_manifest.sqlite`` 에 기록한다. 다음 실행에서는
+
+- 크기와 mtime 이 같은 입력은 분석 없이 건너뛰고 (unchanged),
+- 달라진 입력은 이전 배치 파일을 지운 뒤 다시 분석/정렬하며 (changed),
+- 기록이 없는 입력만 새로 처리한다 (new).
+
+따라서 중간에 멈춘 실행을 다시 돌리면 멈춘 지점부터 이어서 처리하고,
+이미 정렬된 파일이 ``_1`` 사본으로 중복되지 않는다. 기록은 모아서 한 트랜잭션으로
+쓰므로 파일마다 디스크 동기화가 일어나지 않는다. 이전 실행이 비정상 종료되어
+마지막 기록이 저장되지 않았으면, 다음 실행은 새 입력을 배치하기 전에 레이블 폴더에
+같은 파일이 이미 있는지 확인해 그 파일을 기록으로 되살린다 (:meth:`SortManifest.find_placed`).
+
+주요 클래스
+- SortManifest: 정렬 기록 조회/갱신 (일괄 쓰기)
+"""
+
+# 매니페스트 상태
+MANIFEST_NEW = "new"
+MANIFEST_UNCHANGED = "unchanged"
+MANIFEST_CHANGED = "changed"
+
+_COLUMNS = (
+    "source", "size", "mtime_ns", "hash", "type", "label", "score", "percentage",
+    "destination", "link_mode", "sorted_at",
+)
+
+
+class SortManifest:
+    """
+    output_root 에 저장되는 정렬 기록.
+
+    :meth:`check` 로 입력 파일의 상태(new / unchanged / changed)를 확인하고,
+    정렬 후 :meth:`record` 로 결과를 남긴다. 기록은 ``batch_size`` 개 또는
+    ``flush_seconds`` 초마다 한 번에 저장되며, :meth:`close` (또는 with 블록 종료)
+    시 남은 기록을 모두 저장한다. 비정상 종료로 마지막 배치의 기록을 잃으면 다음에 열 때
+    ``recovering`` 이 True 가 되며, 이때는 :meth:`find_placed` 로 이미 배치된 파일을 찾아
+    중복 배치를 막는다.
+
+    Parameters
+    ----------
+    output_root : str or Path
+        정렬 결과 루트 디렉토리. 매니페스트 파일이 이 안에 만들어진다.
+    hash_files : bool, optional
+        True 이면 정렬 시 내용 해시를 기록하고, 크기는 같은데 mtime 만 바뀐 파일은
+        해시를 비교해 내용이 같으면 unchanged 로 판단한다 (mtime 을 바꾸는 동기화
+        도구를 쓰는 경우). 정렬할 때마다 파일 전체를 한 번 더 읽으므로 기본값은 False 로,
+        크기와 mtime 만 비교한다.
+    batch_size : int, optional
+        한 번에 저장할 기록 수. 기본값 200.
+    flush_seconds : float, optional
+        기록이 batch_size 에 못 미쳐도 저장하는 간격(초). 기본값 2.0.
+
+    Examples
+    --------
+    >>> with SortManifest("sorted") as manifest:
+    ...     for path in iter_input_files(Path("data")):
+    ...         result = sorter.sort_file(path, "sorted", manifest=manifest)
+    ...         print(result["manifest"], result["sorted_path"])
+    """
+
+    FILENAME = ".datamood_manifest.sqlite"
+
+    def __init__(
+        self,
+        output_root: str | Path,
+        hash_files: bool = False,
+        batch_size: int = 200,
+        flush_seconds: float = 2.0,
+    ):
+        self.output_root = Path(output_root)
+        self.output_root.mkdir(parents=True, exist_ok=True)
+        self.path = self.output_root / self.FILENAME
+        self.hash_files = hash_files
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.counts = {MANIFEST_NEW: 0, MANIFEST_UNCHANGED: 0, MANIFEST_CHANGED: 0}
+
+        self._pending: Dict[str, Tuple] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " source TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " hash TEXT,"
+            " type TEXT,"
+            " label TEXT,"
+            " score REAL,"
+            " percentage REAL,"
+            " destination TEXT,"
+            " link_mode TEXT,"
+            " sorted_at REAL NOT NULL)"
+        )
+        # 점수 열이 없던 이전 버전의 매니페스트
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        for column in ("score", "percentage"):
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE entries ADD COLUMN {column} REAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        # 열려 있는 동안 "open" 표시를 남기고 close() 에서 지운다.
+        # 열 때 표시가 남아 있으면 이전 실행이 기록을 다 저장하지 못하고 끝난 것.
+        self.recovering = self._conn.execute(
+            "SELECT 1 FROM meta WHERE key = 'open'"
+        ).fetchone() is not None
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('open', ?)", (str(os.getpid()),))
+        self._conn.commit()
+
+    @staticmethod
+    def _key(path: str | Path) -> str:
+        return os.path.abspath(path)
+
+    def _entry(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._pending.get(key)
+        if row is None:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM entries WHERE source = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(_COLUMNS, row))
+
+    def check(self, path: str | Path) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        입력 파일이 이전 실행 이후 바뀌었는지 확인한다.
+
+        Parameters
+        ----------
+        path : str or Path
+            입력 파일 경로.
+
+        Returns
+        -------
+        tuple[str, dict or None]
+            (상태, 이전 기록). 상태는 "new", "unchanged", "changed" 중 하나이며,
+            기록이 없으면 이전 기록은 None. 정렬된 파일이 없어졌으면 "changed".
+        """
+        key = self._key(path)
+        st = os.stat(path)
+        with self._lock:
+            entry = self._entry(key)
+        if entry is None:
+            status = MANIFEST_NEW
+        elif not (entry["destination"] and os.path.lexists(entry["destination"])):
+            # 정렬된 파일이 지워졌으면 다시 정렬
+            status = MANIFEST_CHANGED
+        elif entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            status = MANIFEST_UNCHANGED
+        elif entry["size"] == st.st_size and entry["hash"] and entry["hash"] == file_digest(path):
+            # 내용은 그대로이고 mtime 만 바뀐 경우: 기록만 갱신
+            status = MANIFEST_UNCHANGED
+            entry["mtime_ns"] = st.st_mtime_ns
+            self._queue(key, entry)
+        else:
+            status = MANIFEST_CHANGED
+        with self._lock:
+            self.counts[status] += 1
+        return status, entry
+
+    def stat_source(self, path: str | Path) -> Dict[str, Any]:
+        """
+        정렬 전에 원본 파일의 크기/mtime/해시를 읽는다 (move 로 원본이 사라지기 전에 호출).
+
+        Returns
+        -------
+        dict
+            source, size, mtime_ns, hash 키를 가진 딕셔너리.
+        """
+        st = os.stat(path)
+        return {
+            "source": self._key(path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "hash": file_digest(path) if self.hash_files else None,
+        }
+
+    def find_placed(self, path: str | Path, destination: str | Path, link_mode: str) -> Optional[Tuple[Path, str]]:
+        """
+        기록을 잃은 입력이 이미 배치되어 있는지 찾는다 (비정상 종료 후 재실행용).
+
+        destination 과 같은 폴더의 ``<stem><suffix>`` / ``<stem>_<n><suffix>`` 중에서
+        path 를 가리키는 심볼릭 링크, 같은 inode(하드링크), 또는 크기와 mtime 이 같은
+        사본(복사는 mtime 을 보존함)을 찾는다.
+
+        Parameters
+        ----------
+        path : str or Path
+            입력 파일 경로.
+        destination : str or Path
+            번호를 붙이기 전의 배치 경로 (:func:`datamood.utils.build_output_path`).
+        link_mode : str
+            요청한 배치 방식. "move" 이면 원본이 남아 있으므로 찾지 않는다.
+
+        Returns
+        -------
+        tuple[Path, str] or None
+            (배치된 경로, 배치 방식). 없으면 None.
+        """
+        if link_mode == "move":
+            return None
+        destination = Path(destination)
+        pattern = re.compile(
+            rf"{re.escape(destination.stem)}(?:_\d+)?{re.escape(destination.suffix)}"
+        )
+        source = os.path.abspath(path)
+        st = os.stat(path)
+        try:
+            with os.scandir(destination.parent) as it:
+                candidates = sorted(entry.path for entry in it if pattern.fullmatch(entry.name))
+        except FileNotFoundError:
+            return None
+        for candidate in candidates:
+            if os.path.islink(candidate):
+                if os.readlink(candidate) == source:
+                    return Path(candidate), "symlink"
+                continue
+            try:
+                cst = os.stat(candidate)
+            except OSError:
+                continue
+            if (cst.st_dev, cst.st_ino) == (st.st_dev, st.st_ino):
+                return Path(candidate), "hardlink"
+            if cst.st_size == st.st_size and cst.st_mtime_ns == st.st_mtime_ns:
+                return Path(candidate), "reflink" if link_mode == "reflink" else "copy"
+        return None
+
+    def record(self, source: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        정렬 결과를 기록한다 (일괄 저장 대기열에 추가).
+
+        Parameters
+        ----------
+        source : dict
+            :meth:`stat_source` 결과.
+        result : dict
+            :meth:`MoodSorter.sort_file` 결과 (type, emotion_label, raw, sorted_path, link_mode).
+        """
+        score, percentage = result_scores(result)
+        entry = dict(
+            source,
+            type=result.get("type"),
+            label=result.get("emotion_label"),
+            score=score,
+            percentage=percentage,
+            destination=result.get("sorted_path"),
+            link_mode=result.get("link_mode"),
+            sorted_at=time.time(),
+        )
+        self._queue(entry["source"], entry)
+
+    def _queue(self, key: str, entry: Dict[str, Any]) -> None:
+        row = (key,) + tuple(entry[column] for column in _COLUMNS[1:])
+        with self._lock:
+            self._pending[key] = row
+            if (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            ):
+                self._flush()
+
+    def _flush(self) -> None:
+        """대기 중인 기록을 한 트랜잭션으로 저장한다."""
+        if self._pending:
+            rows: List[Tuple] = list(self._pending.values())
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO entries ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    rows,
+                )
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """대기 중인 기록을 저장한다."""
+        with self._lock:
+            self._flush()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """남은 기록을 저장하고 연결을 닫는다."""
+        with self._lock:
+            self._flush()
+            self._conn.execute("DELETE FROM meta WHERE key = 'open'")
+            self._conn.commit()
+            self._conn.close()
+
+    def __enter__(self) -> "SortManifest":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
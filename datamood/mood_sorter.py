@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterable, Iterator, Optional
 
-from .audio import AudioPreprocessor, YouTubeDownloader
-from .text import EmphaticSentimentAnalyzer
-from .utils import get_file_type, build_output_path, move_or_copy
+from .utils import LINK_MODES, get_file_type, build_output_path, place_file
+
+if TYPE_CHECKING:
+    from .audio import AcousticMoodEstimator, AudioPreprocessor, YouTubeDownloader, TranscriptCache
+    from .text import EmphaticSentimentAnalyzer, HttpCache, SelectorCache
+    from .manifest import SortManifest
+    from .label_index import LabelIndex
+    from .utils.copy_engine import CopyEngine
 
 class MoodSorter:
     """
     텍스트 / 오디오 파일 또는 YouTube URL을 받아 감정 분석과
     감정 레이블별 정리를 도와주는 헬퍼 클래스.
 
-    내부적으로 다음 컴포넌트를 사용한다.
+    내부적으로 다음 컴포넌트를 사용한다. 각 컴포넌트는 처음 사용할 때 생성되므로
+    .txt 파일만 정리하는 실행에서는 음성 인식/다운로드 모듈을 로드하지 않는다.
 
     - AudioPreprocessor: 오디오 파일을 텍스트로 변환
     - YouTubeDownloader: YouTube URL에서 오디오를 추출하고 텍스트로 변환
     - EmphaticSentimentAnalyzer: 텍스트 감정 분석
+      (기본적으로 프로세스 전역에서 공유되는 인스턴스를 사용)
+    - AcousticMoodEstimator: STT 없이 음향 특징으로 감정 추정 (acoustic_mode 지정 시)
     """
 
+    ACOUSTIC_MODES = ("prescreen", "fallback")
+
 
-    def __init__(self, language: str = "ko-KR"):
+    def __init__(
+        self,
+        language: str = "ko-KR",
+        transcript_cache: Optional[TranscriptCache] = None,
+        share_analyzer: bool = True,
+        acoustic_mode: Optional[str] = None,
+        http_session=None,
+        http_cache: Optional[HttpCache] = None,
+        selector_cache: Optional[SelectorCache] = None,
+    ):
         """
         MoodSorter 인스턴스를 초기화한다.
 
@@ -29,14 +49,136 @@ class MoodSorter:
         language : str, optional
             오디오 인식에 사용할 언어 코드.
             기본값은 "ko-KR"이며 AudioPreprocessor에 전달된다.
+        transcript_cache : TranscriptCache, optional
+            음성 인식 결과 캐시. 지정하면 같은 오디오의 재인식을 건너뛴다.
+        share_analyzer : bool, optional
+            True(기본값)이면 :mod:`datamood.registry` 에 등록된 공유 감정 분석기와
+            형태소 분석기를 사용한다. False 이면 이 인스턴스 전용 분석기를 만든다.
+        acoustic_mode : {"prescreen", "fallback"}, optional
+            오디오 파일에 음향 기반 감정 추정을 함께 사용하는 방식.
+
+            - "prescreen": 먼저 음향 특징을 계산하고, 발화가 부족하면 STT 를
+              건너뛰고 음향 레이블을 사용한다. STT 가 실패해도 음향 레이블을 사용한다.
+            - "fallback": STT 가 실패했을 때만 음향 레이블을 사용한다.
+            - None(기본값): 음향 추정을 사용하지 않는다.
+        http_session : requests.Session, optional
+            기사 URL 수집에 사용할 HTTP 세션. 생략하면
+            :func:`datamood.text.http_client.get_session` 의 공유 세션
+            (호스트별 커넥션 풀, keep-alive, 압축, 재시도)을 사용한다.
+        http_cache : HttpCache, optional
+            기사 URL 디스크 캐시. 지정하면 같은 URL 을 조건부 GET 으로 재검증하고,
+            304 응답이면 다운로드와 HTML 파싱을 건너뛴다.
+        selector_cache : SelectorCache, optional
+            호스트별 본문 셀렉터 캐시. 지정하면 사이트마다 본문을 찾은 셀렉터를
+            기억해 다음 페이지에서 먼저 시도한다.
+        """
+        if acoustic_mode is not None and acoustic_mode not in self.ACOUSTIC_MODES:
+            raise ValueError(
+                f"acoustic_mode 는 {self.ACOUSTIC_MODES} 중 하나여야 합니다: {acoustic_mode!r}"
+            )
+        self.language = language
+        self.transcript_cache = transcript_cache
+        self.share_analyzer = share_analyzer
+        self.acoustic_mode = acoustic_mode
+        self.http_session = http_session
+        self.http_cache = http_cache
+        self.selector_cache = selector_cache
+
+        # 컴포넌트는 첫 사용 시 생성 (아래 프로퍼티 참고)
+        self._audio_preprocessor: Optional[AudioPreprocessor] = None
+        self._youtube_downloader: Optional[YouTubeDownloader] = None
+        self._text_analyzer: Optional[EmphaticSentimentAnalyzer] = None
+        self._acoustic_estimator: Optional[AcousticMoodEstimator] = None
+
+
+    # ------------------ 컴포넌트 (지연 생성) ------------------ #
+
+    @property
+    def audio_preprocessor(self) -> AudioPreprocessor:
+        """오디오(파일) → 텍스트 변환기. 처음 접근할 때 생성된다."""
+        if self._audio_preprocessor is None:
+            from .audio import AudioPreprocessor
+
+            self._audio_preprocessor = AudioPreprocessor(
+                language=self.language, cache=self.transcript_cache
+            )
+        return self._audio_preprocessor
+
+    @audio_preprocessor.setter
+    def audio_preprocessor(self, value: AudioPreprocessor) -> None:
+        self._audio_preprocessor = value
+
+    @property
+    def youtube_downloader(self) -> YouTubeDownloader:
+        """YouTube URL → 오디오 다운로드 → 텍스트 (작업별 임시 디렉토리 사용). 처음 접근할 때 생성된다."""
+        if self._youtube_downloader is None:
+            from .audio import YouTubeDownloader
+
+            self._youtube_downloader = YouTubeDownloader()
+        return self._youtube_downloader
+
+    @youtube_downloader.setter
+    def youtube_downloader(self, value: YouTubeDownloader) -> None:
+        self._youtube_downloader = value
+
+    @property
+    def text_analyzer(self) -> EmphaticSentimentAnalyzer:
+        """텍스트 감정 분석기. 처음 접근할 때 생성(또는 공유 인스턴스 조회)된다."""
+        if self._text_analyzer is None:
+            from .text import EmphaticSentimentAnalyzer
+
+            if self.share_analyzer:
+                self._text_analyzer = EmphaticSentimentAnalyzer.shared()
+            else:
+                self._text_analyzer = EmphaticSentimentAnalyzer()
+        return self._text_analyzer
+
+    @text_analyzer.setter
+    def text_analyzer(self, value: EmphaticSentimentAnalyzer) -> None:
+        self._text_analyzer = value
+
+    @property
+    def acoustic_estimator(self) -> AcousticMoodEstimator:
+        """음향 기반 감정 추정기. 처음 접근할 때 생성된다."""
+        if self._acoustic_estimator is None:
+            from .audio import AcousticMoodEstimator
+
+            self._acoustic_estimator = AcousticMoodEstimator()
+        return self._acoustic_estimator
+
+    @acoustic_estimator.setter
+    def acoustic_estimator(self, value: AcousticMoodEstimator) -> None:
+        self._acoustic_estimator = value
+
+    def warm_up(self) -> None:
         """
+        텍스트 감정 분석기를 미리 만들고 형태소 분석기(JVM)를 기동한다.
 
-        # 오디오(파일) → 텍스트
-        self.audio_preprocessor = AudioPreprocessor(language=language)
-        # YouTube URL → 오디오 다운로드 → 텍스트
-        self.youtube_downloader = YouTubeDownloader()
-        # 텍스트 감정 분석기
-        self.text_analyzer = EmphaticSentimentAnalyzer()
+        오래 실행되는 감시 모드에서 첫 파일이 JVM 기동 시간을 기다리지 않도록
+        시작할 때 한 번 호출한다.
+        """
+        self.text_analyzer.warm_up()
+
+    def close(self) -> None:
+        """
+        이 인스턴스가 만든 컴포넌트를 해제한다.
+
+        YouTube 작업 디렉토리를 정리하고 컴포넌트 참조를 버린다. 공유 분석기는
+        다른 인스턴스가 계속 사용할 수 있으므로 해제하지 않으며, 프로세스 전역으로
+        해제하려면 :func:`datamood.registry.close_shared` 를 호출한다.
+        """
+        if self._youtube_downloader is not None:
+            self._youtube_downloader.cleanup()
+        self._audio_preprocessor = None
+        self._youtube_downloader = None
+        self._text_analyzer = None
+        self._acoustic_estimator = None
+
+    def __enter__(self) -> "MoodSorter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 
     # ------------------ 내부 헬퍼 ------------------ #
@@ -93,7 +235,12 @@ class MoodSorter:
             "raw": text_result,
         }
 
-    def analyze_youtube(self, url: str) -> Dict[str, Any]:
+    def analyze_youtube(
+        self,
+        url: str,
+        timeline: bool = False,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
         YouTube URL을 입력받아 오디오를 추출하고,
         음성 인식 후 텍스트 감정 분석까지 수행한다.
@@ -102,6 +249,11 @@ class MoodSorter:
         ----------
         url : str
             분석할 YouTube 동영상의 URL.
+        timeline : bool, optional
+            True 이면 전사 청크마다 바로 감정 분석한 구간별 타임라인을
+            raw["timeline"] 에 담고, 전체 레이블도 타임라인에서 계산한다.
+        on_segment : callable, optional
+            timeline 모드에서 구간 항목이 만들어질 때마다 호출할 콜백.
 
         Returns
         -------
@@ -111,13 +263,22 @@ class MoodSorter:
             - type: "youtube"
             - url: 입력된 YouTube URL
             - emotion_label: 최종 감정 레이블 또는 "중립"(실패 시)
-            - raw: 인식된 텍스트, 텍스트 분석 결과, 에러 메시지 등이 포함된 딕셔너리
+            - raw: 인식된 텍스트, 텍스트 분석 결과, 에러 메시지,
+              단계별 측정값(metrics), VAD 리포트(vad) 등이 포함된 딕셔너리
+              (timeline 모드에서는 timeline, overall)
         """
+        if timeline:
+            result = self._timeline_result(self._new_timeline(on_segment), self._youtube_transcript(url))
+            result["raw"]["metrics"] = self.youtube_downloader.last_metrics
+            return {"type": "youtube", "url": url, **result}
 
-
+        # 동시 실행 시 충돌하지 않도록 작업 디렉토리 밖(CWD)에 전사 파일을 남기지 않는다
         extracted_text: Optional[str] = self.youtube_downloader.extract_text_from_youtube(
-            url
+            url, output_txt_path=None, preprocessor=self.audio_preprocessor
         )
+        # 단계별 소요 시간/디스크 I/O 측정값과 VAD 리포트
+        metrics = self.youtube_downloader.last_metrics
+        vad_report = self.audio_preprocessor.last_vad_report
         
         if not extracted_text:
             # STT 실패 등
@@ -125,7 +286,11 @@ class MoodSorter:
                 "type": "youtube",
                 "url": url,
                 "emotion_label": "중립",
-                "raw": {"error": "audio_recognition_failed"},
+                "raw": {
+                    "error": "audio_recognition_failed",
+                    "metrics": metrics,
+                    "vad": vad_report,
+                },
             }
 
         text_result = self.text_analyzer.analyze(extracted_text)
@@ -138,10 +303,138 @@ class MoodSorter:
             "raw": {
                 "recognized_text": extracted_text,
                 "text_analysis": text_result,
+                "metrics": metrics,
+                "vad": vad_report,
             },
         }
 
-    def analyze_file(self, path: str | Path) -> Dict[str, Any]:
+    def iter_file_timeline(
+        self,
+        path: str | Path,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        오디오 파일을 스트리밍 인식하며 구간별 감정 분석 결과를 바로 내보낸다.
+
+        Parameters
+        ----------
+        path : str or Path
+            분석할 오디오 파일 경로.
+        on_segment : callable, optional
+            항목이 만들어질 때마다 호출할 콜백.
+
+        Yields
+        ------
+        dict
+            start, end, text, score, percentage, label 키를 가진 타임라인 항목.
+        """
+        timeline = self._new_timeline(on_segment)
+        yield from timeline.feed(self.audio_preprocessor.iter_transcript_from_audio(str(path)))
+
+    def iter_youtube_timeline(
+        self,
+        url: str,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        YouTube 오디오를 스트리밍 인식하며 구간별 감정 분석 결과를 바로 내보낸다.
+
+        Parameters
+        ----------
+        url : str
+            분석할 YouTube 동영상의 URL.
+        on_segment : callable, optional
+            항목이 만들어질 때마다 호출할 콜백.
+
+        Yields
+        ------
+        dict
+            start, end, text, score, percentage, label 키를 가진 타임라인 항목.
+        """
+        timeline = self._new_timeline(on_segment)
+        yield from timeline.feed(self._youtube_transcript(url))
+
+    def _youtube_transcript(self, url: str) -> Iterator[Dict[str, Any]]:
+        """YouTube 오디오의 전사 구간(start, end, text) 스트림."""
+        return self.youtube_downloader.iter_transcript_from_youtube(
+            url, preprocessor=self.audio_preprocessor
+        )
+
+    def _new_timeline(self, on_segment=None):
+        """이 인스턴스의 감정 분석기를 사용하는 새 SentimentTimeline 을 만든다."""
+        from .timeline import SentimentTimeline
+
+        return SentimentTimeline(self.text_analyzer, on_segment)
+
+    def _timeline_result(self, timeline, segments: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """전사 구간 스트림을 타임라인으로 끝까지 소비하여 emotion_label / raw 결과를 만든다."""
+        items = list(timeline.feed(segments))
+        summary = timeline.summary()
+        return {
+            "emotion_label": summary["label"],
+            "raw": {
+                "error": None if items else "audio_recognition_failed",
+                "label_source": "text" if items else None,
+                "timeline": items,
+                "overall": summary,
+                "recognized_text": " ".join(item["text"] for item in items) or None,
+                "vad": self.audio_preprocessor.last_vad_report,
+            },
+        }
+
+    def analyze_youtube_batch(
+        self,
+        urls: Iterable[str],
+        download_workers: int = 4,
+        stt_workers: int = 2,
+        queue_size: int = 4,
+        extractor=None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        여러 YouTube URL(재생목록/채널 포함)을 파이프라인으로 분석하고,
+        영상별 결과를 끝나는 순서대로 내보낸다.
+
+        다운로드, 음성 인식, 감정 분석 단계가 크기가 제한된 큐로 연결된
+        별도의 스레드 풀에서 겹쳐서 실행된다.
+        자세한 동작은 :class:`~datamood.youtube_pipeline.YouTubeBatchPipeline` 참고.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            영상/재생목록/채널 URL 목록.
+        download_workers : int, optional
+            동시에 다운로드할 영상 수. 기본값 4.
+        stt_workers : int, optional
+            동시에 음성 인식할 영상 수. 기본값 2.
+        queue_size : int, optional
+            단계 사이 큐의 최대 길이. 기본값 4.
+        extractor : object, optional
+            ``expand(url)`` / ``fetch_pcm(url)`` 를 제공하는 추출기.
+            기본값은 yt-dlp 기반 추출기.
+
+        Yields
+        ------
+        dict
+            analyze_youtube()와 같은 형태의 결과 딕셔너리에
+            index 와 raw["timings"] 가 추가된 딕셔너리.
+        """
+        from .youtube_pipeline import YouTubeBatchPipeline
+
+        pipeline = YouTubeBatchPipeline(
+            self,
+            extractor=extractor,
+            download_workers=download_workers,
+            stt_workers=stt_workers,
+            queue_size=queue_size,
+        )
+        yield from pipeline.run(urls)
+
+    def analyze_file(
+        self,
+        path: str | Path,
+        timeline: bool = False,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """
         로컬 파일 하나(txt 또는 오디오)를 입력받아 감정 분석을 수행한다.
 
@@ -152,6 +445,12 @@ class MoodSorter:
 
             - 텍스트: .txt
             - 오디오: .wav, .flac, .aiff, .aif
+              (.mp3, .m4a, .ogg, .opus 등 압축 포맷은 ffmpeg 로 메모리에서 디코딩)
+        timeline : bool, optional
+            오디오 파일에서 True 이면 전사 청크마다 바로 감정 분석한 구간별
+            타임라인을 raw["timeline"] 에 담고, 전체 레이블도 타임라인에서 계산한다.
+        on_segment : callable, optional
+            timeline 모드에서 구간 항목이 만들어질 때마다 호출할 콜백.
 
         Returns
         -------
@@ -167,7 +466,9 @@ class MoodSorter:
               - type: "audio"
               - path: 파일 경로 문자열
               - emotion_label: 감정 레이블 또는 "중립"(인식 실패 시)
-              - raw: 인식된 텍스트와 텍스트 분석 결과
+              - raw: 인식된 텍스트, 텍스트 분석 결과, VAD 리포트(vad),
+                캐시 적중 여부(transcript_cache_hit), 음향 추정 결과(acoustic),
+                레이블 출처(label_source: "text" 또는 "acoustic")
             - 지원하지 않는 타입:
               - type: "unknown"
               - emotion_label: "unknown"
@@ -192,17 +493,62 @@ class MoodSorter:
             }
 
         elif file_type == "audio":
+            # 0) 음향 특징 기반 추정 (STT 없이 수 ms)
+            acoustic = None
+            if self.acoustic_mode is not None:
+                acoustic = self.acoustic_estimator.analyze_file(str(p))
+
+            if (
+                self.acoustic_mode == "prescreen"
+                and acoustic is not None
+                and not acoustic["should_transcribe"]
+            ):
+                return {
+                    "path": str(p),
+                    "type": "audio",
+                    "emotion_label": acoustic["label"],
+                    "raw": {
+                        "label_source": "acoustic",
+                        "stt_skipped": True,
+                        "acoustic": acoustic,
+                    },
+                }
+
+            if timeline:
+                result = self._timeline_result(
+                    self._new_timeline(on_segment),
+                    self.audio_preprocessor.iter_transcript_from_audio(str(p)),
+                )
+                if result["raw"]["error"] and acoustic is not None:
+                    # STT 실패 시 음향 추정 레이블로 대체
+                    result["emotion_label"] = acoustic["label"]
+                    result["raw"]["label_source"] = "acoustic"
+                result["raw"]["acoustic"] = acoustic
+                return {"path": str(p), "type": "audio", **result}
+
             # 1) 오디오 → 텍스트
             extracted_text: Optional[str] = self.audio_preprocessor.extract_text_from_audio(
                 str(p)
             )
 
+            # VAD 로 절감한 STT 시간 (VAD 미적용 시 None), 캐시 적중 여부
+            vad_report = self.audio_preprocessor.last_vad_report
+            cache_hit = self.audio_preprocessor.last_cache_hit
+
             if not extracted_text:
+                # STT 실패 시 음향 추정 레이블로 대체
+                fallback = acoustic is not None
                 return {
                     "path": str(p),
                     "type": "audio",
-                    "emotion_label": "중립",
-                    "raw": {"error": "audio_recognition_failed"},
+                    "emotion_label": acoustic["label"] if fallback else "중립",
+                    "raw": {
+                        "error": "audio_recognition_failed",
+                        "label_source": "acoustic" if fallback else None,
+                        "vad": vad_report,
+                        "transcript_cache_hit": cache_hit,
+                        "acoustic": acoustic,
+                    },
                 }
 
             # 2) 텍스트 감정 분석
@@ -216,6 +562,10 @@ class MoodSorter:
                 "raw": {
                     "recognized_text": extracted_text,
                     "text_analysis": text_result,
+                    "label_source": "text",
+                    "vad": vad_report,
+                    "transcript_cache_hit": cache_hit,
+                    "acoustic": acoustic,
                 },
             }
 
@@ -233,6 +583,10 @@ class MoodSorter:
         path: str | Path,
         output_root: str | Path,
         move: bool = False,
+        link_mode: Optional[str] = None,
+        manifest: Optional["SortManifest"] = None,
+        copier: Optional["CopyEngine"] = None,
+        on_placed: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         파일 하나를 분석한 뒤, 감정 레이블별 하위 폴더로 정리한다.
@@ -249,36 +603,248 @@ class MoodSorter:
             감정 레이블별로 파일을 정렬해 둘 루트 디렉터리.
         move : bool, optional
             True이면 원본 파일을 이동하고, False이면 복사한다.
-            기본값은 False.
+            기본값은 False. link_mode 를 지정하면 무시된다.
+        link_mode : {"copy", "move", "hardlink", "reflink", "symlink"}, optional
+            정렬 폴더에 파일을 배치하는 방식. hardlink/reflink/symlink 를 만들 수 없는
+            파일은 자동으로 복사된다 (:func:`datamood.utils.place_file`).
+        manifest : SortManifest, optional
+            정렬 기록 (:class:`datamood.manifest.SortManifest`). 지정하면 이전 실행 이후
+            바뀌지 않은 파일은 분석 없이 기록된 결과를 반환하고, 바뀐 파일은 이전에
+            정렬된 파일을 지운 뒤 다시 정렬한다 (이동한 파일은 지우지 않음).
+        copier : CopyEngine, optional
+            복사 엔진 (:class:`datamood.utils.CopyEngine`). 지정하면 "copy" 방식의 복사를
+            엔진의 작업자에게 넘기고 끝나기를 기다리지 않고 반환한다. 복사가 끝나면
+            manifest 에 기록하며, 실패하면 만들던 파일을 지우고 결과를 실패로 바꾼다
+            (sorted_path=None, raw["error"]="copy_failed: ...").
+        on_placed : callable, optional
+            배치가 끝난 최종 결과로 호출된다. copier 로 복사하면 복사가 끝난 뒤 작업자
+            스레드에서, 그 밖에는 반환 직전에 호출된다. 반환값은 복사가 끝나기 전의
+            결과일 수 있으므로, 결과를 저장할 때는 이 콜백을 사용한다.
 
         Returns
         -------
         dict
             analyze_file()의 결과에 다음 필드가 추가된 딕셔너리.
 
-            - sorted_path: 실제로 복사/이동된 최종 경로(문자열)
-            - moved: 이동 여부(bool, move 인자와 동일)
+            - sorted_path: 실제로 복사/이동/링크된 최종 경로(문자열)
+            - moved: 이동 여부(bool)
+            - link_mode: 실제로 사용한 배치 방식 (대체된 경우 "copy")
+            - manifest: manifest 를 지정한 경우 "new" / "unchanged" / "changed"
+            - raw["timings"]: analyze_seconds, place_seconds, total_seconds
+              (unchanged 이면 total_seconds 만)
+
+            unchanged 결과의 raw 에는 분석 없이 기록된 score, percentage 만 들어 있다.
         """
 
 
 
         
+        if link_mode is None:
+            link_mode = "move" if move else "copy"
+        elif link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode 는 {LINK_MODES} 중 하나여야 합니다: {link_mode!r}")
+
+        started = time.perf_counter()
         p = Path(path)
         output_root = Path(output_root)
 
+        source = status = None
+        if manifest is not None:
+            status, entry = manifest.check(p)
+            if status == "unchanged":
+                result = {
+                    "path": str(p),
+                    "type": entry["type"],
+                    "emotion_label": entry["label"],
+                    "raw": {
+                        "score": entry["score"],
+                        "percentage": entry["percentage"],
+                        "timings": {"total_seconds": round(time.perf_counter() - started, 3)},
+                    },
+                    "sorted_path": entry["destination"],
+                    "moved": entry["link_mode"] == "move",
+                    "link_mode": entry["link_mode"],
+                    "manifest": status,
+                }
+                if on_placed is not None:
+                    on_placed(result)
+                return result
+            if status == "changed" and entry["link_mode"] != "move":
+                self._discard_sorted(Path(entry["destination"]))
+            # move 로 원본이 사라지기 전에 크기/mtime/해시를 읽어 둔다
+            source = manifest.stat_source(p)
+
+        analyze_started = time.perf_counter()
         result = self.analyze_file(p)
         label = result.get("emotion_label", "unknown")
 
+        place_started = time.perf_counter()
+        found = None
+        if manifest is not None and manifest.recovering and status == "new":
+            # 이전 실행이 기록을 저장하지 못하고 끝났으면 이미 배치된 파일을 되살림
+            found = manifest.find_placed(p, build_output_path(output_root, label, p), link_mode)
+        if found is not None:
+            dst, used = found
+        elif copier is not None and link_mode == "copy":
+            dst, used = make_unique_path(build_output_path(output_root, label, p)), "copy"
+        else:
+            dst, used = self._place(p, output_root, label, link_mode)
+        finished = time.perf_counter()
+
+        result["sorted_path"] = str(dst)
+        result["moved"] = used == "move"
+        result["link_mode"] = used
+        result["raw"]["timings"] = {
+            "analyze_seconds": round(place_started - analyze_started, 3),
+            "place_seconds": round(finished - place_started, 3),
+            "total_seconds": round(finished - started, 3),
+        }
+        if manifest is not None:
+            result["manifest"] = status
+
+        if found is None and copier is not None and link_mode == "copy":
+            # 복사는 작업자에게 맡기고, 끝난 뒤 기록 (실패하면 선점한 파일과 이름 정리)
+            def copied(future) -> None:
+                error = future.exception()
+                if error is not None:
+                    self._discard_sorted(dst)
+                    print(f"[ERROR] 복사 실패: {p} -> {dst} ({error})")
+                    result["sorted_path"] = None
+                    result["raw"]["error"] = f"copy_failed: {error}"
+                elif manifest is not None:
+                    manifest.record(source, result)
+                if on_placed is not None:
+                    on_placed(result)
+
+            copier.submit(p, dst, callback=copied)
+            return result
+
+        if manifest is not None:
+            manifest.record(source, result)
+        if on_placed is not None:
+            on_placed(result)
+        return result
+
+    @staticmethod
+    def _place(p: Path, output_root: Path, label: str, link_mode: str):
+        """p 를 output_root/<label>/ 아래 겹치지 않는 이름으로 배치하고 (경로, 사용한 방식)을 반환한다."""
         dst = build_output_path(output_root, label, p)
         # 같은 이름 있으면 _1, _2 붙여서 계속 누적
         dst = make_unique_path(dst)
 
-        move_or_copy(p, dst, move=move)
+        try:
+            used = place_file(p, dst, mode=link_mode, replace=True)
+        except BaseException:
+            # 선점해 둔 빈 파일 정리
+            dst.unlink(missing_ok=True)
+            raise
+        return dst, used
+
+    @staticmethod
+    def _discard_sorted(path: Path) -> None:
+        """이전 실행에서 정렬된 파일을 지우고 그 이름을 다시 쓸 수 있게 한다."""
+        from .utils.naming import default_allocator
+
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[WARN] 이전 정렬 파일 삭제 실패: {path} ({e})")
+            return
+        default_allocator.release(path)
+
+    def index_file(self, path: str | Path, index: "LabelIndex") -> Dict[str, Any]:
+        """
+        파일 하나를 분석해 레이블 인덱스에 기록한다 (파일은 복사/이동하지 않음).
 
-        result["sorted_path"] = str(dst)
-        result["moved"] = bool(move)
+        인덱스에 기록된 크기/mtime 과 같은 파일은 다시 분석하지 않고 기록을 반환한다.
+
+        Parameters
+        ----------
+        path : str or Path
+            분석할 파일 경로.
+        index : LabelIndex
+            결과를 기록할 인덱스 (:class:`datamood.label_index.LabelIndex`).
+
+        Returns
+        -------
+        dict
+            analyze_file()의 결과에 indexed 필드(이번에 분석해 기록했으면 True)가
+            추가된 딕셔너리. 다시 분석하지 않은 경우 raw 는 빈 딕셔너리이다.
+        """
+        p = Path(path)
+        if index.is_current(p):
+            entry = index.get(p)
+            return {
+                "path": str(p),
+                "type": entry["type"],
+                "emotion_label": entry["label"],
+                "raw": {},
+                "indexed": False,
+            }
+
+        # 분석 도중 파일이 바뀌면 다음 실행에서 다시 분석되도록 분석 전 상태를 기록
+        st = p.stat()
+        started = time.perf_counter()
+        result = self.analyze_file(p)
+        elapsed = round(time.perf_counter() - started, 3)
+        result["raw"]["timings"] = {"analyze_seconds": elapsed, "total_seconds": elapsed}
+        index.add(result, st)
+        result["indexed"] = True
         return result
 
+    def sort_from_index(
+        self,
+        index: "LabelIndex",
+        output_root: str | Path,
+        link_mode: str = "copy",
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        인덱스의 레이블로 파일을 정렬한다 (다시 분석하지 않음).
+
+        Parameters
+        ----------
+        index : LabelIndex
+            :meth:`index_file` 로 만든 인덱스.
+        output_root : str or Path
+            감정 레이블별로 파일을 정렬해 둘 루트 디렉터리.
+        link_mode : {"copy", "move", "hardlink", "reflink", "symlink"}, optional
+            배치 방식 (:meth:`sort_file` 참고). 기본값은 "copy".
+        **filters
+            :meth:`LabelIndex.query` 조건 (label, type, min_score, max_percentage 등).
+
+        Yields
+        ------
+        dict
+            path, type, emotion_label, sorted_path, moved, link_mode 키를 가진 딕셔너리.
+            원본이 없어진 파일은 sorted_path 가 None 이다.
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode 는 {LINK_MODES} 중 하나여야 합니다: {link_mode!r}")
+
+        output_root = Path(output_root)
+        for entry in index.query(**filters):
+            p = Path(entry["path"])
+            result = {
+                "path": str(p),
+                "type": entry["type"],
+                "emotion_label": entry["label"],
+                "sorted_path": None,
+                "moved": False,
+                "link_mode": None,
+            }
+            if not p.exists():
+                print(f"[WARN] 인덱스의 파일이 없습니다: {p}")
+                yield result
+                continue
+            dst, used = self._place(p, output_root, entry["label"], link_mode)
+            if used == "move":
+                index.rename(p, dst)
+            result.update(sorted_path=str(dst), moved=used == "move", link_mode=used)
+            yield result
+
     def analyze(self, input_value: str | Path) -> Dict[str, Any]:
         """
         다양한 입력 타입(YouTube URL, 일반 http(s) URL, 로컬 파일)에 대해
@@ -317,7 +883,12 @@ class MoodSorter:
                 return self.analyze_youtube(input_value)
             # 1-2) 그 외 http(s) URL → 기사 URL이라고 보고 처리
             else:
-                url_result = self.text_analyzer.analyze_url(input_value)
+                url_result = self.text_analyzer.analyze_url(
+                    input_value,
+                    session=self.http_session,
+                    cache=self.http_cache,
+                    selector_cache=self.selector_cache,
+                )
                 # {"title": ..., "analysis": {...}, "text": ...} 가 온다고 가정
                 label = self._label_from_text_result(url_result)
 
@@ -331,6 +902,51 @@ class MoodSorter:
         # 2) URL이 아니면 → 로컬 파일로 간주
         return self.analyze_file(input_value)
 
+    def analyze_urls(
+        self,
+        urls: Iterable[str],
+        max_concurrency: int = 16,
+        per_host: int = 4,
+        cpu_workers: Optional[int] = None,
+        cpu_executor: str = "process",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        여러 기사 URL 을 동시에 수집/분석하고, 결과를 완료되는 순서대로 내보낸다.
+
+        전체 동시 요청 수와 호스트별 동시 요청 수를 제한하며, HTML 파싱과
+        감정 분석은 CPU 워커 풀에서 수행한다.
+        자세한 동작은 :class:`~datamood.url_pipeline.UrlBatchAnalyzer` 참고.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            기사 URL 목록.
+        max_concurrency : int, optional
+            전체 동시 요청 수. 기본값 16.
+        per_host : int, optional
+            호스트별 동시 요청 수. 기본값 4.
+        cpu_workers : int, optional
+            파싱/감정 분석 워커 수. 기본값은 CPU 코어 수 (process 모드는 최대 4).
+        cpu_executor : {"process", "thread"}, optional
+            CPU 워커 종류. 기본값 "process" (spawn 으로 시작, 워커마다 분석기를 미리 준비).
+
+        Yields
+        ------
+        dict
+            URL 하나의 결과. analyze() 의 기사 URL 결과에 index, status("ok"/"skipped"/"error"),
+            raw["timings"], raw["error"] 가 추가된다.
+        """
+        from .url_pipeline import UrlBatchAnalyzer
+
+        batch = UrlBatchAnalyzer(
+            self,
+            max_concurrency=max_concurrency,
+            per_host=per_host,
+            cpu_workers=cpu_workers,
+            cpu_executor=cpu_executor,
+        )
+        yield from batch.run(urls)
+
     # ------------------ 공개 API: 분석 + 저장/정렬 ------------------ #
 
     def analyze_and_sort(
@@ -338,6 +954,7 @@ class MoodSorter:
         input_value: str | Path,
         base_dir: str | Path,
         move: bool = False,
+        link_mode: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         입력 하나(텍스트/오디오 파일 또는 URL)를 받아 감정 분석을 수행하고,
@@ -368,6 +985,8 @@ class MoodSorter:
             True이면 정렬 시 원본 파일을 이동하고,
             False이면 복사한다. URL 기반 입력의 경우에는
             새로 생성된 .txt 파일만 정렬 대상이 된다.
+        link_mode : {"copy", "move", "hardlink", "reflink", "symlink"}, optional
+            정렬 폴더에 파일을 배치하는 방식 (:meth:`sort_file` 참고).
 
         Returns
         -------
@@ -380,6 +999,8 @@ class MoodSorter:
                 최종 정렬된 파일 경로. 없으면 None.
             moved : bool
                 파일 이동 여부.
+            link_mode : str or None
+                실제로 사용한 배치 방식. 정렬하지 않았으면 None.
         """
 
 
@@ -403,14 +1024,16 @@ class MoodSorter:
         result.setdefault("saved_txt_path", None)
         result.setdefault("sorted_path", None)
         result.setdefault("moved", False)
+        result.setdefault("link_mode", None)
 
         # 2-1) 로컬 텍스트/오디오 파일
         if input_type in ("text", "audio"):
             src_path = result.get("path")
             if src_path:
-                sort_result = self.sort_file(src_path, output_root, move=move)
+                sort_result = self.sort_file(src_path, output_root, move=move, link_mode=link_mode)
                 result["sorted_path"] = sort_result.get("sorted_path")
                 result["moved"] = sort_result.get("moved", False)
+                result["link_mode"] = sort_result.get("link_mode")
             return result
 
 
@@ -429,10 +1052,11 @@ class MoodSorter:
             txt_path = make_unique_path(txt_path)  # 이미 있으면 _1, _2 붙이기
             txt_path.write_text(recognized, encoding="utf-8")
 
-            sort_result = self.sort_file(txt_path, output_root, move=move)
+            sort_result = self.sort_file(txt_path, output_root, move=move, link_mode=link_mode)
             result["saved_txt_path"] = str(txt_path)
             result["sorted_path"] = sort_result.get("sorted_path")
             result["moved"] = sort_result.get("moved", False)
+            result["link_mode"] = sort_result.get("link_mode")
             return result
 
 
@@ -450,10 +1074,11 @@ class MoodSorter:
             txt_path = make_unique_path(txt_path)
             txt_path.write_text(article_text, encoding="utf-8")
 
-            sort_result = self.sort_file(txt_path, output_root, move=move)
+            sort_result = self.sort_file(txt_path, output_root, move=move, link_mode=link_mode)
             result["saved_txt_path"] = str(txt_path)
             result["sorted_path"] = sort_result.get("sorted_path")
             result["moved"] = sort_result.get("moved", False)
+            result["link_mode"] = sort_result.get("link_mode")
             return result
 
         # 그 외 타입은 그냥 분석 결과만 반환
@@ -519,6 +1144,12 @@ def make_unique_path(path: Path) -> Path:
     예를 들어 filename.txt가 이미 있으면
     filename_1.txt, filename_2.txt 순서로 새 이름을 만든다.
 
+    디렉토리마다 처음 한 번만 목록을 읽고 이후에는 메모리의 이름 인덱스와
+    번호 카운터로 이름을 정하므로, 같은 이름이 많이 쌓여도 파일당 시스템 호출이
+    늘어나지 않는다 (:class:`datamood.utils.naming.NameAllocator`).
+    반환된 경로에는 이름을 선점한 빈 파일이 만들어져 있으므로, 호출한 쪽은
+    이 파일을 덮어쓰면 된다.
+
     Parameters
     ----------
     path : Path
@@ -527,20 +1158,9 @@ def make_unique_path(path: Path) -> Path:
     Returns
     -------
     Path
-        아직 존재하지 않는 고유한 파일 경로.
+        이 호출이 선점한 고유한 파일 경로 (빈 파일).
     """
 
-    path = Path(path)
-    if not path.exists():
-        return path
-
-    stem = path.stem
-    suffix = path.suffix
-    parent = path.parent
+    from .utils.naming import default_allocator
 
-    i = 1
-    while True:
-        candidate = parent / f"{stem}_{i}{suffix}"
-        if not candidate.exists():
-            return candidate
-        i += 1
\ No newline at end of file
+    return default_allocator.allocate(Path(path))
\ No newline at end of file
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+"""
+datamood.registry
+-----------------
+프로세스 전역에서 무거운 컴포넌트(형태소 분석기, 감정 분석기 등)를 공유하는 레지스트리
+
+Okt 처럼 생성 비용이 큰 객체는 설정(키)마다 한 번만 만들고, 여러 MoodSorter /
+분석기 인스턴스가 같은 객체를 재사용한다.
+
+주요 클래스/함수
+- ComponentRegistry: 키별로 한 번만 생성하는 스레드 안전 레지스트리
+- shared(key, factory): 전역 레지스트리에서 컴포넌트를 가져오거나 생성
+- close_shared(): 전역 레지스트리의 모든 컴포넌트를 해제
+"""
+
+
+class ComponentRegistry:
+    """
+    키(설정)별로 컴포넌트를 한 번만 생성해 공유하는 레지스트리.
+
+    같은 키에 대해 여러 스레드가 동시에 :meth:`get` 을 호출해도 factory 는
+    한 번만 실행됩니다. 서로 다른 키의 생성은 서로를 막지 않습니다.
+
+    Examples
+    --------
+    >>> registry = ComponentRegistry()
+    >>> a = registry.get(("okt",), Okt)
+    >>> b = registry.get(("okt",), Okt)
+    >>> a is b
+    True
+    >>> registry.close()
+    """
+
+    def __init__(self):
+        self._items: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        key 에 해당하는 컴포넌트를 반환합니다. 없으면 factory() 로 생성해 등록합니다.
+
+        Parameters
+        ----------
+        key : Hashable
+            컴포넌트 종류와 설정을 나타내는 키.
+        factory : callable
+            인자 없이 호출해 컴포넌트를 만드는 함수.
+
+        Returns
+        -------
+        Any
+            공유 컴포넌트.
+        """
+        item = self._items.get(key)
+        if item is not None:
+            return item
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            item = self._items.get(key)
+            if item is None:
+                item = factory()
+                with self._lock:
+                    self._items[key] = item
+        return item
+
+    def discard(self, key: Hashable) -> None:
+        """
+        key 의 컴포넌트를 등록 해제하고, ``close()`` 메서드가 있으면 호출합니다.
+
+        Parameters
+        ----------
+        key : Hashable
+            해제할 컴포넌트의 키. 없으면 아무것도 하지 않습니다.
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            self._key_locks.pop(key, None)
+        close = getattr(item, "close", None)
+        if callable(close):
+            close()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def close(self) -> None:
+        """
+        등록된 모든 컴포넌트를 해제합니다.
+
+        컴포넌트에 ``close()`` 메서드가 있으면 호출한 뒤 참조를 버립니다.
+        이후 :meth:`get` 을 호출하면 새로 생성합니다.
+        """
+        with self._lock:
+            items = list(self._items.values())
+            self._items.clear()
+            self._key_locks.clear()
+        for item in items:
+            close = getattr(item, "close", None)
+            if callable(close):
+                close()
+
+
+# 프로세스 전역 기본 레지스트리
+default_registry = ComponentRegistry()
+
+
+def shared(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    전역 레지스트리에서 key 에 해당하는 컴포넌트를 가져오거나 생성합니다.
+
+    Parameters
+    ----------
+    key : Hashable
+        컴포넌트 종류와 설정을 나타내는 키.
+    factory : callable
+        인자 없이 호출해 컴포넌트를 만드는 함수.
+
+    Returns
+    -------
+    Any
+        공유 컴포넌트.
+    """
+    return default_registry.get(key, factory)
+
+
+def close_shared() -> None:
+    """
+    전역 레지스트리에 등록된 공유 컴포넌트(분석기, 형태소 분석기 등)를 모두 해제합니다.
+
+    JVM 기반 형태소 분석기(Okt)의 경우 JVM 자체는 프로세스 종료 시까지 유지되며,
+    분석기 객체와 사전 메모리만 해제됩니다.
+    """
+    default_registry.close()
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .label_index import result_scores
+
+"""
+datamood.results
+----------------
+분석 결과 구조화 내보내기
+
+:meth:`MoodSorter.sort_file` 등이 반환하는 결과 딕셔너리를 고정된 스키마의 레코드로
+펼쳐 JSONL / CSV / Parquet 파일에 스트리밍으로 기록한다. 결과는 버퍼에 모아서
+쓰므로 파일마다 디스크 쓰기가 일어나지 않으며, Parquet 은 ``row_group_size`` 행마다
+row group 하나를 기록하여 메모리 사용량이 결과 수에 비례해 늘지 않는다.
+
+주요 클래스/함수
+- RESULT_FIELDS: 레코드 스키마 (필드 이름, 타입)
+- flatten_result: 결과 딕셔너리 → 레코드
+- open_result_writer: 형식에 맞는 기록기 생성
+- result_format: 경로/형식 인자로 출력 형식 결정
+"""
+
+# 레코드 스키마. 필드 순서와 타입은 바꾸지 않고, 새 필드는 끝에만 추가한다.
+RESULT_FIELDS = (
+    ("input", "string"),           # 파일 경로 또는 URL
+    ("type", "string"),            # text / audio / url / youtube / unknown
+    ("emotion_label", "string"),
+    ("score", "float"),
+    ("percentage", "float"),
+    ("label_source", "string"),    # text / acoustic
+    ("status", "string"),          # ok / error / skipped
+    ("error", "string"),
+    ("sorted_path", "string"),
+    ("link_mode", "string"),
+    ("moved", "bool"),
+    ("manifest", "string"),        # new / unchanged / changed
+    ("fetch_seconds", "float"),
+    ("download_seconds", "float"),
+    ("stt_seconds", "float"),
+    ("analyze_seconds", "float"),
+    ("place_seconds", "float"),
+    ("total_seconds", "float"),
+    ("finished_at", "float"),      # 기록 시각 (Unix time)
+)
+FIELD_NAMES = tuple(name for name, _ in RESULT_FIELDS)
+OUTPUT_FORMATS = ("jsonl", "csv", "parquet")
+
+
+def flatten_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    결과 딕셔너리를 :data:`RESULT_FIELDS` 스키마의 레코드로 펼친다.
+
+    없는 값은 None 으로 채우므로 입력 종류와 관계없이 항상 같은 필드를 가진다.
+
+    Parameters
+    ----------
+    result : dict
+        sort_file / index_file / analyze_urls / analyze_youtube_batch 결과.
+
+    Returns
+    -------
+    dict
+        필드 이름 → 값.
+    """
+    raw = result.get("raw") or {}
+    timings = raw.get("timings") or {}
+    score, percentage = result_scores(result)
+    error = raw.get("error")
+    status = result.get("status") or ("error" if error else "ok")
+
+    analyze = timings.get("analyze_seconds", timings.get("sentiment_seconds"))
+    total = timings.get("total_seconds")
+    if total is None and timings:
+        total = round(sum(v for k, v in timings.items() if k.endswith("_seconds")), 3)
+
+    return {
+        "input": result.get("path") or result.get("url"),
+        "type": result.get("type"),
+        "emotion_label": result.get("emotion_label"),
+        "score": score,
+        "percentage": percentage,
+        "label_source": raw.get("label_source"),
+        "status": status,
+        "error": str(error) if error else None,
+        "sorted_path": result.get("sorted_path"),
+        "link_mode": result.get("link_mode"),
+        "moved": result.get("moved"),
+        "manifest": result.get("manifest"),
+        "fetch_seconds": timings.get("fetch_seconds"),
+        "download_seconds": timings.get("download_seconds"),
+        "stt_seconds": timings.get("stt_seconds"),
+        "analyze_seconds": analyze,
+        "place_seconds": timings.get("place_seconds"),
+        "total_seconds": total,
+        "finished_at": round(time.time(), 3),
+    }
+
+
+class ResultWriter:
+    """
+    결과 기록기의 공통 부분. :meth:`write` 로 결과를 넘기고, 끝나면 :meth:`close` 한다.
+
+    Parameters
+    ----------
+    path : str or Path
+        결과 파일 경로. 부모 디렉토리가 없으면 만든다.
+    """
+
+    format = ""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """결과 하나를 기록합니다."""
+        self._write_record(flatten_result(result))
+        self.count += 1
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """버퍼의 레코드를 파일에 씁니다."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """버퍼에 남은 레코드를 쓰고 파일을 닫습니다."""
+        raise NotImplementedError
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """한 줄에 레코드 하나(JSON)를 쓰는 기록기."""
+
+    format = "jsonl"
+
+    def __init__(self, path: str | Path, buffer_bytes: int = 1024 * 1024):
+        super().__init__(path)
+        self._file = open(self.path, "w", encoding="utf-8", buffering=buffer_bytes)
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """:data:`FIELD_NAMES` 순서의 헤더가 있는 CSV 기록기."""
+
+    format = "csv"
+
+    def __init__(self, path: str | Path, buffer_bytes: int = 1024 * 1024):
+        super().__init__(path)
+        self._file = open(self.path, "w", encoding="utf-8", newline="", buffering=buffer_bytes)
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELD_NAMES)
+        self._writer.writeheader()
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        self._writer.writerow(record)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    ``row_group_size`` 행마다 row group 하나를 쓰는 Parquet 기록기 (pyarrow 필요).
+
+    쓰지 않은 행만 메모리에 두므로 메모리 사용량은 row_group_size 에 비례한다.
+    :meth:`flush` 를 호출하면 모인 행을 바로 row group 으로 쓴다. Parquet 은 footer 를
+    :meth:`close` 에서 기록하므로, 닫기 전에 프로세스가 끝나면 파일을 읽을 수 없다
+    (오래 실행되는 감시 모드에는 jsonl/csv 를 사용).
+    """
+
+    format = "parquet"
+
+    _ARROW_TYPES = {"string": "string", "float": "float64", "bool": "bool_"}
+
+    def __init__(self, path: str | Path, row_group_size: int = 10_000, compression: str = "zstd"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet 출력에는 pyarrow 가 필요합니다: pip install 'datamood[parquet]'"
+            ) from None
+        super().__init__(path)
+        self._pa = pa
+        self.row_group_size = max(1, row_group_size)
+        self.schema = pa.schema(
+            [(name, getattr(pa, self._ARROW_TYPES[kind])()) for name, kind in RESULT_FIELDS]
+        )
+        self._writer = pq.ParquetWriter(str(self.path), self.schema, compression=compression)
+        self._columns: Dict[str, List[Any]] = {name: [] for name in FIELD_NAMES}
+        self._buffered = 0
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        for name in FIELD_NAMES:
+            self._columns[name].append(record[name])
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffered:
+            return
+        table = self._pa.Table.from_pydict(self._columns, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self._buffered)
+        self._columns = {name: [] for name in FIELD_NAMES}
+        self._buffered = 0
+
+    def flush(self) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+
+_WRITERS = {
+    "jsonl": JsonlResultWriter,
+    "csv": CsvResultWriter,
+    "parquet": ParquetResultWriter,
+}
+
+
+def open_result_writer(path: str | Path, format: Optional[str] = None, **options) -> ResultWriter:
+    """
+    형식에 맞는 결과 기록기를 만든다.
+
+    Parameters
+    ----------
+    path : str or Path
+        결과 파일 경로.
+    format : {"jsonl", "csv", "parquet"}, optional
+        출력 형식. 생략하면 파일 확장자로 정하고, 알 수 없으면 jsonl.
+    **options
+        기록기 옵션 (buffer_bytes, row_group_size, compression 등).
+
+    Returns
+    -------
+    ResultWriter
+        결과 기록기.
+
+    Examples
+    --------
+    >>> with open_result_writer("results.parquet") as writer:
+    ...     for path in iter_input_files(Path("data")):
+    ...         writer.write(sorter.sort_file(path, "sorted"))
+    """
+    return _WRITERS[result_format(path, format)](path, **options)
+
+
+def result_format(path: str | Path, format: Optional[str] = None) -> str:
+    """
+    결과 파일 형식을 정한다. format 을 생략하면 확장자로 정하고, 알 수 없으면 jsonl.
+
+    Raises
+    ------
+    ValueError
+        지원하지 않는 format 을 지정한 경우.
+    """
+    if format is None:
+        suffix = Path(path).suffix.lower().lstrip(".")
+        format = suffix if suffix in _WRITERS else "jsonl"
+    if format not in _WRITERS:
+        raise ValueError(f"format 은 {OUTPUT_FORMATS} 중 하나여야 합니다: {format!r}")
+    return format
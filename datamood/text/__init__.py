@@ -1,4 +1,42 @@
 # datamood/text/__init__.py
-from .text_mood import EmphaticSentimentAnalyzer, MorphSentimentAnalyzer
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["EmphaticSentimentAnalyzer", "MorphSentimentAnalyzer"]
+# konlpy(JVM), bs4, requests 는 분석기를 실제로 사용할 때 로드한다
+_EXPORTS = {
+    "EmphaticSentimentAnalyzer": ".text_mood",
+    "MorphSentimentAnalyzer": ".text_mood",
+    "shared_tokenizer": ".text_mood",
+    "get_session": ".http_client",
+    "configure_session": ".http_client",
+    "HttpCache": ".http_cache",
+    "SelectorCache": ".selector_cache",
+}
+
+if TYPE_CHECKING:
+    from .text_mood import EmphaticSentimentAnalyzer, MorphSentimentAnalyzer, shared_tokenizer
+    from .http_client import get_session, configure_session
+    from .http_cache import HttpCache
+    from .selector_cache import SelectorCache
+
+__all__ = [
+    "EmphaticSentimentAnalyzer",
+    "MorphSentimentAnalyzer",
+    "shared_tokenizer",
+    "get_session",
+    "configure_session",
+    "HttpCache",
+    "SelectorCache",
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
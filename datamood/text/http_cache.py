@@ -0,0 +1,288 @@
+# datamood/text/http_cache.py
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+"""
+datamood.text.http_cache
+------------------------
+기사 URL 수집용 디스크 HTTP 캐시
+
+응답 본문(HTML)과 검증자(ETag / Last-Modified), 그리고 추출된 (제목, 본문)을
+함께 저장합니다. 같은 URL 을 다시 수집할 때는 조건부 GET
+(If-None-Match / If-Modified-Since)으로 재검증하며, 서버가 304 를 돌려주면
+본문 다운로드와 BeautifulSoup 파싱을 모두 건너뛰고 저장된 (제목, 본문)을 사용합니다.
+
+주요 클래스
+- HttpCache: SQLite 기반, TTL + 크기 제한 LRU 캐시
+"""
+
+# fetch 결과의 캐시 상태
+CACHE_FRESH = "fresh"                # 요청 없이 캐시 사용 (fresh_seconds 이내)
+CACHE_NOT_MODIFIED = "not_modified"  # 304: 다운로드/파싱 생략
+CACHE_MISS = "miss"                  # 200: 새로 받아 파싱 후 저장
+
+
+class HttpCache:
+    """
+    기사 HTML 과 추출 결과를 SQLite 파일에 저장하는 HTTP 캐시.
+
+    - 마지막 검증 후 ``ttl_seconds`` 가 지난 항목은 삭제합니다.
+    - 저장된 데이터의 총 크기가 ``max_bytes`` 를 넘으면 가장 오래 사용되지 않은
+      항목부터 삭제합니다.
+    - 마지막 검증 후 ``fresh_seconds`` 이내의 항목은 요청 없이 바로 사용하고,
+      그 이후에는 조건부 GET 으로 재검증합니다.
+
+    여러 스레드에서 함께 사용해도 안전합니다.
+
+    Parameters
+    ----------
+    path : str, optional
+        캐시 SQLite 파일 경로. 기본값은 ``~/.cache/datamood/http.sqlite``.
+    ttl_seconds : float, optional
+        항목 보관 기간(초). 기본값은 7일.
+    max_bytes : int, optional
+        캐시에 보관할 데이터의 최대 총 크기(바이트, HTML 은 압축 후 크기). 기본값은 256MB.
+    fresh_seconds : float, optional
+        재검증 없이 캐시를 그대로 사용할 기간(초). 기본값은 0 (항상 재검증).
+
+    Examples
+    --------
+    >>> cache = HttpCache("http.sqlite")
+    >>> Converter_save.text_converter(url, cache=cache)  # 200: 다운로드 + 파싱 + 저장
+    >>> Converter_save.text_converter(url, cache=cache)  # 304: 저장된 (제목, 본문) 사용
+    >>> cache.stats()["not_modified"]
+    1
+    """
+
+    DEFAULT_PATH = os.path.join("~", ".cache", "datamood", "http.sqlite")
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        fresh_seconds: float = 0.0,
+    ):
+        self.path = os.path.expanduser(path or self.DEFAULT_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.counts = {CACHE_FRESH: 0, CACHE_NOT_MODIFIED: 0, CACHE_MISS: 0}
+        self._lock = threading.Lock()
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY,"
+            " html BLOB NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " title TEXT NOT NULL,"
+            " body TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " validated_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_access ON pages (last_access)"
+        )
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        URL 의 캐시 항목을 조회합니다. 적중 시 접근 시각을 갱신합니다.
+
+        Parameters
+        ----------
+        url : str
+            기사 URL.
+
+        Returns
+        -------
+        dict or None
+            url, html, etag, last_modified, title, body, validated_at,
+            fresh(재검증 없이 사용 가능 여부) 키를 가진 딕셔너리.
+            없거나 TTL 이 지났으면 ``None``.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT html, etag, last_modified, title, body, validated_at "
+                "FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            html, etag, last_modified, title, body, validated_at = row
+            if now - validated_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE pages SET last_access = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+        return {
+            "url": url,
+            "html": zlib.decompress(html).decode("utf-8"),
+            "etag": etag,
+            "last_modified": last_modified,
+            "title": title,
+            "body": body,
+            "validated_at": validated_at,
+            "fresh": now - validated_at <= self.fresh_seconds,
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        """
+        캐시 항목으로 조건부 GET 헤더를 만듭니다.
+
+        Parameters
+        ----------
+        entry : dict or None
+            :meth:`lookup` 결과.
+
+        Returns
+        -------
+        dict
+            If-None-Match / If-Modified-Since 헤더 (검증자가 없으면 빈 딕셔너리).
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        html: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        title: str,
+        body: str,
+    ) -> None:
+        """
+        응답 HTML, 검증자, 추출 결과를 저장하고 용량/기간을 넘은 항목을 정리합니다.
+
+        검증자(ETag, Last-Modified)가 모두 없는 응답도 저장하지만,
+        재검증 시에는 항상 새로 다운로드됩니다.
+
+        Parameters
+        ----------
+        url : str
+            기사 URL.
+        html : str
+            응답 HTML.
+        etag, last_modified : str or None
+            응답의 ETag / Last-Modified 헤더 값.
+        title, body : str
+            :meth:`Converter_save.extract_from_html` 로 추출한 제목과 본문.
+        """
+        packed = zlib.compress(html.encode("utf-8"), 6)
+        size = len(packed) + len(title.encode("utf-8")) + len(body.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, html, etag, last_modified, title, body, size, validated_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, packed, etag, last_modified, title, body, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def mark_validated(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> None:
+        """
+        304 응답을 받은 항목의 검증 시각을 갱신합니다.
+
+        304 응답에 새 검증자가 있으면 함께 갱신합니다.
+
+        Parameters
+        ----------
+        url : str
+            기사 URL.
+        etag, last_modified : str, optional
+            304 응답의 ETag / Last-Modified 헤더 값.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET validated_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE url = ?",
+                (time.time(), etag, last_modified, url),
+            )
+            self._conn.commit()
+
+    def record(self, outcome: str) -> None:
+        """fetch 결과(fresh / not_modified / miss)를 통계에 반영한다."""
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+    def _evict(self) -> None:
+        """TTL 이 지난 항목을 지우고, 총 크기가 ``max_bytes`` 이하가 될 때까지 오래된 항목을 삭제한다."""
+        self._conn.execute(
+            "DELETE FROM pages WHERE validated_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT url, size FROM pages ORDER BY last_access ASC"
+        ).fetchall()
+        stale = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", stale)
+
+    def stats(self) -> dict:
+        """
+        캐시 사용 통계를 반환합니다.
+
+        Returns
+        -------
+        dict
+            fresh, not_modified, miss, hit_rate, entries, bytes 키를 포함하는 딕셔너리.
+            hit_rate 는 파싱을 건너뛴 비율 ((fresh + not_modified) / 전체)입니다.
+        """
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+            counts = dict(self.counts)
+        lookups = sum(counts.values())
+        hits = counts[CACHE_FRESH] + counts[CACHE_NOT_MODIFIED]
+        return {
+            **counts,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def clear(self) -> None:
+        """캐시의 모든 항목을 삭제하고 통계를 초기화합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+            self.counts = {CACHE_FRESH: 0, CACHE_NOT_MODIFIED: 0, CACHE_MISS: 0}
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
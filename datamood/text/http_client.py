@@ -0,0 +1,177 @@
+# datamood/text/http_client.py
+import importlib.util
+import threading
+from typing import Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..registry import default_registry
+
+"""
+datamood.text.http_client
+-------------------------
+기사/블로그 수집용 공유 HTTP 세션 계층
+
+호스트별 커넥션 풀과 keep-alive 로 같은 도메인의 TLS 핸드셰이크를 재사용하고,
+gzip/deflate(설치되어 있으면 brotli) 압축 전송을 협상하며, 일시적인 오류는
+지수 백오프로 제한된 횟수만큼 재시도합니다.
+
+주요 함수
+- build_session(...): 설정이 적용된 새 ``requests.Session`` 생성
+- get_session(): 프로세스 전역 공유 세션 (첫 사용 시 생성)
+- configure_session(...): 공유 세션 설정 변경
+- connection_stats(session): 호스트별 신규 연결 수/요청 수 (재사용 확인용)
+"""
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 공유 세션 설정 (configure_session 으로 변경)
+_session_options = {}
+_options_lock = threading.Lock()
+
+
+def _accept_encoding() -> str:
+    """urllib3 가 풀 수 있는 압축 방식만 Accept-Encoding 으로 광고한다."""
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        return "gzip, deflate, br"
+    return "gzip, deflate"
+
+
+def build_session(
+    pool_connections: int = 32,
+    pool_maxsize: int = 16,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    retry_status: Iterable[int] = RETRY_STATUS,
+    headers: Optional[dict] = None,
+) -> requests.Session:
+    """
+    커넥션 풀/재시도/압축 협상이 설정된 ``requests.Session`` 을 만듭니다.
+
+    Parameters
+    ----------
+    pool_connections : int, optional
+        커넥션 풀을 유지할 최대 호스트 수. 기본값은 32.
+    pool_maxsize : int, optional
+        호스트 하나당 유지할 최대 keep-alive 연결 수. 기본값은 16.
+    retries : int, optional
+        연결 오류/읽기 오류/재시도 대상 상태 코드에 대한 최대 재시도 횟수. 기본값은 3.
+    backoff_factor : float, optional
+        재시도 간 대기 시간 계수 (``backoff_factor * 2 ** (시도 - 1)`` 초). 기본값은 0.5.
+    retry_status : Iterable[int], optional
+        재시도할 HTTP 상태 코드. 기본값은 429, 500, 502, 503, 504.
+    headers : dict, optional
+        모든 요청에 추가할 기본 헤더.
+
+    Returns
+    -------
+    requests.Session
+        설정이 적용된 세션.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(retry_status),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept-Encoding": _accept_encoding(),
+        "Connection": "keep-alive",
+    })
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    프로세스 전역에서 공유하는 HTTP 세션을 반환합니다.
+
+    처음 호출할 때 :func:`configure_session` 으로 지정한 설정(기본값)으로 생성되며,
+    :func:`datamood.registry.close_shared` 호출 시 연결과 함께 해제됩니다.
+
+    Returns
+    -------
+    requests.Session
+        공유 세션.
+    """
+    with _options_lock:
+        options = dict(_session_options)
+    return default_registry.get(_session_key(options), lambda: build_session(**options))
+
+
+def _session_key(options: dict) -> tuple:
+    """설정별 공유 세션의 레지스트리 키."""
+    return ("http_session", tuple(sorted((k, repr(v)) for k, v in options.items())))
+
+
+def configure_session(**options) -> requests.Session:
+    """
+    공유 세션의 설정을 바꿉니다. 이후 :func:`get_session` 은 새 설정의 세션을 반환하며,
+    이전 설정의 공유 세션은 닫습니다 (이미 받아 둔 참조로는 더 이상 요청하지 마세요).
+
+    Parameters
+    ----------
+    **options
+        :func:`build_session` 의 인자 (예: ``pool_maxsize=64``, ``retries=5``).
+
+    Returns
+    -------
+    requests.Session
+        새 설정이 적용된 공유 세션.
+    """
+    with _options_lock:
+        old_key = _session_key(_session_options)
+        _session_options.clear()
+        _session_options.update(options)
+        new_key = _session_key(_session_options)
+    if old_key != new_key:
+        default_registry.discard(old_key)
+    return get_session()
+
+
+def connection_stats(session: Optional[requests.Session] = None) -> dict:
+    """
+    세션의 호스트별 커넥션 풀 통계를 반환합니다.
+
+    ``connections`` 가 ``requests`` 보다 작으면 keep-alive 로 연결이 재사용된 것입니다.
+
+    Parameters
+    ----------
+    session : requests.Session, optional
+        통계를 볼 세션. 생략하면 공유 세션.
+
+    Returns
+    -------
+    dict
+        ``"scheme://host:port"`` → {"connections": 새로 연 연결 수, "requests": 요청 수}
+    """
+    session = session or get_session()
+    stats = {}
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            name = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+            stats[name] = {
+                "connections": pool.num_connections,
+                "requests": pool.num_requests,
+            }
+    return stats
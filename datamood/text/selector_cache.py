@@ -0,0 +1,237 @@
+# datamood/text/selector_cache.py
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+"""
+datamood.text.selector_cache
+----------------------------
+호스트별 본문 셀렉터 학습 캐시
+
+같은 사이트의 기사는 대부분 같은 본문 컨테이너를 사용하므로, 호스트마다
+본문을 찾은 셀렉터를 기억해 두고 다음 페이지에서 그 셀렉터를 먼저 시도합니다.
+학습된 셀렉터가 맞지 않으면(미스) 전체 셀렉터 목록으로 되돌아가고, 새로 찾은
+셀렉터로 다시 학습합니다. 학습 결과와 적중/미스 통계는 SQLite 파일에 저장됩니다.
+
+주요 클래스
+- SelectorCache: 호스트 → 셀렉터 이름, 적중/미스 통계
+"""
+
+
+def host_of(url: str) -> str:
+    """URL 의 호스트(포트 포함)를 소문자로 반환한다. URL 이 아니면 그대로 소문자로 반환한다."""
+    return (urlsplit(url).netloc or url).lower()
+
+
+class SelectorCache:
+    """
+    호스트별로 본문을 찾은 셀렉터를 기억하는 캐시.
+
+    - :meth:`lookup` 은 호스트에 학습된 셀렉터 이름을 반환합니다.
+    - :meth:`record` 는 실제로 본문을 찾은 셀렉터로 통계를 갱신합니다.
+      학습된 셀렉터로 찾았으면 적중, 아니면 미스이며, 미스일 때 다른 셀렉터로
+      본문을 찾았으면 그 셀렉터로 다시 학습합니다. 어떤 셀렉터로도 찾지 못한
+      미스가 ``relearn_after`` 번 연속되면 학습 결과를 지웁니다.
+
+    학습 결과는 바뀔 때 바로 저장하고, 적중/미스 카운터는 ``flush_every`` 번
+    기록마다(그리고 :meth:`flush`, :meth:`close` 시) 저장합니다.
+    여러 스레드에서 함께 사용해도 안전합니다.
+
+    Parameters
+    ----------
+    path : str, optional
+        SQLite 파일 경로. 기본값은 ``~/.cache/datamood/selectors.sqlite``.
+    relearn_after : int, optional
+        학습 결과를 지우기까지 허용하는 연속 미스(본문 셀렉터 없음) 횟수. 기본값은 3.
+    flush_every : int, optional
+        카운터를 저장하는 기록 간격. 기본값은 50.
+
+    Examples
+    --------
+    >>> cache = SelectorCache("selectors.sqlite")
+    >>> Converter_save.extract_from_html(html, url=url, selector_cache=cache)
+    >>> cache.lookup(url)
+    'id:contains:article'
+    >>> cache.stats()["hit_rate"]
+    0.9
+    """
+
+    DEFAULT_PATH = os.path.join("~", ".cache", "datamood", "selectors.sqlite")
+
+    def __init__(self, path: Optional[str] = None, relearn_after: int = 3, flush_every: int = 50):
+        self.path = os.path.expanduser(path or self.DEFAULT_PATH)
+        self.relearn_after = max(1, relearn_after)
+        self.flush_every = max(1, flush_every)
+        self.relearned = 0
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._pending = 0
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS selectors ("
+            " host TEXT PRIMARY KEY,"
+            " selector TEXT,"
+            " hits INTEGER NOT NULL,"
+            " misses INTEGER NOT NULL,"
+            " streak INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        # host → [selector, hits, misses, 연속 미스]
+        self._hosts = {
+            host: [selector, hits, misses, streak]
+            for host, selector, hits, misses, streak in self._conn.execute(
+                "SELECT host, selector, hits, misses, streak FROM selectors"
+            )
+        }
+
+    def lookup(self, url: str) -> Optional[str]:
+        """
+        URL 의 호스트에 학습된 셀렉터 이름을 반환합니다.
+
+        Parameters
+        ----------
+        url : str
+            문서 URL (또는 호스트 이름).
+
+        Returns
+        -------
+        str or None
+            셀렉터 이름. 학습된 것이 없으면 ``None``.
+        """
+        with self._lock:
+            entry = self._hosts.get(host_of(url))
+            return entry[0] if entry else None
+
+    def record(self, url: str, preferred: Optional[str], used: Optional[str]) -> bool:
+        """
+        추출 결과를 기록하고 필요하면 다시 학습합니다.
+
+        Parameters
+        ----------
+        url : str
+            문서 URL (또는 호스트 이름).
+        preferred : str or None
+            추출 전에 :meth:`lookup` 으로 얻은 셀렉터.
+        used : str or None
+            실제로 본문을 찾은 셀렉터 (:meth:`Converter_save.extract_article` 의 selector).
+
+        Returns
+        -------
+        bool
+            적중(학습된 셀렉터로 본문을 찾음) 여부.
+        """
+        host = host_of(url)
+        hit = preferred is not None and used == preferred
+        with self._lock:
+            entry = self._hosts.setdefault(host, [None, 0, 0, 0])
+            if hit:
+                entry[1] += 1
+                entry[3] = 0
+            else:
+                entry[2] += 1
+                if used is not None:
+                    if entry[0] is not None and entry[0] != used:
+                        self.relearned += 1
+                    entry[0] = used
+                    entry[3] = 0
+                else:
+                    entry[3] += 1
+                    if entry[3] >= self.relearn_after:
+                        entry[0] = None
+            self._dirty.add(host)
+            self._pending += 1
+            # 학습 결과가 바뀌었거나 기록이 쌓이면 저장
+            if not hit and used is not None or self._pending >= self.flush_every:
+                self._flush()
+        return hit
+
+    def _flush(self) -> None:
+        """변경된 호스트의 상태를 저장한다."""
+        if not self._dirty:
+            return
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO selectors (host, selector, hits, misses, streak, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(host, *self._hosts[host], now) for host in self._dirty],
+        )
+        self._conn.commit()
+        self._dirty.clear()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """저장하지 않은 카운터를 파일에 기록합니다."""
+        with self._lock:
+            self._flush()
+
+    def host_stats(self, url: str) -> Optional[dict]:
+        """
+        호스트 하나의 학습 상태를 반환합니다.
+
+        Returns
+        -------
+        dict or None
+            selector, hits, misses, hit_rate 키를 가진 딕셔너리. 기록이 없으면 ``None``.
+        """
+        with self._lock:
+            entry = self._hosts.get(host_of(url))
+            if entry is None:
+                return None
+            selector, hits, misses, _ = entry
+        lookups = hits + misses
+        return {
+            "selector": selector,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def stats(self) -> dict:
+        """
+        전체 적중 통계를 반환합니다.
+
+        Returns
+        -------
+        dict
+            hosts, learned(셀렉터가 학습된 호스트 수), hits, misses, hit_rate,
+            relearned(이 인스턴스에서 셀렉터가 바뀐 횟수) 키를 포함하는 딕셔너리.
+        """
+        with self._lock:
+            entries = list(self._hosts.values())
+        hits = sum(entry[1] for entry in entries)
+        misses = sum(entry[2] for entry in entries)
+        lookups = hits + misses
+        return {
+            "hosts": len(entries),
+            "learned": sum(1 for entry in entries if entry[0] is not None),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "relearned": self.relearned,
+        }
+
+    def clear(self) -> None:
+        """학습 결과와 통계를 모두 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM selectors")
+            self._conn.commit()
+            self._hosts.clear()
+            self._dirty.clear()
+            self._pending = 0
+            self.relearned = 0
+
+    def close(self) -> None:
+        """남은 카운터를 저장하고 SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
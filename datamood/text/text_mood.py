@@ -1,7 +1,7 @@
 # datamood/text/text_mood.py
-from konlpy.tag import Okt
 import math
-from .텍스트추출_저장 import Converter_save
+
+from ..registry import shared
 
 """
 datamood.text_mood
@@ -11,9 +11,66 @@ datamood.text_mood
 주요 함수
 - text_analyze(text): 문장 감정 분석
 - analyze_txt_file(sample.txt) : txt파일을 읽어서 감정 분석
+- label_from_percentage(percentage): 감성 백분율 → 감정 레이블
+- shared_tokenizer(): 프로세스 전역에서 공유하는 Okt 형태소 분석기
 """
 
 
+def label_from_percentage(percentage: float) -> str:
+    """
+    감성 백분율(0~100)을 세분화된 감정 레이블로 변환합니다.
+
+    Parameters
+    ----------
+    percentage : float
+        :meth:`MorphSentimentAnalyzer.text_analyze` 의 ``percentage`` 값.
+
+    Returns
+    -------
+    str
+        "매우 긍정적", "긍정적", "약간 긍정적", "중립적",
+        "약간 부정적", "부정적", "매우 부정적" 중 하나.
+    """
+    if percentage >= 80.0:
+        return "매우 긍정적"
+    if percentage >= 60.0:
+        return "긍정적"
+    if percentage >= 52.0:
+        return "약간 긍정적"
+    if percentage <= 20.0:
+        return "매우 부정적"
+    if percentage <= 40.0:
+        return "부정적"
+    if percentage <= 48.0:
+        return "약간 부정적"
+    return "중립적"
+
+
+def shared_tokenizer(**okt_options):
+    """
+    설정별로 하나만 생성되는 공유 Okt 형태소 분석기를 반환합니다.
+
+    Okt 생성은 JVM 기동과 사전 로딩을 포함하므로, 같은 설정의 분석기들은
+    :mod:`datamood.registry` 를 통해 하나의 인스턴스를 재사용합니다.
+
+    Parameters
+    ----------
+    **okt_options
+        ``konlpy.tag.Okt`` 생성자에 전달할 인자 (예: ``max_heap_size``).
+
+    Returns
+    -------
+    konlpy.tag.Okt
+        공유 형태소 분석기.
+    """
+    def factory():
+        from konlpy.tag import Okt
+
+        return Okt(**okt_options)
+
+    return shared(("okt", tuple(sorted(okt_options.items()))), factory)
+
+
 class MorphSentimentAnalyzer:
     """
     형태소 분석(Okt), 확장된 감성 사전(Lexicon), 문맥 규칙(부정어/강조어),
@@ -23,15 +80,20 @@ class MorphSentimentAnalyzer:
     최종 감성 점수와 백분율을 계산합니다.
     """
 
-    def __init__(self):
+    def __init__(self, okt=None):
         """
         MorphSentimentAnalyzer의 인스턴스를 초기화합니다.
 
         한국어 형태소 분석기(Okt), 확장된 감성 사전(lexicon), 어간 매핑 사전,
         IDF 가중치, 부정어, 강조어, 약화어 목록 등을 로드합니다.
+
+        Parameters
+        ----------
+        okt : konlpy.tag.Okt, optional
+            사용할 형태소 분석기. 생략하면 :func:`shared_tokenizer` 의 공유 인스턴스를 사용합니다.
         """
         # ... (생략된 초기화 코드) ...
-        self.okt = Okt()
+        self.okt = okt if okt is not None else shared_tokenizer()
         
         # 확장된 감성 사전
         self.lexicon = {
@@ -410,20 +472,7 @@ class MorphSentimentAnalyzer:
             
             
             # 세분화된 라벨링
-            if percentage >= 80.0:
-                label = "매우 긍정적"
-            elif percentage >= 60.0:
-                label = "긍정적"
-            elif percentage >= 52.0:
-                label = "약간 긍정적"
-            elif percentage <= 20.0:
-                label = "매우 부정적"
-            elif percentage <= 40.0:
-                label = "부정적"
-            elif percentage <= 48.0:
-                label = "약간 부정적"
-            else:
-                label = "중립적"
+            label = label_from_percentage(percentage)
         
         rst = {
             "text": text,
@@ -467,8 +516,29 @@ class EmphaticSentimentAnalyzer:
     텍스트, 파일, URL 등에 대한 감성 분석을 수행하는 public 인터페이스를 제공합니다.
     """
 
-    def __init__(self):
-        self._impl = MorphSentimentAnalyzer()
+    def __init__(self, okt=None):
+        self._impl = MorphSentimentAnalyzer(okt=okt)
+
+    @classmethod
+    def shared(cls) -> "EmphaticSentimentAnalyzer":
+        """
+        프로세스 전역에서 공유하는 분석기 인스턴스를 반환합니다.
+
+        처음 호출할 때 한 번만 생성되며, 이후에는 같은 인스턴스를 돌려줍니다.
+        :func:`datamood.registry.close_shared` 로 해제할 수 있습니다.
+
+        :returns: 공유 감성 분석기.
+        :rtype: EmphaticSentimentAnalyzer
+        """
+        return shared(("analyzer", cls.__qualname__), cls)
+
+    def warm_up(self) -> None:
+        """
+        형태소 분석기를 한 번 실행해 JVM 기동과 사전 로딩을 미리 끝냅니다.
+
+        감시 모드처럼 첫 입력의 지연이 중요할 때 시작 시 호출합니다.
+        """
+        self._impl.okt.pos("준비", stem=True)
 
     def analyze(self, text: str) -> dict:
         """
@@ -531,19 +601,48 @@ class EmphaticSentimentAnalyzer:
         except Exception as e:
             print(f"파일 처리 중 오류가 발생했습니다: {e}")
 
-    def analyze_url(self, url: str) -> dict:
+    def analyze_url(self, url: str, session=None, cache=None, selector_cache=None) -> dict:
         """
         URL(기사/블로그 등)을 파싱하여 본문 텍스트에 대한 감성 분석을 수행합니다.
 
         :param url: 분석할 웹 페이지의 URL.
         :type url: str
+        :param session: 요청에 사용할 HTTP 세션. 생략하면 공유 세션(keep-alive 재사용).
+        :type session: requests.Session, optional
+        :param cache: 디스크 HTTP 캐시. 지정하면 조건부 GET 으로 재검증하고 304 이면 파싱을 생략.
+        :type cache: HttpCache, optional
+        :param selector_cache: 호스트별 본문 셀렉터 캐시. 학습된 셀렉터를 먼저 시도.
+        :type selector_cache: SelectorCache, optional
         :returns: 감성 분석 결과와 제목, URL 정보가 추가된 딕셔너리.
+            수집 정보로 cache(HTTP 캐시 상태), truncated(다운로드가 잘린 이유),
+            skipped(추출을 건너뛴 이유) 키가 함께 담긴다.
         :rtype: dict
         """
         # ... (analyze_url 구현 코드)
         # 1) URL에서 제목, 본문 추출
-        title, body = Converter_save.text_converter(url)
+        from .텍스트추출_저장 import Converter_save
+
+        document = Converter_save.fetch_document(
+            url, session=session, cache=cache, selector_cache=selector_cache
+        )
+        result = self.analyze_document(document["title"], document["body"], url)
+        for key in ("cache", "truncated", "skipped"):
+            result[key] = document[key]
+        return result
+
+    def analyze_document(self, title: str, body: str, url: str) -> dict:
+        """
+        이미 추출된 웹 문서의 제목/본문에 대한 감성 분석을 수행합니다.
 
+        :param title: 문서 제목.
+        :type title: str
+        :param body: 정제된 본문 텍스트.
+        :type body: str
+        :param url: 문서 URL.
+        :type url: str
+        :returns: 감성 분석 결과와 제목, URL 정보가 추가된 딕셔너리 (:meth:`analyze_url` 과 동일).
+        :rtype: dict
+        """
         # 2) 본문이 비어 있으면 기본값 반환
         if not body.strip():
             return {
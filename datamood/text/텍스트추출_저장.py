@@ -1,9 +1,9 @@
 # 파일: datamood/text_utils/converter_save.py
 
-import requests
-from bs4 import BeautifulSoup
+import codecs
 import os
 import re
+import time
 
 """
 datamood.텍스트추출_저장
@@ -12,8 +12,147 @@ datamood.텍스트추출_저장
 
 주요 함수
 - text_converter(url): 인터넷 크롤링(텍스트 추출)
+- fetch_html(url) / extract_from_html(html): 요청 단계와 추출 단계를 따로 수행
+- fetch_page(url, cache=...): 디스크 HTTP 캐시를 이용한 조건부 요청
 - save_to_file: 추출한 텍스트를 txt파일로 저장
 """
+# 광고/공유/저작권 등 제거할 요소의 class/id 패턴 (부분 일치)
+UNWANTED_PATTERNS = (
+    'ad', 'banner', 'share', 'sns', 'footer', 'copyright',
+    'related', 'aside', 'caption', 'byline', 'journalist'
+)
+_UNWANTED_RE = re.compile("|".join(map(re.escape, UNWANTED_PATTERNS)))
+
+# 통째로 제거할 태그
+UNWANTED_TAGS = frozenset({'script', 'style', 'img', 'iframe', 'button', 'a'})
+
+# 본문 후보 셀렉터 (앞쪽일수록 우선): (속성, 비교 방식, 값)
+_ARTICLE_SELECTORS = (
+    ("class", "token", "se-main-container"),  # 네이버 블로그 본문 최우선
+    ("class", "token", "se_doc_viewer"),      # 네이버 블로그 본문
+    ("id", "equals", "article_content"),      # 일반 뉴스 기사
+    ("class", "token", "article_body"),
+    ("class", "token", "article_content"),
+    ("id", "contains", "article"),
+    ("class", "contains", "article"),
+)
+
+# 본문 줄 필터
+_NEWLINES_RE = re.compile(r'\n+')
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, ["저작권", "ⓒ", "@", "무단전재", "배포금지"])))
+
+
+def _lxml_available() -> bool:
+    """lxml 설치 여부."""
+    import importlib.util
+
+    return importlib.util.find_spec("lxml") is not None
+
+
+def _class_tokens(tag) -> list:
+    """태그의 class 값을 토큰 리스트로 반환한다."""
+    value = tag.attrs.get('class')
+    if value is None:
+        return []
+    return value.split() if isinstance(value, str) else list(value)
+
+
+def _is_unwanted(tag) -> bool:
+    """class 토큰 또는 id 에 제거 패턴이 포함되어 있으면 True."""
+    if tag.name in UNWANTED_TAGS:
+        return True
+    for token in _class_tokens(tag):
+        if _UNWANTED_RE.search(token.lower()):
+            return True
+    tag_id = tag.attrs.get('id')
+    return bool(tag_id) and bool(_UNWANTED_RE.search(str(tag_id).lower()))
+
+
+def _strip_boilerplate(soup) -> None:
+    """
+    트리를 한 번 순회하며 불필요한 요소를 제거한다.
+
+    제거한 요소의 하위 트리는 다시 방문하지 않는다.
+    """
+    from bs4 import Tag
+
+    stack = [soup]
+    while stack:
+        node = stack.pop()
+        for child in list(node.contents):
+            if not isinstance(child, Tag):
+                continue
+            if _is_unwanted(child):
+                child.extract()
+            else:
+                stack.append(child)
+
+
+def selector_name(selector: tuple) -> str:
+    """셀렉터를 저장용 이름으로 바꾼다 (예: ``"class:token:article_body"``)."""
+    return ":".join(selector)
+
+
+# 이름 → 셀렉터
+_SELECTORS_BY_NAME = {selector_name(sel): sel for sel in _ARTICLE_SELECTORS}
+
+
+def _selector_matches(tag, selector: tuple, classes=None) -> bool:
+    """div 가 셀렉터 하나와 일치하는지 검사한다."""
+    attr, mode, value = selector
+    if attr == "class":
+        if classes is None:
+            classes = _class_tokens(tag)
+        if mode == "token":
+            return value in classes
+        return any(value in token.lower() for token in classes)
+    tag_id = tag.attrs.get('id')
+    if not tag_id:
+        return False
+    return tag_id == value if mode == "equals" else value in str(tag_id).lower()
+
+
+def _selector_rank(tag):
+    """div 가 일치하는 가장 높은 우선순위 셀렉터의 순번. 일치하지 않으면 None."""
+    classes = _class_tokens(tag)
+    for rank, selector in enumerate(_ARTICLE_SELECTORS):
+        if _selector_matches(tag, selector, classes):
+            return rank
+    return None
+
+
+def _find_article_div(soup):
+    """
+    div 를 한 번 순회하며 셀렉터 우선순위가 가장 높은 (같으면 문서 앞쪽) 본문 요소를 찾는다.
+
+    Returns
+    -------
+    tuple
+        (본문 요소, 셀렉터 이름). 없으면 (None, None).
+    """
+    best, best_rank = None, len(_ARTICLE_SELECTORS)
+    for div in soup.find_all("div"):
+        rank = _selector_rank(div)
+        if rank is not None and rank < best_rank:
+            best, best_rank = div, rank
+            if rank == 0:
+                break
+    if best is None:
+        return None, None
+    return best, selector_name(_ARTICLE_SELECTORS[best_rank])
+
+
+def _find_preferred_div(soup, name: str):
+    """학습된 셀렉터 하나로 첫 번째 일치 div 를 찾는다. 없으면 None."""
+    selector = _SELECTORS_BY_NAME.get(name)
+    if selector is None:
+        return None
+    for div in soup.find_all("div"):
+        if _selector_matches(div, selector):
+            return div
+    return None
+
+
 class Converter_save:
     """
     웹 URL에서 HTML을 가져와서 광고 및 불필요한 요소를 제거하고, 
@@ -28,13 +167,29 @@ class Converter_save:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 
+    # 기본 HTML 파서 ("html.parser", "lxml", "auto": lxml 이 있으면 lxml)
+    PARSER = "html.parser"
+
+    # 다운로드 제한: 최대 바이트 수 (압축 해제 후), 단계별 타임아웃(초)
+    MAX_BYTES = 2 * 1024 * 1024
+    CONNECT_TIMEOUT = 5.0
+    FIRST_BYTE_TIMEOUT = 10.0
+    TOTAL_TIMEOUT = 20.0
+
+    # 본문을 추출할 Content-Type (없으면 허용)
+    ALLOWED_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+    # 스트리밍으로 읽을 청크 크기
+    CHUNK_SIZE = 64 * 1024
+
     @staticmethod
-    def text_converter(url: str) -> tuple[str, str]:
+    def text_converter(url: str, session=None, cache=None, selector_cache=None) -> tuple[str, str]:
         """
         주어진 URL에서 제목과 광고/잡텍스트를 제거한 본문 내용을 추출합니다.
 
         이 메서드는 다음과 같은 과정을 거칩니다:
-        1. User-Agent를 포함한 HTTP GET 요청.
+        1. User-Agent를 포함한 HTTP GET 요청 (공유 세션의 keep-alive 연결 재사용,
+           스트리밍으로 읽으며 최대 크기/시간을 넘으면 중단, HTML 이 아니면 건너뜀).
         2. 네이버 블로그 등 복잡한 구조를 위해 여러 본문 셀렉터를 시도.
         3. 광고, SNS 공유 버튼, 저작권 관련 텍스트 등 불필요한 요소를 제거.
         4. 추출된 텍스트를 정리하고 반환.
@@ -43,6 +198,14 @@ class Converter_save:
         ----------
         url : str
             텍스트를 추출할 웹 페이지의 URL.
+        session : requests.Session, optional
+            요청에 사용할 세션. 생략하면
+            :func:`datamood.text.http_client.get_session` 의 공유 세션을 사용합니다.
+        cache : HttpCache, optional
+            디스크 HTTP 캐시. 지정하면 조건부 GET 으로 재검증하고, 304 응답이면
+            다운로드와 파싱 없이 저장된 (제목, 본문)을 반환합니다.
+        selector_cache : SelectorCache, optional
+            호스트별 본문 셀렉터 캐시. 지정하면 이 호스트에서 학습된 셀렉터를 먼저 시도합니다.
 
         Returns
         -------
@@ -59,88 +222,381 @@ class Converter_save:
         # (제공해 주신 text_converter 메서드의 전체 구현 코드를 여기에 넣으세요)
         # ... 
         
-        soup = None
-        
-        # 1. 1차 웹 페이지 요청 및 BeautifulSoup 객체 생성
+        document = Converter_save.fetch_document(
+            url, session=session, cache=cache, selector_cache=selector_cache
+        )
+        return document["title"], document["body"]
+
+    @staticmethod
+    def fetch_document(url: str, session=None, cache=None, selector_cache=None) -> dict:
+        """
+        URL 에서 제목과 본문을 추출하고, 수집 과정의 제한/캐시 정보를 함께 반환합니다.
+
+        :meth:`text_converter` 와 같은 과정을 거치며, 요청 실패 시에도 예외 대신
+        오류 메시지가 담긴 딕셔너리를 반환합니다.
+
+        Parameters
+        ----------
+        url : str
+            텍스트를 추출할 웹 페이지의 URL.
+        session : requests.Session, optional
+            요청에 사용할 세션. 생략하면 공유 세션을 사용합니다.
+        cache : HttpCache, optional
+            디스크 HTTP 캐시.
+        selector_cache : SelectorCache, optional
+            호스트별 본문 셀렉터 캐시.
+
+        Returns
+        -------
+        dict
+            다음 키를 포함하는 딕셔너리.
+
+            - title, body: 제목과 정제된 본문 (실패/건너뜀 시 본문은 빈 문자열)
+            - cache: HTTP 캐시 상태 (:meth:`fetch_page` 참고)
+            - truncated: 다운로드가 잘린 이유 ("max_bytes", "total_timeout") 또는 None
+            - skipped: 본문 추출을 건너뛴 이유 ("content_type: ...", "binary_content") 또는 None
+            - bytes: 받은 바이트 수 (압축 해제 후)
+            - error: 요청 오류 메시지 또는 None
+        """
+        import requests
+
+        # 1. 1차 웹 페이지 요청 (캐시가 있으면 조건부 요청, 스트리밍 + 크기/시간 제한)
         try:
-            # User-Agent 헤더를 사용하여 요청
-            res = requests.get(url, headers=Converter_save.DEFAULT_HEADERS, timeout=10)
-            res.raise_for_status() 
-            res.encoding = 'utf-8'  
-            soup = BeautifulSoup(res.text, "html.parser")
+            page = Converter_save.fetch_page(url, session=session, cache=cache)
         except requests.exceptions.RequestException as e:
             print(f"URL 접근 또는 요청 중 오류 발생: {e}")
-            return "오류: 페이지를 가져올 수 없음", ""
+            return {
+                "title": "오류: 페이지를 가져올 수 없음", "body": "", "cache": None,
+                "truncated": None, "skipped": None, "bytes": 0, "error": str(e),
+            }
 
-        
-        
-        # 제목 추출
+        document = {
+            "cache": page["cache"],
+            "truncated": page["truncated"],
+            "skipped": page["skipped"],
+            "bytes": page["bytes"],
+            "error": None,
+        }
+
+        # 2. HTML 이 아닌 응답은 파싱하지 않음
+        if page["skipped"]:
+            print(f"본문 추출 건너뜀 ({page['skipped']}): {url}")
+            return {"title": "건너뜀: HTML 이 아닌 응답", "body": "", **document}
+
+        # 3. 캐시 적중(304 등)이면 파싱 생략
+        if page["title"] is not None:
+            return {"title": page["title"], "body": page["body"], **document}
+
+        # 4. HTML 에서 제목/본문 추출 후 캐시에 저장 (잘린 응답은 저장하지 않음)
+        title, body = Converter_save.extract_from_html(
+            page["html"], url=url, selector_cache=selector_cache
+        )
+        if cache is not None and not page["truncated"]:
+            cache.store(url, page["html"], page["etag"], page["last_modified"], title, body)
+        return {"title": title, "body": body, **document}
+
+    @staticmethod
+    def fetch_html(url: str, session=None) -> str:
+        """
+        URL 의 HTML 을 가져옵니다. (네트워크 단계만 수행)
+
+        Parameters
+        ----------
+        url : str
+            가져올 웹 페이지의 URL.
+        session : requests.Session, optional
+            요청에 사용할 세션. 생략하면 공유 세션을 사용합니다.
+
+        Returns
+        -------
+        str
+            UTF-8 로 디코딩한 HTML 문자열.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            URL 접근 또는 요청 중 네트워크 오류나 4xx/5xx 응답이 발생했을 때.
+        """
+        return Converter_save.fetch_page(url, session=session)["html"]
+
+    @staticmethod
+    def fetch_page(
+        url: str,
+        session=None,
+        cache=None,
+        max_bytes: int | None = None,
+        connect_timeout: float | None = None,
+        first_byte_timeout: float | None = None,
+        total_timeout: float | None = None,
+    ) -> dict:
+        """
+        URL 의 HTML 을 가져옵니다. 캐시가 있으면 조건부 GET 으로 재검증합니다.
+
+        응답은 스트리밍으로 읽으며, 다음 제한을 넘으면 그 자리에서 연결을 닫습니다.
+
+        - Content-Type 이 :attr:`ALLOWED_CONTENT_TYPES` 가 아니거나 첫 청크에 NUL 바이트가
+          있으면(바이너리) 본문을 읽지 않고 ``skipped`` 로 표시합니다.
+        - 받은 바이트가 ``max_bytes`` 에 이르면 거기까지만 디코딩하고
+          ``truncated="max_bytes"`` 로 표시합니다.
+        - 요청 시작부터 ``total_timeout`` 초가 지나면 받은 데까지만 사용하고
+          ``truncated="total_timeout"`` 으로 표시합니다.
+
+        Parameters
+        ----------
+        url : str
+            가져올 웹 페이지의 URL.
+        session : requests.Session, optional
+            요청에 사용할 세션. 생략하면 공유 세션을 사용합니다.
+        cache : HttpCache, optional
+            디스크 HTTP 캐시.
+        max_bytes : int, optional
+            읽을 최대 바이트 수 (압축 해제 후). 기본값 :attr:`MAX_BYTES` (2MB).
+        connect_timeout : float, optional
+            연결 타임아웃(초). 기본값 :attr:`CONNECT_TIMEOUT`.
+        first_byte_timeout : float, optional
+            첫 바이트(및 청크 사이) 대기 타임아웃(초). 기본값 :attr:`FIRST_BYTE_TIMEOUT`.
+        total_timeout : float, optional
+            응답 본문 전체를 받는 제한 시간(초). 기본값 :attr:`TOTAL_TIMEOUT`.
+            연결/첫 바이트 타임아웃의 재시도 횟수는 세션의 재시도 설정을 따릅니다.
+
+        Returns
+        -------
+        dict
+            다음 키를 포함하는 딕셔너리.
+
+            - html: HTML 문자열 (건너뛴 경우 빈 문자열)
+            - title, body: 캐시에서 가져온 추출 결과. 새로 받은 응답이면 None
+              (호출한 쪽에서 추출한 뒤 ``cache.store`` 로 저장)
+            - etag, last_modified: 응답(또는 캐시)의 검증자
+            - cache: "fresh", "not_modified", "miss" 중 하나. 캐시를 쓰지 않으면 None
+            - truncated: "max_bytes", "total_timeout" 또는 None
+            - skipped: "content_type: <타입>", "binary_content" 또는 None
+            - bytes: 받은 바이트 수 (압축 해제 후)
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            연결/첫 바이트 타임아웃을 포함한 네트워크 오류나 4xx/5xx 응답이 발생했을 때.
+        """
+        from .http_cache import CACHE_FRESH, CACHE_MISS, CACHE_NOT_MODIFIED, HttpCache
+        from .http_client import get_session
+
+        entry = cache.lookup(url) if cache is not None else None
+        if entry is not None and entry["fresh"]:
+            cache.record(CACHE_FRESH)
+            return Converter_save._cached_page(entry, CACHE_FRESH)
+
+        session = session or get_session()
+        # User-Agent 헤더를 사용하여 요청 (캐시 항목이 있으면 검증자 추가)
+        headers = dict(Converter_save.DEFAULT_HEADERS, **HttpCache.conditional_headers(entry))
+        timeout = (
+            connect_timeout or Converter_save.CONNECT_TIMEOUT,
+            first_byte_timeout or Converter_save.FIRST_BYTE_TIMEOUT,
+        )
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as res:
+            if res.status_code == 304 and entry is not None:
+                cache.mark_validated(url, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+                cache.record(CACHE_NOT_MODIFIED)
+                return Converter_save._cached_page(entry, CACHE_NOT_MODIFIED)
+
+            res.raise_for_status()
+            if cache is not None:
+                cache.record(CACHE_MISS)
+            html, received, truncated, skipped = Converter_save._read_limited(
+                res,
+                max_bytes or Converter_save.MAX_BYTES,
+                total_timeout or Converter_save.TOTAL_TIMEOUT,
+            )
+            return {
+                "html": html,
+                "title": None,
+                "body": None,
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+                "cache": CACHE_MISS if cache is not None else None,
+                "truncated": truncated,
+                "skipped": skipped,
+                "bytes": received,
+            }
+
+    @staticmethod
+    def _read_limited(res, max_bytes: int, total_timeout: float) -> tuple:
+        """
+        스트리밍 응답을 제한 안에서 읽어 UTF-8 로 디코딩한다.
+
+        Returns
+        -------
+        tuple
+            (html, 받은 바이트 수, truncated 이유 또는 None, skipped 이유 또는 None)
+        """
+        content_type = res.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and not content_type.startswith(Converter_save.ALLOWED_CONTENT_TYPES):
+            return "", 0, None, f"content_type: {content_type}"
+
+        deadline = time.monotonic() + total_timeout
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts = []
+        received = 0
+        truncated = None
+        for chunk in res.iter_content(Converter_save.CHUNK_SIZE):
+            if not received and b"\x00" in chunk[:1024]:
+                return "", len(chunk), None, "binary_content"
+            if received + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - received]
+                truncated = "max_bytes"
+            received += len(chunk)
+            parts.append(decoder.decode(chunk))
+            if truncated:
+                break
+            if time.monotonic() > deadline:
+                truncated = "total_timeout"
+                break
+        if not truncated:
+            parts.append(decoder.decode(b"", final=True))
+        return "".join(parts), received, truncated, None
+
+    @staticmethod
+    def _cached_page(entry: dict, outcome: str) -> dict:
+        """캐시 항목을 fetch_page 결과 형식으로 바꾼다."""
+        return {
+            "html": entry["html"],
+            "title": entry["title"],
+            "body": entry["body"],
+            "etag": entry["etag"],
+            "last_modified": entry["last_modified"],
+            "cache": outcome,
+            "truncated": None,
+            "skipped": None,
+            "bytes": 0,
+        }
+
+    @staticmethod
+    def extract_from_html(
+        html: str,
+        parser: str | None = None,
+        url: str | None = None,
+        selector_cache=None,
+    ) -> tuple[str, str]:
+        """
+        HTML 문자열에서 제목과 광고/잡텍스트를 제거한 본문을 추출합니다. (CPU 단계만 수행)
+
+        불필요한 요소 제거는 트리를 한 번만 순회하며, class/id 는 미리 컴파일한
+        정규식으로, 태그 이름은 집합 조회로 검사합니다. 본문 셀렉터도 div 를
+        한 번 순회하면서 우선순위가 가장 높은 요소를 고릅니다.
+
+        Parameters
+        ----------
+        html : str
+            웹 페이지 HTML.
+        parser : str, optional
+            BeautifulSoup 파서 (``"html.parser"``, ``"lxml"``, ``"auto"``).
+            생략하면 :attr:`Converter_save.PARSER` (기본값 ``"html.parser"``).
+        url : str, optional
+            문서 URL. ``selector_cache`` 와 함께 지정하면 호스트별로 학습된 셀렉터를 먼저 시도합니다.
+        selector_cache : SelectorCache, optional
+            호스트별 본문 셀렉터 캐시.
+
+        Returns
+        -------
+        tuple[str, str]
+            (제목 문자열, 정제된 본문 문자열) 튜플.
+        """
+        preferred = None
+        if selector_cache is not None and url:
+            preferred = selector_cache.lookup(url)
+        extracted = Converter_save.extract_article(html, parser=parser, preferred=preferred)
+        if selector_cache is not None and url:
+            selector_cache.record(url, preferred, extracted["selector"])
+        return extracted["title"], extracted["body"]
+
+    @staticmethod
+    def extract_article(html: str, parser: str | None = None, preferred: str | None = None) -> dict:
+        """
+        HTML 에서 제목/본문을 추출하고, 본문을 찾은 셀렉터 정보를 함께 반환합니다.
+
+        ``preferred`` 셀렉터가 주어지면 그 셀렉터로 먼저 찾고, 일치하는 요소가 없거나
+        본문이 비어 있으면 전체 셀렉터 목록을 우선순위대로 검사합니다.
+
+        Parameters
+        ----------
+        html : str
+            웹 페이지 HTML.
+        parser : str, optional
+            BeautifulSoup 파서.
+        preferred : str, optional
+            먼저 시도할 셀렉터 이름 (:func:`selector_name`, 예: 호스트별 학습 결과).
+
+        Returns
+        -------
+        dict
+            title, body, selector(본문을 찾은 셀렉터 이름, 없으면 None),
+            hit(preferred 셀렉터로 찾았는지 여부) 키를 가진 딕셔너리.
+        """
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, Converter_save.resolve_parser(parser))
+
+        # 제목 추출 (광고 제거 전 첫 번째 h1)
         title_tag = soup.find('h1')
         title = title_tag.get_text(strip=True) if title_tag else "제목을 찾을 수 없습니다"
 
-        # 광고 및 불필요한 요소 사전 제거 (extract 사용)
-        unwanted_patterns = [
-            'ad', 'banner', 'share', 'sns', 'footer', 'copyright', 
-            'related', 'aside', 'caption', 'byline', 'journalist'
-        ]
-
-        for pattern in unwanted_patterns:
-            for tag in soup.find_all(lambda tag: tag.has_attr('class') and any(pattern in c.lower() for c in tag['class'])):
-                tag.extract()
-            for tag in soup.find_all(lambda tag: tag.has_attr('id') and pattern in tag['id'].lower()):
-                tag.extract()
-        
-        for tag_name in ['script', 'style', 'img', 'iframe', 'button', 'a']:
-            for tag in soup.find_all(tag_name):
-                tag.extract()
-
-
-        # 본문 추출 시도 (광고 제거 후)
-        selectors = [
-            {"class": "se-main-container"}, # 네이버 블로그 본문 최우선
-            {"class": "se_doc_viewer"},     # 네이버 블로그 본문
-            {"id": "article_content"},      # 일반 뉴스 기사
-            {"class": "article_body"},
-            {"class": "article_content"},
-            {"name": "div", "attrs": {"id": lambda x: x and "article" in x.lower()}},
-            {"name": "div", "attrs": {"class": lambda x: x and "article" in x.lower()}},
-        ]
-
-        article_text = None
-        for sel in selectors:
-            if 'name' in sel:
-                article_div = soup.find(sel['name'], **sel['attrs'])
-            else:
-                article_div = soup.find("div", **sel)
+        # 광고 및 불필요한 요소 제거 (트리 한 번 순회)
+        _strip_boilerplate(soup)
 
-            if article_div:
+        # 본문 추출 시도 (광고 제거 후): 학습된 셀렉터 → div 한 번 순회
+        article_text, selector, hit = None, None, False
+        if preferred:
+            article_div = _find_preferred_div(soup, preferred)
+            if article_div is not None:
                 article_text = article_div.get_text("\n", strip=True)
-                break
+                selector, hit = preferred, bool(article_text)
+        if not hit:
+            article_div, selector = _find_article_div(soup)
+            article_text = article_div.get_text("\n", strip=True) if article_div else None
 
         # 본문 정리 (Fallback 및 필터링)
         if not article_text:
             article_text = soup.get_text("\n")
 
-        result_lines = []
-        cleaned_text = re.sub(r'\n+', '\n', article_text).strip()
-        lines = cleaned_text.split("\n")
+        cleaned_text = _NEWLINES_RE.sub('\n', article_text).strip()
 
-        # 필터링 조건: 길이 완화 및 저작권 키워드 제거
-        forbidden_patterns = ["저작권", "ⓒ", "@", "무단전재", "배포금지"]
-
-        for line in lines:
+        result_lines = []
+        for line in cleaned_text.split("\n"):
             line = line.strip()
-            
-            # 길이 검사 완화: 5자 이상
-            if len(line) > 5 and not any(pattern in line for pattern in forbidden_patterns):
+
+            # 길이 검사 완화: 5자 이상, 저작권 키워드 제거
+            if len(line) > 5 and not _FORBIDDEN_RE.search(line):
                 # 단어당 글자 수가 너무 적은 (기호나 공백만 많은) 줄 방지
-                if len(line.split()) == 0 or len(line) / len(line.split()) > 3:
+                n_words = len(line.split())
+                if n_words == 0 or len(line) / n_words > 3:
                     result_lines.append(line)
 
         # 최종 텍스트 정리
         article = "\n".join(result_lines)
 
-        return title, article
+        return {"title": title, "body": article, "selector": selector, "hit": hit}
+
+    @staticmethod
+    def resolve_parser(parser: str | None = None) -> str:
+        """
+        BeautifulSoup 파서 이름을 결정합니다.
+
+        Parameters
+        ----------
+        parser : str, optional
+            ``"html.parser"``, ``"lxml"`` 또는 ``"auto"``. 생략하면
+            :attr:`Converter_save.PARSER` 를 사용합니다. ``"auto"`` 는 lxml 이
+            설치되어 있으면 lxml, 없으면 html.parser 를 선택합니다.
+
+        Returns
+        -------
+        str
+            BeautifulSoup 에 전달할 파서 이름.
+        """
+        parser = parser or Converter_save.PARSER
+        if parser == "auto":
+            return "lxml" if _lxml_available() else "html.parser"
+        return parser
 
     @staticmethod
     def save_to_file(title: str, body: str, directory: str = ".", filename_prefix: str = "article") -> str | None:
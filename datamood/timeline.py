@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+"""
+datamood.timeline
+-----------------
+오디오/영상의 시간 구간별 감정 타임라인
+
+음성 인식이 청크 단위로 끝날 때마다 해당 구간의 텍스트를 바로 감정 분석하여
+(start, end, text, score, label) 항목으로 내보내고, 전체 레이블은 지금까지 들어온
+항목들의 발화 길이 가중 평균 백분율로 계속 갱신한다.
+
+주요 클래스
+- SentimentTimeline: 전사 구간 스트림 → 감정 타임라인 항목 스트림
+"""
+
+# 타임라인 항목 하나: start, end, text, score, percentage, label
+TimelineEntry = Dict[str, Any]
+
+
+class SentimentTimeline:
+    """
+    전사 구간 스트림을 받아 구간별 감정 분석 결과를 순서대로 내보내는 클래스.
+
+    Parameters
+    ----------
+    analyzer : EmphaticSentimentAnalyzer
+        구간 텍스트를 분석할 감정 분석기 (``analyze(text) -> dict``).
+    on_segment : callable, optional
+        항목이 만들어질 때마다 호출할 콜백. 인자로 항목 딕셔너리를 받는다.
+
+    Examples
+    --------
+    >>> timeline = SentimentTimeline(EmphaticSentimentAnalyzer.shared())
+    >>> for entry in timeline.feed(preprocessor.iter_transcript_from_audio("talk.mp3")):
+    ...     print(entry["start"], entry["label"])
+    >>> timeline.summary()["label"]
+    '약간 긍정적'
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        on_segment: Optional[Callable[[TimelineEntry], None]] = None,
+    ):
+        self.analyzer = analyzer
+        self.on_segment = on_segment
+        self.entries: List[TimelineEntry] = []
+        self._weighted_sum = 0.0
+        self._weight = 0.0
+
+    def feed(self, segments: Iterable[Dict[str, Any]]) -> Iterator[TimelineEntry]:
+        """
+        전사 구간(start, end, text)을 하나씩 감정 분석하여 타임라인 항목으로 내보낸다.
+
+        Parameters
+        ----------
+        segments : Iterable[dict]
+            start, end, text 키를 가진 구간 딕셔너리 스트림
+            (예: :meth:`AudioPreprocessor.iter_transcript_from_audio`).
+
+        Yields
+        ------
+        dict
+            start, end, text, score, percentage, label 키를 가진 타임라인 항목.
+        """
+        for segment in segments:
+            result = self.analyzer.analyze(segment["text"])
+            entry = {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"],
+                "score": result.get("score", 0.0),
+                "percentage": result.get("percentage", 50.0),
+                "label": result.get("label", "중립"),
+            }
+            self._add(entry)
+            if self.on_segment is not None:
+                self.on_segment(entry)
+            yield entry
+
+    def _add(self, entry: TimelineEntry) -> None:
+        """항목을 기록하고 발화 길이 가중 합계를 갱신한다."""
+        self.entries.append(entry)
+        weight = max(entry["end"] - entry["start"], 1e-3)
+        self._weighted_sum += entry["percentage"] * weight
+        self._weight += weight
+
+    @property
+    def percentage(self) -> Optional[float]:
+        """지금까지의 발화 길이 가중 평균 백분율. 항목이 없으면 None."""
+        if not self._weight:
+            return None
+        return round(self._weighted_sum / self._weight, 2)
+
+    @property
+    def label(self) -> str:
+        """지금까지의 항목으로 계산한 전체 감정 레이블. 항목이 없으면 "중립"."""
+        from .text.text_mood import label_from_percentage
+
+        percentage = self.percentage
+        return "중립" if percentage is None else label_from_percentage(percentage)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        전체 타임라인 요약을 반환한다.
+
+        Returns
+        -------
+        dict
+            다음 키를 포함하는 딕셔너리.
+
+            - label: 전체 감정 레이블
+            - percentage: 발화 길이 가중 평균 백분율 (항목이 없으면 None)
+            - segments: 항목 수
+            - speech_seconds: 항목 구간 길이 합(초)
+        """
+        return {
+            "label": self.label,
+            "percentage": self.percentage,
+            "segments": len(self.entries),
+            "speech_seconds": round(self._weight, 2),
+        }
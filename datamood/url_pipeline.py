@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import collections
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+"""
+datamood.url_pipeline
+---------------------
+기사 URL 대량 분석 파이프라인
+
+네트워크 요청은 스레드 풀에서 전체 동시 요청 수(``max_concurrency``)와
+호스트별 동시 요청 수(``per_host``) 제한 아래 동시에 수행하고,
+HTML 파싱과 감정 분석은 CPU 워커 풀(기본: 프로세스 풀)로 넘긴다.
+URL 하나의 분석이 끝날 때마다 결과를 바로 내보내며, 각 결과에는
+성공/실패 상태(status)가 담긴다.
+
+주요 클래스
+- UrlBatchAnalyzer: 호스트별 제한이 있는 동시 수집 + CPU 풀 분석
+"""
+
+# 한 번에 미리 읽어 둘 URL 수 (max_concurrency 배수)
+_LOOKAHEAD_FACTOR = 4
+# process 모드 기본 워커 수 상한 (워커마다 JVM 을 하나씩 띄우므로 코어 수만큼 만들지 않음)
+_MAX_DEFAULT_PROCESS_WORKERS = 4
+
+
+def _host_of(url: str) -> str:
+    """URL 의 호스트(포트 포함)를 소문자로 반환한다."""
+    return urlsplit(url).netloc.lower()
+
+
+def _worker_analyzer():
+    """CPU 워커 프로세스 안에서 공유 감정 분석기를 가져온다 (프로세스당 한 번 생성)."""
+    from .text import EmphaticSentimentAnalyzer
+
+    return EmphaticSentimentAnalyzer.shared()
+
+
+def _init_worker() -> None:
+    """CPU 워커 프로세스 초기화: 분석기를 만들고 JVM 을 미리 띄운다."""
+    try:
+        _worker_analyzer().warm_up()
+    except Exception as e:
+        # 여기서 실패하면 풀 전체가 깨지므로, URL 별 analyze_failed 로 보고되도록 넘긴다
+        print(f"[WARN] 분석 워커 준비 실패: {e}")
+
+
+def _analyze_html(
+    url: str,
+    html: Optional[str],
+    analyzer=None,
+    extracted: Optional[Tuple[str, str]] = None,
+    preferred: Optional[str] = None,
+) -> Tuple[Dict[str, Any], float, Tuple[str, str], Optional[str]]:
+    """
+    HTML 에서 제목/본문을 추출하고 감정 분석한다. CPU 워커에서 실행된다.
+
+    ``extracted`` 가 주어지면 (HTTP 캐시 적중) 파싱을 건너뛰고 감정 분석만 한다.
+    ``preferred`` 는 호스트별로 학습된 본문 셀렉터로, 추출 시 먼저 시도한다.
+
+    Returns
+    -------
+    tuple[dict, float, tuple[str, str], str or None]
+        (analyze_url 과 같은 형식의 분석 결과, 소요 시간(초), (제목, 본문),
+        본문을 찾은 셀렉터 이름 — 파싱을 건너뛰었거나 찾지 못했으면 None).
+    """
+    from .text.텍스트추출_저장 import Converter_save
+
+    started = time.perf_counter()
+    if analyzer is None:
+        analyzer = _worker_analyzer()
+    selector = None
+    if extracted is not None:
+        title, body = extracted
+    else:
+        article = Converter_save.extract_article(html, preferred=preferred)
+        title, body, selector = article["title"], article["body"], article["selector"]
+    result = analyzer.analyze_document(title, body, url)
+    return result, time.perf_counter() - started, (title, body), selector
+
+
+class UrlBatchAnalyzer:
+    """
+    여러 기사 URL 을 동시에 수집하고 감정 분석하는 파이프라인.
+
+    - 수집: ``max_concurrency`` 개 스레드가 공유 HTTP 세션(keep-alive)으로 요청한다.
+      같은 호스트에는 동시에 ``per_host`` 개까지만 요청하며, 대기 중인 URL 은
+      호스트를 돌아가며 배정하므로 한 도메인이 전체 슬롯을 차지하지 않는다.
+    - 분석: HTML 파싱과 감정 분석은 ``cpu_workers`` 개 워커에서 수행한다.
+      ``cpu_executor="process"`` 이면 spawn 으로 시작한 워커 프로세스마다 공유 분석기를
+      하나씩 만들어 시작 시 JVM 을 미리 띄우고 (fork 하면 부모에서 이미 기동된 JVM 을
+      자식이 쓸 수 없음), ``"thread"`` 이면 ``sorter.text_analyzer`` 를 그대로 사용한다.
+
+    수집이 끝났지만 분석을 기다리는 HTML 이 많아지면 새 요청을 잠시 멈춰
+    메모리 사용량을 제한한다.
+
+    Parameters
+    ----------
+    sorter : MoodSorter
+        HTTP 세션(``http_session``)과 thread 모드의 감정 분석기(``text_analyzer``)를 제공한다.
+    max_concurrency : int, optional
+        전체 동시 요청 수. 기본값 16.
+    per_host : int, optional
+        호스트별 동시 요청 수. 기본값 4.
+    cpu_workers : int, optional
+        파싱/감정 분석 워커 수. 기본값은 CPU 코어 수 (process 모드는 최대 4).
+    cpu_executor : {"process", "thread"}, optional
+        CPU 워커 종류. 기본값 "process".
+    fetch : callable, optional
+        ``fetch(url) -> html`` 함수 (또는 :meth:`Converter_save.fetch_page` 형식의
+        딕셔너리를 반환하는 함수). 기본값은 ``sorter.http_session`` 과
+        ``sorter.http_cache`` 를 쓰는 :meth:`Converter_save.fetch_page`.
+        HTTP 캐시가 304 로 재검증되면 파싱을 건너뛰고 감정 분석만 수행한다.
+
+    Examples
+    --------
+    >>> batch = UrlBatchAnalyzer(MoodSorter(), max_concurrency=32, per_host=4)
+    >>> for result in batch.run(urls):
+    ...     print(result["status"], result["url"], result["emotion_label"])
+    """
+
+    CPU_EXECUTORS = ("process", "thread")
+
+    def __init__(
+        self,
+        sorter,
+        max_concurrency: int = 16,
+        per_host: int = 4,
+        cpu_workers: Optional[int] = None,
+        cpu_executor: str = "process",
+        fetch: Optional[Callable[[str], str]] = None,
+    ):
+        if cpu_executor not in self.CPU_EXECUTORS:
+            raise ValueError(f"cpu_executor 는 {self.CPU_EXECUTORS} 중 하나여야 합니다: {cpu_executor!r}")
+        self.sorter = sorter
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host = max(1, per_host)
+        if cpu_workers is None:
+            cpu_workers = os.cpu_count() or 1
+            if cpu_executor == "process":
+                cpu_workers = min(cpu_workers, _MAX_DEFAULT_PROCESS_WORKERS)
+        self.cpu_workers = max(1, cpu_workers)
+        self.cpu_executor = cpu_executor
+        self.fetch = fetch if fetch is not None else self._default_fetch
+
+    def _default_fetch(self, url: str) -> Dict[str, Any]:
+        from .text.텍스트추출_저장 import Converter_save
+
+        return Converter_save.fetch_page(
+            url,
+            session=getattr(self.sorter, "http_session", None),
+            cache=getattr(self.sorter, "http_cache", None),
+        )
+
+    def _timed_fetch(self, url: str) -> Tuple[Dict[str, Any], float]:
+        started = time.perf_counter()
+        page = self.fetch(url)
+        if isinstance(page, str):
+            page = {"html": page, "title": None, "body": None, "cache": None,
+                    "truncated": None, "skipped": None}
+        return page, time.perf_counter() - started
+
+    def run(self, urls: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        URL 목록을 동시에 수집/분석하고, URL 별 결과를 완료되는 순서대로 내보낸다.
+
+        결과 딕셔너리는 :meth:`MoodSorter.analyze` 의 기사 URL 결과와 같은 형태이며
+        다음 키가 추가된다.
+
+        - index: 입력 목록에서의 순서
+        - status: "ok", "skipped"(HTML 이 아닌 응답) 또는 "error"
+        - raw["timings"]: fetch_seconds, analyze_seconds
+        - raw["error"]: 실패 원인 (fetch_failed: ..., analyze_failed: ...)
+        - raw["cache"]: HTTP 캐시 상태 ("fresh", "not_modified", "miss", 캐시 미사용 시 None)
+        - raw["truncated"]: 다운로드가 잘린 이유 ("max_bytes", "total_timeout") 또는 None
+        - raw["skipped"]: 추출을 건너뛴 이유 ("content_type: ...", "binary_content") 또는 None
+
+        제너레이터를 중간에 닫으면 대기 중인 작업을 취소하고 워커를 정리한다.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            기사 URL 목록. 빈 줄과 앞뒤 공백은 무시한다.
+
+        Yields
+        ------
+        dict
+            URL 하나의 분석 결과.
+        """
+        source = (
+            (index, url.strip()) for index, url in enumerate(urls) if url and url.strip()
+        )
+        lookahead = self.max_concurrency * _LOOKAHEAD_FACTOR
+        max_parsing = self.cpu_workers * 2 + self.max_concurrency
+
+        pending: Dict[str, Deque[Tuple[int, str]]] = collections.OrderedDict()
+        active: Dict[str, int] = collections.Counter()
+        buffered = 0
+        exhausted = False
+        fetches: Dict[Any, Tuple[int, str, str]] = {}
+        analyses: Dict[Any, Tuple[int, str, float, Dict[str, Any], Optional[str]]] = {}
+        cache = getattr(self.sorter, "http_cache", None)
+        selector_cache = getattr(self.sorter, "selector_cache", None)
+
+        fetch_pool = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="url-fetch")
+        if self.cpu_executor == "process":
+            cpu_pool = ProcessPoolExecutor(
+                self.cpu_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            analyzer = None
+        else:
+            cpu_pool = ThreadPoolExecutor(self.cpu_workers, thread_name_prefix="url-analyze")
+            analyzer = self.sorter.text_analyzer
+
+        try:
+            while True:
+                # 1) 입력을 미리 읽어 호스트별 대기열에 넣는다
+                while not exhausted and buffered < lookahead:
+                    try:
+                        index, url = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.setdefault(_host_of(url), collections.deque()).append((index, url))
+                    buffered += 1
+
+                # 2) 호스트를 돌아가며 전체/호스트별 한도 안에서 요청을 시작한다
+                progressed = True
+                while progressed and len(fetches) < self.max_concurrency and len(analyses) < max_parsing:
+                    progressed = False
+                    for host in list(pending):
+                        if len(fetches) >= self.max_concurrency:
+                            break
+                        if active[host] >= self.per_host:
+                            continue
+                        index, url = pending[host].popleft()
+                        if not pending[host]:
+                            del pending[host]
+                        else:
+                            # 다음 라운드에서 다른 호스트가 먼저 오도록 뒤로 보낸다
+                            pending.move_to_end(host)
+                        buffered -= 1
+                        active[host] += 1
+                        fetches[fetch_pool.submit(self._timed_fetch, url)] = (index, url, host)
+                        progressed = True
+
+                if not fetches and not analyses:
+                    if exhausted and not pending:
+                        return
+                    continue
+
+                # 3) 끝난 작업을 처리한다
+                done, _ = wait(list(fetches) + list(analyses), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        index, url, host = fetches.pop(future)
+                        active[host] -= 1
+                        try:
+                            page, fetch_seconds = future.result()
+                        except Exception as e:
+                            yield self._failure(index, url, f"fetch_failed: {e}", {})
+                            continue
+                        if page.get("skipped"):
+                            yield self._skipped(index, url, page["skipped"], fetch_seconds)
+                            continue
+                        preferred = None
+                        if page.get("title") is not None:
+                            # 캐시 적중: HTML 을 워커로 보내지 않고 저장된 본문만 분석
+                            task = cpu_pool.submit(
+                                _analyze_html, url, None, analyzer, (page["title"], page["body"])
+                            )
+                        else:
+                            # 학습된 셀렉터는 메인 스레드에서 조회해 워커에 넘긴다
+                            if selector_cache is not None:
+                                preferred = selector_cache.lookup(url)
+                            task = cpu_pool.submit(
+                                _analyze_html, url, page["html"], analyzer, None, preferred
+                            )
+                        analyses[task] = (index, url, fetch_seconds, page, preferred)
+                    else:
+                        index, url, fetch_seconds, page, preferred = analyses.pop(future)
+                        timings = {"fetch_seconds": round(fetch_seconds, 3)}
+                        try:
+                            result, analyze_seconds, (title, body), selector = future.result()
+                        except Exception as e:
+                            yield self._failure(index, url, f"analyze_failed: {e}", timings)
+                            continue
+                        if selector_cache is not None and page.get("title") is None:
+                            selector_cache.record(url, preferred, selector)
+                        if cache is not None and page.get("cache") == "miss" and not page.get("truncated"):
+                            cache.store(url, page["html"], page.get("etag"),
+                                        page.get("last_modified"), title, body)
+                        timings["analyze_seconds"] = round(analyze_seconds, 3)
+                        result["timings"] = timings
+                        result["error"] = None
+                        result["cache"] = page.get("cache")
+                        result["truncated"] = page.get("truncated")
+                        result["skipped"] = None
+                        yield {
+                            "type": "url",
+                            "index": index,
+                            "url": url,
+                            "status": "ok",
+                            "emotion_label": result.get("label", "중립"),
+                            "raw": result,
+                        }
+        finally:
+            fetch_pool.shutdown(wait=True, cancel_futures=True)
+            cpu_pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _skipped(index: int, url: str, reason: str, fetch_seconds: float) -> Dict[str, Any]:
+        """HTML 이 아니어서 분석을 건너뛴 URL 의 결과 딕셔너리를 만든다."""
+        return {
+            "type": "url",
+            "index": index,
+            "url": url,
+            "status": "skipped",
+            "emotion_label": "중립",
+            "raw": {
+                "error": None,
+                "skipped": reason,
+                "truncated": None,
+                "timings": {"fetch_seconds": round(fetch_seconds, 3)},
+            },
+        }
+
+    @staticmethod
+    def _failure(index: int, url: str, error: str, timings: Dict[str, float]) -> Dict[str, Any]:
+        """실패한 URL 의 결과 딕셔너리를 만든다."""
+        return {
+            "type": "url",
+            "index": index,
+            "url": url,
+            "status": "error",
+            "emotion_label": "중립",
+            "raw": {"error": error, "timings": timings},
+        }
@@ -1,16 +1,27 @@
 # datamood/utils/__init__.py
 from .utils import (
     get_file_type,
+    is_compressed_audio,
     iter_input_files,
     ensure_dir,
     build_output_path,
     move_or_copy,
+    place_file,
+    LINK_MODES,
 )
+from .naming import NameAllocator
+from .copy_engine import CopyEngine, fast_copy
 
 __all__ = [
     "get_file_type",
+    "is_compressed_audio",
     "iter_input_files",
     "ensure_dir",
     "build_output_path",
     "move_or_copy",
+    "place_file",
+    "LINK_MODES",
+    "NameAllocator",
+    "CopyEngine",
+    "fast_copy",
 ]
\ No newline at end of file
@@ -0,0 +1,341 @@
+# datamood/utils/copy_engine.py
+import errno
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+"""
+datamood.utils.copy_engine
+--------------------------
+커널 복사 기반 파일 복사 엔진
+
+큰 오디오 파일을 정렬 폴더로 복사할 때 사용자 공간 버퍼를 거치지 않도록
+``os.copy_file_range`` (같은 파일 시스템이면 reflink/서버 측 복사까지 가능)를 먼저 쓰고,
+지원하지 않으면 ``os.sendfile``, 그것도 안 되면 큰 버퍼의 일반 복사로 대체합니다.
+:class:`CopyEngine` 은 이 복사를 분석과 별도의 제한된 작업자 풀에서 동시에 수행하여,
+네트워크 파일 시스템에서 I/O 를 기다리는 동안에도 분석이 계속 진행되게 합니다.
+
+주요 클래스/함수
+- fast_copy: 파일 하나 복사 (메타데이터 보존)
+- file_digest: 파일 내용 해시
+- CopyEngine: 동시 복사 작업자 풀 + 검증 + 처리량 통계
+"""
+
+# copy_file_range / sendfile 한 번에 요청할 크기
+_RANGE_CHUNK = 64 * 1024 * 1024
+# 일반 복사 / 해시 계산 버퍼 크기
+_BUFFER_SIZE = 8 * 1024 * 1024
+# 이 오류가 나면 다음 복사 방식으로 대체
+_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.EPERM,
+}
+
+VERIFY_MODES = ("size", "hash")
+
+
+def file_digest(path) -> str:
+    """
+    파일 내용의 BLAKE2b(128bit) 해시를 계산한다.
+
+    Parameters
+    ----------
+    path : str or Path
+        해시를 계산할 파일.
+
+    Returns
+    -------
+    str
+        16진수 해시 문자열.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_BUFFER_SIZE), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _copy_file_range(in_fd: int, out_fd: int) -> int:
+    copied = 0
+    while True:
+        n = os.copy_file_range(in_fd, out_fd, _RANGE_CHUNK)
+        if n == 0:
+            return copied
+        copied += n
+
+
+def _sendfile(in_fd: int, out_fd: int) -> int:
+    copied = 0
+    while True:
+        n = os.sendfile(out_fd, in_fd, copied, _RANGE_CHUNK)
+        if n == 0:
+            return copied
+        copied += n
+
+
+def _buffered(in_fd: int, out_fd: int) -> int:
+    copied = 0
+    while True:
+        block = os.read(in_fd, _BUFFER_SIZE)
+        if not block:
+            return copied
+        view = memoryview(block)
+        while view:
+            view = view[os.write(out_fd, view):]
+        copied += len(block)
+
+
+# (이름, 함수) — 앞에서부터 시도
+_METHODS = []
+if hasattr(os, "copy_file_range"):
+    _METHODS.append(("copy_file_range", _copy_file_range))
+if hasattr(os, "sendfile") and os.name == "posix":
+    _METHODS.append(("sendfile", _sendfile))
+_METHODS.append(("buffered", _buffered))
+
+
+def fast_copy(src, dst, verify: Optional[str] = None) -> int:
+    """
+    src 를 dst 로 복사하고 메타데이터(권한, 수정 시각, 확장 속성)를 보존한다.
+
+    ``copy_file_range`` → ``sendfile`` → 버퍼 복사 순서로 시도하며, 파일 시스템이
+    앞의 방식을 지원하지 않거나 복사한 크기가 원본과 다르면 (FUSE/NFS 등에서
+    copy_file_range 가 일찍 0 을 반환하는 경우) 처음부터 다음 방식으로 다시 복사한다.
+
+    같은 폴더의 임시 이름(``.<이름>.<pid>.tmp``)에 복사하고 메타데이터 복사와 검증이
+    끝난 뒤 ``os.replace`` 로 dst 를 교체하므로, 복사 도중 중단되어도 dst 이름으로
+    잘린 파일이 남지 않는다. dst 가 이미 있으면 덮어쓴다.
+
+    Parameters
+    ----------
+    src, dst : str or Path
+        원본과 대상 파일 경로.
+    verify : {"size", "hash"}, optional
+        dst 로 교체하기 전에 수행할 검증 (:func:`verify_copy`). 기본값은 검증 안 함.
+
+    Returns
+    -------
+    int
+        복사한 바이트 수.
+    """
+    src, dst = os.fspath(src), os.fspath(dst)
+    head, name = os.path.split(dst)
+    tmp = os.path.join(head, f".{name}.{os.getpid()}.tmp")
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            expected = os.fstat(in_fd).st_size
+            last = len(_METHODS) - 1
+            for index, (_, method) in enumerate(_METHODS):
+                try:
+                    copied = method(in_fd, out_fd)
+                    # 버퍼 복사는 EOF 까지 읽으므로 마지막 방식의 결과는 그대로 사용
+                    if copied == expected or index == last:
+                        break
+                except OSError as e:
+                    if e.errno not in _FALLBACK_ERRNOS or index == last:
+                        raise
+                # 다음 방식으로 처음부터 다시 복사
+                os.lseek(in_fd, 0, os.SEEK_SET)
+                os.lseek(out_fd, 0, os.SEEK_SET)
+                os.ftruncate(out_fd, 0)
+        shutil.copystat(src, tmp)
+        if verify:
+            verify_copy(src, tmp, verify)
+        os.replace(tmp, dst)
+    except BaseException:
+        # 중단/실패 시 임시 파일 정리 (dst 는 건드리지 않음)
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return copied
+
+
+def verify_copy(src, dst, mode: str) -> None:
+    """
+    복사 결과를 검증한다. 일치하지 않으면 OSError(EIO).
+
+    Parameters
+    ----------
+    src, dst : str or Path
+        원본과 대상 파일 경로.
+    mode : {"size", "hash"}
+        "size" 는 크기만, "hash" 는 내용 해시까지 비교한다.
+    """
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"verify 는 {VERIFY_MODES} 중 하나여야 합니다: {mode!r}")
+    if os.path.getsize(src) != os.path.getsize(dst):
+        raise OSError(errno.EIO, "복사 검증 실패: 크기가 다릅니다", str(dst))
+    if mode == "hash" and file_digest(src) != file_digest(dst):
+        raise OSError(errno.EIO, "복사 검증 실패: 해시가 다릅니다", str(dst))
+
+
+class CopyEngine:
+    """
+    제한된 작업자 풀에서 파일을 동시에 복사하는 엔진.
+
+    :meth:`submit` 은 복사를 작업자에게 넘기고 바로 반환하므로, 호출한 쪽(분석 루프)은
+    복사가 끝나기를 기다리지 않고 다음 파일을 처리한다. 대기 중인 복사가 ``max_pending``
+    개에 이르면 :meth:`submit` 이 자리가 날 때까지 기다리므로 메모리와 열린 파일 수가
+    제한된다. ``workers=0`` 이면 호출한 스레드에서 바로 복사한다.
+
+    Parameters
+    ----------
+    workers : int, optional
+        동시 복사 작업자 수. 기본값 4.
+    verify : {"size", "hash"}, optional
+        복사 후 검증 방식. None(기본값)이면 검증하지 않는다.
+    max_pending : int, optional
+        동시에 대기/진행할 수 있는 최대 복사 수. 기본값은 ``workers * 2``.
+
+    Examples
+    --------
+    >>> with CopyEngine(workers=4, verify="size") as engine:
+    ...     for src, dst in pairs:
+    ...         engine.submit(src, dst)
+    >>> engine.stats()["mb_per_second"]
+    412.5
+    """
+
+    def __init__(self, workers: int = 4, verify: Optional[str] = None, max_pending: Optional[int] = None):
+        if verify is not None and verify not in VERIFY_MODES:
+            raise ValueError(f"verify 는 {VERIFY_MODES} 중 하나여야 합니다: {verify!r}")
+        self.workers = max(0, workers)
+        self.verify = verify
+        self._executor = (
+            ThreadPoolExecutor(self.workers, thread_name_prefix="datamood-copy")
+            if self.workers else None
+        )
+        self._slots = threading.BoundedSemaphore(max_pending or max(1, self.workers * 2))
+        self._lock = threading.Lock()
+        self._pending = set()
+        self.files = 0
+        self.bytes = 0
+        self.failed = 0
+        self._first_start: Optional[float] = None
+        self._last_end: Optional[float] = None
+
+    def copy(self, src, dst) -> int:
+        """
+        파일 하나를 지금 스레드에서 복사(및 검증)하고 통계에 반영한다.
+
+        Returns
+        -------
+        int
+            복사한 바이트 수.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            if self._first_start is None:
+                self._first_start = started
+        try:
+            copied = fast_copy(src, dst, verify=self.verify)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+                self._last_end = time.perf_counter()
+            raise
+        with self._lock:
+            self.files += 1
+            self.bytes += copied
+            self._last_end = time.perf_counter()
+        return copied
+
+    def submit(self, src, dst, callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """
+        복사를 작업자에게 넘긴다. 대기 중인 복사가 가득 차 있으면 자리가 날 때까지 기다린다.
+
+        Parameters
+        ----------
+        src, dst : str or Path
+            원본과 대상 파일 경로.
+        callback : callable, optional
+            복사가 끝나면(실패 포함) Future 를 인자로 호출된다. 작업자 스레드에서 실행된다.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            복사한 바이트 수를 결과로 갖는 Future.
+        """
+        if self._executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(self.copy(src, dst))
+            except Exception as e:
+                future.set_exception(e)
+            if callback is not None:
+                callback(future)
+            return future
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self.copy, src, dst)
+        except BaseException:
+            # close() 이후 등으로 작업을 넘기지 못하면 자리를 돌려준다
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+
+        def done(f: Future) -> None:
+            with self._lock:
+                self._pending.discard(f)
+            self._slots.release()
+            if callback is not None:
+                callback(f)
+
+        future.add_done_callback(done)
+        return future
+
+    def wait(self) -> None:
+        """진행 중인 복사가 모두 끝날 때까지 기다린다."""
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            for future in pending:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
+    def stats(self) -> dict:
+        """
+        복사 통계를 반환한다.
+
+        Returns
+        -------
+        dict
+            files, bytes, failed, seconds(첫 복사 시작부터 마지막 복사 완료까지),
+            mb_per_second 키를 포함하는 딕셔너리.
+        """
+        with self._lock:
+            seconds = (
+                self._last_end - self._first_start
+                if self._first_start is not None and self._last_end is not None else 0.0
+            )
+            return {
+                "files": self.files,
+                "bytes": self.bytes,
+                "failed": self.failed,
+                "seconds": round(seconds, 3),
+                "mb_per_second": round(self.bytes / 1e6 / seconds, 1) if seconds > 0 else 0.0,
+            }
+
+    def close(self) -> None:
+        """진행 중인 복사를 모두 마치고 작업자를 종료한다."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "CopyEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
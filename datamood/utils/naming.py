@@ -0,0 +1,141 @@
+# datamood/utils/naming.py
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Set, Tuple
+
+"""
+datamood.utils.naming
+---------------------
+겹치지 않는 파일 이름 할당기
+
+같은 이름의 파일(transcript.txt 등)이 한 레이블 폴더에 수천 개 들어올 때,
+``name_1``, ``name_2`` ... 를 차례로 ``exists()`` 로 확인하면 파일마다 O(k) 번의
+시스템 호출이 필요합니다. 할당기는 대상 디렉토리를 처음 한 번만 읽어 사용 중인
+이름을 메모리에 기록하고, 이름별 다음 번호를 기억해 새 이름을 O(1) 에 만듭니다.
+다른 프로세스와 동시에 쓰는 경우에도 ``O_EXCL`` 로 파일을 먼저 만들어 이름을
+선점하므로 같은 이름이 두 번 할당되지 않습니다.
+
+주요 클래스/함수
+- NameAllocator: 디렉토리별 이름 인덱스 + 번호 카운터
+- default_allocator: 프로세스 전역 기본 할당기
+"""
+
+
+class NameAllocator:
+    """
+    디렉토리별로 사용 중인 이름을 기억하며 겹치지 않는 파일 경로를 할당하는 클래스.
+
+    :meth:`allocate` 는 빈 파일을 ``O_CREAT | O_EXCL`` 로 만들어 이름을 선점한 뒤
+    그 경로를 반환합니다. 호출한 쪽은 이 빈 파일을 덮어쓰면 됩니다
+    (:func:`datamood.utils.place_file` 의 ``replace=True``).
+    여러 스레드에서 함께 사용해도 안전합니다.
+
+    Examples
+    --------
+    >>> allocator = NameAllocator()
+    >>> allocator.allocate(Path("sorted/긍정적/transcript.txt"))
+    PosixPath('sorted/긍정적/transcript.txt')
+    >>> allocator.allocate(Path("sorted/긍정적/transcript.txt"))
+    PosixPath('sorted/긍정적/transcript_1.txt')
+    """
+
+    def __init__(self):
+        # 디렉토리 → 사용 중인 이름
+        self._used: Dict[str, Set[str]] = {}
+        # (디렉토리, stem, suffix) → 다음에 시도할 번호
+        self._next: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _names(self, directory: str) -> Set[str]:
+        """디렉토리의 이름 인덱스. 처음 접근할 때 한 번만 디렉토리를 읽는다."""
+        names = self._used.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as it:
+                    names = {entry.name for entry in it}
+            except FileNotFoundError:
+                names = set()
+            self._used[directory] = names
+        return names
+
+    def _claim(self, directory: str, name: str, names: Set[str]) -> bool:
+        """이름이 비어 있으면 빈 파일을 만들어 선점한다. 이미 있으면 인덱스에 기록하고 False."""
+        if name in names:
+            return False
+        try:
+            fd = os.open(os.path.join(directory, name), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            # 인덱스 이후 다른 프로세스가 만든 이름
+            names.add(name)
+            return False
+        os.close(fd)
+        names.add(name)
+        return True
+
+    def allocate(self, path: Path) -> Path:
+        """
+        path 또는 ``<stem>_<n><suffix>`` 중 비어 있는 경로를 선점해 반환합니다.
+
+        Parameters
+        ----------
+        path : Path
+            원하는 파일 경로. 부모 디렉토리가 없으면 만듭니다.
+
+        Returns
+        -------
+        Path
+            빈 파일로 선점된 고유한 경로.
+        """
+        path = Path(path)
+        directory = str(path.parent)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            names = self._names(directory)
+            if self._claim(directory, path.name, names):
+                return path
+
+            stem, suffix = path.stem, path.suffix
+            key = (directory, stem, suffix)
+            i = self._next.get(key, 1)
+            while True:
+                name = f"{stem}_{i}{suffix}"
+                i += 1
+                if self._claim(directory, name, names):
+                    self._next[key] = i
+                    return path.parent / name
+
+    def release(self, path: Path) -> None:
+        """
+        지운 파일의 이름을 인덱스에서 빼서 다시 할당할 수 있게 합니다.
+
+        Parameters
+        ----------
+        path : Path
+            삭제한 파일 경로.
+        """
+        path = Path(path)
+        with self._lock:
+            names = self._used.get(str(path.parent))
+            if names is not None:
+                names.discard(path.name)
+
+    def forget(self, directory: Path) -> None:
+        """
+        디렉토리의 이름 인덱스를 버립니다. 다음 할당 시 디렉토리를 다시 읽습니다.
+
+        Parameters
+        ----------
+        directory : Path
+            인덱스를 버릴 디렉토리.
+        """
+        directory = str(directory)
+        with self._lock:
+            self._used.pop(directory, None)
+            for key in [k for k in self._next if k[0] == directory]:
+                del self._next[key]
+
+
+# 프로세스 전역 기본 할당기
+default_allocator = NameAllocator()
@@ -1,13 +1,33 @@
 # datamood/utils/utils.py
+import fnmatch
+import os
+import re
 from pathlib import Path
 import shutil
-from typing import Iterable, Literal
+from typing import Iterable, Iterator, Literal, Optional
+
+from .copy_engine import fast_copy
 
 # 텍스트 파일 확장자
 TEXT_EXT = {".txt"}
 
-# 오디오 파일 확장자 (SpeechRecognition AudioFile이 안전하게 처리할 수 있는 확장자들)
-AUDIO_EXT = {".wav", ".flac", ".aiff", ".aif"}
+# SpeechRecognition AudioFile이 직접 처리할 수 있는 오디오 확장자
+NATIVE_AUDIO_EXT = {".wav", ".flac", ".aiff", ".aif"}
+
+# ffmpeg 파이프 디코딩으로 처리하는 압축 오디오 확장자
+COMPRESSED_AUDIO_EXT = {".mp3", ".m4a", ".aac", ".ogg", ".oga", ".opus", ".webm", ".wma", ".mka"}
+
+# 오디오 파일 확장자 전체
+AUDIO_EXT = NATIVE_AUDIO_EXT | COMPRESSED_AUDIO_EXT
+
+# 입력 디렉토리에서 처리 대상으로 순회할 확장자
+INPUT_EXT = frozenset(TEXT_EXT | AUDIO_EXT)
+
+# 정렬 결과를 배치하는 방식
+LINK_MODES = ("copy", "move", "hardlink", "reflink", "symlink")
+
+# Linux FICLONE ioctl 번호 (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
 
 
 def get_file_type(path: Path) -> Literal["text", "audio", "unknown"]:
@@ -23,7 +43,8 @@ def get_file_type(path: Path) -> Literal["text", "audio", "unknown"]:
     -------
     Literal["text", "audio", "unknown"]
         - "text": 텍스트 파일(.txt)
-        - "audio": 오디오 파일(.wav, .flac, .aiff, .aif)
+        - "audio": 오디오 파일(.wav, .flac, .aiff, .aif 및
+          .mp3, .m4a, .aac, .ogg, .oga, .opus, .webm, .wma, .mka)
         - "unknown": 위 확장자에 속하지 않는 경우
 
     Notes
@@ -37,6 +58,8 @@ def get_file_type(path: Path) -> Literal["text", "audio", "unknown"]:
     'text'
     >>> get_file_type(Path("sound.wav"))
     'audio'
+    >>> get_file_type(Path("memo.m4a"))
+    'audio'
     >>> get_file_type(Path("data.json"))
     'unknown'
     """
@@ -53,38 +76,128 @@ def get_file_type(path: Path) -> Literal["text", "audio", "unknown"]:
     return "unknown"
 
 
-def iter_input_files(input_path: Path) -> Iterable[Path]:
+def is_compressed_audio(path) -> bool:
+    """
+    ffmpeg 디코딩이 필요한 압축 오디오 파일인지 확장자로 판별한다.
+
+    Parameters
+    ----------
+    path : str or Path
+        판별할 파일 경로.
+
+    Returns
+    -------
+    bool
+        확장자가 :data:`COMPRESSED_AUDIO_EXT` 에 속하면 True.
+    """
+    return Path(path).suffix.lower() in COMPRESSED_AUDIO_EXT
+
+
+def _compile_globs(patterns: Optional[Iterable[str]]):
+    """glob 패턴 목록을 하나의 정규식으로 컴파일한다. 패턴이 없으면 None."""
+    patterns = list(patterns or [])
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _glob_matches(regex, relpath: str, name: str) -> bool:
+    """상대 경로(posix) 또는 이름이 glob 정규식과 일치하는지 검사한다."""
+    return bool(regex.match(relpath) or regex.match(name))
+
+
+def iter_input_files(
+    input_path: Path,
+    extensions: Optional[Iterable[str]] = INPUT_EXT,
+    sort: bool = False,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> Iterator[Path]:
     """
     파일 또는 디렉토리 경로를 입력받아 처리 가능한 모든 파일을 순회(iterate)한다.
 
+    디렉토리는 ``os.scandir`` 로 한 단계씩 읽으며 찾는 즉시 내보내므로, 아주 큰
+    트리에서도 첫 파일이 바로 나온다. 확장자 검사는 이름만으로 먼저 수행하고,
+    파일/디렉토리 구분은 디렉토리 항목의 타입 정보를 재사용하므로 대부분의 항목에
+    추가 ``stat`` 호출이 없다. 디렉토리 심볼릭 링크는 따라가지 않는다.
+
     Parameters
     ----------
     input_path : Path
         단일 파일 또는 디렉토리 경로.
+    extensions : Iterable[str] or None, optional
+        내보낼 확장자 (소문자, 점 포함). 기본값은 텍스트/오디오 확장자
+        (:data:`TEXT_EXT` | :data:`AUDIO_EXT`). None 이면 모든 파일.
+    sort : bool, optional
+        True 이면 디렉토리마다 파일을 이름순으로 먼저 내보낸 뒤 하위 디렉토리를
+        이름순으로 내려간다 (트리 전체를 모아 정렬하지 않음).
+        기본값은 False (파일 시스템이 돌려주는 순서).
+    include : Iterable[str], optional
+        glob 패턴 목록. 지정하면 입력 경로 기준 상대 경로(또는 파일 이름)가
+        하나라도 일치하는 파일만 내보낸다 (예: ``"*.wav"``, ``"2024/**"``).
+    exclude : Iterable[str], optional
+        glob 패턴 목록. 일치하는 파일은 제외하고, 일치하는 디렉토리는 내려가지 않는다
+        (예: ``".git"``, ``"sorted"``, ``"*_backup.txt"``).
 
     Returns
     -------
-    Iterable[Path]
-        - 단일 파일: 해당 파일을 그대로 yield
-        - 디렉토리: 내부 모든 파일을 재귀적으로 순회하여 yield
+    Iterator[Path]
+        - 단일 파일: 해당 파일을 그대로 yield (필터를 적용하지 않음)
+        - 디렉토리: 조건에 맞는 파일을 재귀적으로 순회하여 yield
 
     Examples
     --------
-    >>> for p in iter_input_files(Path("data/")):
+    >>> for p in iter_input_files(Path("data/"), sort=True, exclude=["tmp"]):
     ...     print(p)
     data/a.txt
     data/sub/b.wav
     """
 
-
     if input_path.is_file():
         yield input_path
         return
 
-    if input_path.is_dir():
-        for p in sorted(input_path.rglob("*")):
-            if p.is_file():
-                yield p
+    if not input_path.is_dir():
+        return
+
+    extensions = None if extensions is None else frozenset(e.lower() for e in extensions)
+    include_re = _compile_globs(include)
+    exclude_re = _compile_globs(exclude)
+
+    # (디렉토리 경로, 입력 경로 기준 상대 경로 접두사)
+    stack = [(str(input_path), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it) if sort else it
+                if sort:
+                    entries.sort(key=lambda e: e.name)
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    relpath = prefix + name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if exclude_re is None or not _glob_matches(exclude_re, relpath, name):
+                                subdirs.append((entry.path, relpath + "/"))
+                            continue
+                        if extensions is not None and os.path.splitext(name)[1].lower() not in extensions:
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if include_re is not None and not _glob_matches(include_re, relpath, name):
+                        continue
+                    if exclude_re is not None and _glob_matches(exclude_re, relpath, name):
+                        continue
+                    yield Path(entry.path)
+        except OSError as e:
+            print(f"[WARN] 디렉토리를 읽을 수 없습니다: {directory} ({e})")
+            continue
+        # 정렬 시 이름순 깊이 우선이 되도록 역순으로 쌓는다
+        stack.extend(reversed(subdirs))
 
 
 def ensure_dir(path: Path) -> None:
@@ -151,7 +264,7 @@ def move_or_copy(src: Path, dst: Path, move: bool = False) -> None:
         이동 또는 복사될 대상 파일 경로.
     move : bool, optional
         True이면 파일을 이동(shutil.move),
-        False이면 복사(shutil.copy2). 기본값은 False.
+        False이면 복사(:func:`fast_copy`, 메타데이터 포함). 기본값은 False.
 
     Returns
     -------
@@ -166,9 +279,103 @@ def move_or_copy(src: Path, dst: Path, move: bool = False) -> None:
     # 파일이 archive/a.txt 로 이동됨
     """
 
+    place_file(src, dst, mode="move" if move else "copy")
+
+
+def place_file(src: Path, dst: Path, mode: str = "copy", replace: bool = False) -> str:
+    """
+    파일을 지정된 방식(link mode)으로 대상 위치에 배치한다.
+
+    하드링크/reflink/심볼릭 링크를 만들 수 없는 경우(다른 파일 시스템, 지원하지 않는
+    파일 시스템, 권한 등)에는 파일마다 자동으로 복사로 대체하며, 실제로 사용한
+    방식을 반환한다.
+
+    Parameters
+    ----------
+    src : Path
+        원본 파일 경로.
+    dst : Path
+        대상 파일 경로. ``replace`` 가 False 이면 이미 존재하면 안 된다.
+    mode : {"copy", "move", "hardlink", "reflink", "symlink"}, optional
+        - "copy": 전체 복사 (:func:`fast_copy`: copy_file_range/sendfile, 메타데이터 포함)
+        - "move": 이동 (shutil.move)
+        - "hardlink": 하드링크 (같은 파일 시스템에서만 가능, 추가 공간 없음)
+        - "reflink": copy-on-write 복제 (Linux ``FICLONE``, btrfs/XFS 등에서 추가 공간 없음)
+        - "symlink": 원본 절대 경로를 가리키는 심볼릭 링크
+
+        기본값은 "copy".
+    replace : bool, optional
+        True 이면 dst 에 이미 있는 파일(예: :func:`make_unique_path` 가 선점한 빈 파일)을
+        원자적으로 교체한다. 링크는 임시 이름으로 만든 뒤 ``os.replace`` 로 옮긴다.
+        기본값은 False.
+
+    Returns
+    -------
+    str
+        실제로 사용한 방식. 대체된 경우 "copy".
+
+    Raises
+    ------
+    ValueError
+        지원하지 않는 mode 를 지정한 경우.
+
+    Examples
+    --------
+    >>> place_file(Path("a.wav"), Path("sorted/긍정적/a.wav"), mode="reflink")
+    'reflink'
+    >>> place_file(Path("b.wav"), Path("/mnt/other/b.wav"), mode="hardlink")  # 다른 장치
+    'copy'
+    """
+    if mode not in LINK_MODES:
+        raise ValueError(f"mode 는 {LINK_MODES} 중 하나여야 합니다: {mode!r}")
+
     ensure_dir(dst.parent)
 
-    if move:
+    if mode == "move":
         shutil.move(str(src), str(dst))
-    else:
-        shutil.copy2(str(src), str(dst))
+        return "move"
+
+    if mode in ("hardlink", "symlink", "reflink"):
+        target = dst.with_name(f".{dst.name}.{os.getpid()}.tmp") if replace else dst
+        try:
+            if mode == "hardlink":
+                os.link(src, target)
+            elif mode == "symlink":
+                os.symlink(os.path.abspath(src), target)
+            else:
+                _reflink(src, target)
+        except FileExistsError:
+            raise
+        except OSError:
+            # 파일 시스템이 지원하지 않으면 이 파일만 복사로 대체
+            pass
+        else:
+            if replace:
+                os.replace(target, dst)
+            return mode
+
+    fast_copy(src, dst)
+    return "copy"
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """
+    FICLONE ioctl 로 src 의 copy-on-write 복제본을 dst 에 만든다.
+
+    실패하면 만들던 dst 를 지우고 OSError 를 다시 던진다.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflink 는 이 플랫폼에서 지원하지 않습니다") from None
+
+    with open(src, "rb") as fsrc:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(fd, _FICLONE, fsrc.fileno())
+        except OSError:
+            os.close(fd)
+            os.unlink(dst)
+            raise
+        os.close(fd)
+    shutil.copystat(str(src), str(dst))
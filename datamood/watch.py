@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .utils.utils import INPUT_EXT, _compile_globs, _glob_matches, iter_input_files
+
+"""
+datamood.watch
+--------------
+수신 디렉토리 감시
+
+디렉토리에 새로 들어오거나 쓰기가 끝난 파일을 감지해 묶음(batch)으로 내보낸다.
+리눅스에서는 inotify(``IN_CLOSE_WRITE`` / ``IN_MOVED_TO``)를 사용하고, inotify 를
+쓸 수 없으면 주기적으로 디렉토리를 다시 읽어 크기/mtime 변화를 찾는다.
+
+아직 쓰는 중인 파일을 분석하지 않도록, 마지막 변경 후 ``settle_seconds`` 동안
+크기와 mtime 이 그대로인 파일만 내보낸다 (inotify 에서는 쓰기용으로 열린 파일이
+닫힐 때까지 기다리되, 하드링크/심볼릭 링크처럼 닫힘 이벤트가 오지 않는 파일은
+``settle_seconds`` 의 몇 배 동안 변화가 없으면 내보낸다).
+
+주요 클래스
+- InboxWatcher: 감시 + 디바운스 + 묶음 생성
+"""
+
+# inotify 이벤트 (<sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+# 닫힘 이벤트(IN_CLOSE_WRITE/IN_MOVED_TO)가 오지 않은 파일(ln, ln -s, cp -l 등)은
+# settle_seconds 의 이 배수 동안 변화가 없으면 완성된 것으로 본다
+_UNCLOSED_SETTLE_FACTOR = 4
+
+
+class _Filter:
+    """감시 루트 기준 상대 경로로 확장자/include/exclude 조건을 검사한다."""
+
+    def __init__(self, root: Path, extensions, include, exclude):
+        self.root = str(root)
+        self.extensions = None if extensions is None else frozenset(e.lower() for e in extensions)
+        self.include = include
+        self.exclude = exclude
+        self._include_re = _compile_globs(include)
+        self._exclude_re = _compile_globs(exclude)
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def accepts_dir(self, path: str) -> bool:
+        if self._exclude_re is None:
+            return True
+        return not _glob_matches(self._exclude_re, self._relpath(path), os.path.basename(path))
+
+    def accepts_file(self, path: str) -> bool:
+        name = os.path.basename(path)
+        if self.extensions is not None and os.path.splitext(name)[1].lower() not in self.extensions:
+            return False
+        relpath = self._relpath(path)
+        if self._include_re is not None and not _glob_matches(self._include_re, relpath, name):
+            return False
+        if self._exclude_re is not None and _glob_matches(self._exclude_re, relpath, name):
+            return False
+        return True
+
+    def walk(self, directory: Path) -> Iterator[Path]:
+        """directory 아래의 조건에 맞는 파일 (directory 는 감시 루트 또는 그 하위)."""
+        for p in iter_input_files(Path(directory), self.extensions, exclude=self.exclude):
+            if self.accepts_file(str(p)):
+                yield p
+
+
+class _InotifyBackend:
+    """inotify 로 하위 디렉토리까지 감시한다. 사용할 수 없으면 생성 시 OSError."""
+
+    def __init__(self, root: Path, file_filter: _Filter):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify 는 리눅스에서만 사용할 수 있습니다")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._root = str(root)
+        self._filter = file_filter
+        self._dirs: Dict[int, str] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch 실패: {os.strerror(errno)}", directory)
+        self._dirs[wd] = directory
+
+    def _add_tree(self, root: Path) -> None:
+        stack = [str(root)]
+        while stack:
+            directory = stack.pop()
+            self._add_watch(directory)
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False) and self._filter.accepts_dir(entry.path):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def events(self, timeout: float) -> Tuple[List[Tuple[str, bool]], List[str]]:
+        """
+        (변경된 파일, 쓰기가 끝났는지) 목록과 새로 생긴 디렉토리 목록을 반환한다.
+        timeout 초 동안 이벤트가 없으면 빈 목록.
+        """
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return [], []
+        try:
+            data = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return [], []
+
+        changed: List[Tuple[str, bool]] = []
+        new_dirs: List[str] = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # 이벤트를 잃었으므로 호출한 쪽이 전체를 다시 읽도록 알린다
+                new_dirs.append(self._root)
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and self._filter.accepts_dir(path):
+                    try:
+                        self._add_tree(Path(path))
+                    except OSError as e:
+                        print(f"[WARN] 새 디렉토리를 감시할 수 없습니다: {path} ({e})")
+                    # 감시를 붙이기 전에 들어온 파일도 찾도록 알린다
+                    new_dirs.append(path)
+                continue
+            if mask & (_IN_DELETE | _IN_MOVED_FROM):
+                continue
+            if self._filter.accepts_file(path):
+                changed.append((path, bool(mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO))))
+        return changed, new_dirs
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """주기적으로 디렉토리를 다시 읽어 새 파일과 크기/mtime 이 바뀐 파일을 찾는다."""
+
+    def __init__(self, root: Path, file_filter: _Filter, interval: float):
+        self._root = root
+        self._filter = file_filter
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._next_poll = time.monotonic() + interval
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for p in self._filter.walk(self._root):
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            snapshot[str(p)] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def events(self, timeout: float) -> Tuple[List[Tuple[str, bool]], List[str]]:
+        wait = self._next_poll - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(0.0, timeout))
+            return [], []
+        time.sleep(max(0.0, wait))
+        self._next_poll = time.monotonic() + self.interval
+
+        snapshot = self._scan()
+        changed = [
+            (path, False) for path, state in snapshot.items() if self._snapshot.get(path) != state
+        ]
+        self._snapshot = snapshot
+        return changed, []
+
+    def close(self) -> None:
+        pass
+
+
+class InboxWatcher:
+    """
+    디렉토리를 감시하며 쓰기가 끝난 파일을 묶음으로 내보내는 클래스.
+
+    :meth:`batches` 가 내보내는 파일은 마지막 변경 후 ``settle_seconds`` 동안 크기와
+    mtime 이 바뀌지 않은 파일이다. 같은 파일이 나중에 다시 바뀌면 다시 내보낸다.
+
+    Parameters
+    ----------
+    directory : str or Path
+        감시할 디렉토리. 하위 디렉토리도 함께 감시한다.
+    settle_seconds : float, optional
+        파일을 완성된 것으로 볼 때까지 변화가 없어야 하는 시간(초). 기본값 0.5.
+    poll_interval : float, optional
+        폴링 방식일 때 디렉토리를 다시 읽는 간격(초). 기본값 2.0.
+    extensions : Iterable[str] or None, optional
+        감시할 확장자. 기본값은 텍스트/오디오 확장자.
+    include, exclude : Iterable[str], optional
+        :func:`datamood.utils.iter_input_files` 와 같은 glob 조건.
+    use_inotify : bool, optional
+        None(기본값)이면 inotify 를 시도하고 실패하면 폴링한다.
+        False 이면 항상 폴링한다.
+    existing : bool, optional
+        True(기본값)이면 감시 시작 시 이미 있던 파일도 내보낸다.
+
+    Examples
+    --------
+    >>> watcher = InboxWatcher("inbox", exclude=["sorted"])
+    >>> for batch in watcher.batches():
+    ...     for path in batch:
+    ...         sorter.sort_file(path, "inbox/sorted")
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        settle_seconds: float = 0.5,
+        poll_interval: float = 2.0,
+        extensions: Optional[Iterable[str]] = INPUT_EXT,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        use_inotify: Optional[bool] = None,
+        existing: bool = True,
+    ):
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError(f"감시할 디렉토리가 없습니다: {self.directory}")
+        self.settle_seconds = settle_seconds
+        self._filter = _Filter(self.directory, extensions, include, exclude)
+        # path → [마지막 변화 시각, 크기, mtime_ns, 쓰기 중 여부]
+        self._pending: Dict[str, list] = {}
+
+        self.backend = None
+        if use_inotify is not False:
+            try:
+                self.backend = _InotifyBackend(self.directory, self._filter)
+            except (OSError, AttributeError) as e:
+                print(f"[WARN] inotify 를 사용할 수 없어 폴링으로 감시합니다 ({e})")
+        if self.backend is None:
+            self.backend = _PollingBackend(self.directory, self._filter, poll_interval)
+        self.mode = "inotify" if isinstance(self.backend, _InotifyBackend) else "polling"
+
+        if existing:
+            self._add_existing(self.directory)
+
+    def _add_existing(self, directory: str | Path) -> None:
+        for p in self._filter.walk(Path(directory)):
+            self._touch(str(p), writing=False, when=time.monotonic() - self.settle_seconds)
+
+    def _touch(self, path: str, writing: bool, when: Optional[float] = None) -> None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._pending.pop(path, None)
+            return
+        self._pending[path] = [
+            time.monotonic() if when is None else when, st.st_size, st.st_mtime_ns, writing
+        ]
+
+    def _ready(self, limit: int) -> List[Path]:
+        """settle_seconds 동안 변화가 없는 파일을 최대 limit 개 꺼낸다."""
+        now = time.monotonic()
+        ready = []
+        for path, state in list(self._pending.items()):
+            if len(ready) >= limit:
+                break
+            last_change, size, mtime_ns, writing = state
+            settle = self.settle_seconds * (_UNCLOSED_SETTLE_FACTOR if writing else 1)
+            if now - last_change < settle:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                # 처리 전에 지워지거나 옮겨진 파일
+                del self._pending[path]
+                continue
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                state[:3] = [now, st.st_size, st.st_mtime_ns]
+                continue
+            del self._pending[path]
+            ready.append(Path(path))
+        return ready
+
+    def poll(self, timeout: float, limit: int = 64) -> List[Path]:
+        """
+        최대 timeout 초 동안 이벤트를 받아 반영하고, 준비된 파일을 반환한다.
+
+        Parameters
+        ----------
+        timeout : float
+            이벤트를 기다릴 최대 시간(초).
+        limit : int, optional
+            한 번에 반환할 최대 파일 수.
+
+        Returns
+        -------
+        list of Path
+            쓰기가 끝난 것으로 판단된 파일 (없으면 빈 목록).
+        """
+        changed, new_dirs = self.backend.events(timeout)
+        for path, closed in changed:
+            self._touch(path, writing=not closed and self.mode == "inotify")
+        for directory in new_dirs:
+            self._add_existing(directory)
+        return self._ready(limit)
+
+    def batches(self, max_batch: int = 64, max_wait: float = 0.2) -> Iterator[List[Path]]:
+        """
+        준비된 파일을 묶음으로 계속 내보낸다 (끝나지 않는 제너레이터).
+
+        파일이 연달아 들어오면 ``max_wait`` 초 안에 준비된 파일을 최대 ``max_batch`` 개까지
+        모아서 한 번에 내보낸다.
+
+        Parameters
+        ----------
+        max_batch : int, optional
+            한 묶음의 최대 파일 수. 기본값 64.
+        max_wait : float, optional
+            첫 파일이 준비된 뒤 묶음을 채우기 위해 더 기다리는 시간(초). 기본값 0.2.
+
+        Yields
+        ------
+        list of Path
+            쓰기가 끝난 파일 묶음.
+        """
+        while True:
+            batch = self.poll(timeout=self.settle_seconds / 2 or 0.1, limit=max_batch)
+            if not batch:
+                continue
+            deadline = time.monotonic() + max_wait
+            while len(batch) < max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch += self.poll(timeout=remaining, limit=max_batch - len(batch))
+            yield batch
+
+    def close(self) -> None:
+        """감시를 중지합니다."""
+        self.backend.close()
+
+    def __enter__(self) -> "InboxWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
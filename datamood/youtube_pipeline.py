@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+"""
+datamood.youtube_pipeline
+-------------------------
+재생목록/채널/URL 목록을 위한 YouTube 일괄 분석 파이프라인
+
+다운로드 → 음성 인식(STT) → 감정 분석 단계를 각각 별도의 스레드 풀로 실행하고,
+단계 사이를 크기가 제한된 큐로 연결하여 세 단계가 겹쳐서 진행되도록 한다.
+영상 하나의 분석이 끝날 때마다 결과를 바로 내보낸다.
+
+주요 클래스/함수
+- YtDlpExtractor: yt-dlp 로 재생목록을 펼치고 영상 오디오를 PCM 으로 가져오는 추출기
+- YouTubeBatchPipeline: 다운로드/STT/감정 분석 단계 파이프라인
+- is_youtube_collection_url(url): 재생목록/채널 URL 여부 판별
+"""
+
+# 단계 종료를 알리는 표식
+_DONE = object()
+
+# 재생목록/채널 URL 에 나타나는 패턴
+_COLLECTION_PATTERNS = ("list=", "/playlist", "/channel/", "/c/", "/user/", "/@")
+
+
+def is_youtube_collection_url(url: str) -> bool:
+    """
+    URL 이 여러 영상을 담은 재생목록/채널 URL 인지 판별한다.
+
+    Parameters
+    ----------
+    url : str
+        검사할 YouTube URL.
+
+    Returns
+    -------
+    bool
+        재생목록(list=, /playlist) 또는 채널(/channel/, /c/, /user/, /@) URL 이면 True.
+    """
+    return any(pattern in url for pattern in _COLLECTION_PATTERNS)
+
+
+class YtDlpExtractor:
+    """
+    yt-dlp 를 이용해 재생목록/채널 URL 을 개별 영상 URL 로 펼치고,
+    영상 오디오를 16kHz 모노 PCM 으로 가져오는 추출기.
+
+    :class:`YouTubeBatchPipeline` 은 ``expand(url)`` 와 ``fetch_pcm(url)`` 두 메서드만
+    사용하므로, 같은 인터페이스를 가진 객체로 대체하여 오프라인에서 벤치마크할 수 있다.
+
+    Parameters
+    ----------
+    downloader : YouTubeDownloader, optional
+        오디오 다운로드에 사용할 다운로더. 지정하지 않으면 새로 만든다.
+    """
+
+    def __init__(self, downloader=None):
+        if downloader is None:
+            from .audio import YouTubeDownloader
+
+            downloader = YouTubeDownloader()
+        self.downloader = downloader
+
+    def expand(self, url: str) -> Iterator[str]:
+        """
+        재생목록/채널 URL 을 개별 영상 URL 로 펼친다. 단일 영상 URL 은 그대로 반환한다.
+
+        ``extract_flat`` 모드로 목록 정보만 가져오므로 영상 페이지를 하나씩 열지 않는다.
+
+        Parameters
+        ----------
+        url : str
+            YouTube 영상, 재생목록 또는 채널 URL.
+
+        Yields
+        ------
+        str
+            개별 영상 URL.
+        """
+        if not is_youtube_collection_url(url):
+            yield url
+            return
+
+        yield from self._iter_entries(self._extract_flat(url))
+
+    @staticmethod
+    def _extract_flat(url: str) -> Dict[str, Any]:
+        """yt-dlp 의 extract_flat 모드로 목록 정보만 가져온다."""
+        import yt_dlp
+
+        ydl_opts = {"extract_flat": "in_playlist", "quiet": True, "skip_download": True}
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
+    def _iter_entries(self, info: Dict[str, Any]) -> Iterator[str]:
+        """yt-dlp 정보 딕셔너리에서 영상 URL 을 재귀적으로 꺼낸다 (채널 탭 → 재생목록 → 영상)."""
+        entries = info.get("entries")
+        if entries is None:
+            url = info.get("webpage_url") or info.get("url")
+            if url:
+                yield url
+            elif info.get("id"):
+                yield f"https://www.youtube.com/watch?v={info['id']}"
+            return
+
+        for entry in entries:
+            if not entry:
+                continue
+            if entry.get("entries") is not None:
+                yield from self._iter_entries(entry)
+            elif entry.get("ie_key") == "YoutubeTab" and entry.get("url"):
+                # 채널의 탭(동영상/쇼츠/재생목록)은 한 번 더 펼친다
+                yield from self._iter_entries(self._extract_flat(entry["url"]))
+            elif entry.get("ie_key") == "Youtube" and entry.get("id"):
+                yield f"https://www.youtube.com/watch?v={entry['id']}"
+            elif entry.get("url"):
+                yield entry["url"]
+
+    def fetch_pcm(self, url: str) -> Optional[bytes]:
+        """
+        영상 오디오를 격리된 작업 디렉토리에 내려받아 PCM 으로 디코딩한다.
+
+        디코딩이 끝나면 작업 디렉토리는 바로 삭제된다.
+
+        Parameters
+        ----------
+        url : str
+            영상 URL.
+
+        Returns
+        -------
+        bytes or None
+            16kHz 모노 16-bit PCM. 실패 시 None.
+        """
+        return self.downloader.download_pcm(url)
+
+
+class YouTubeBatchPipeline:
+    """
+    여러 YouTube URL(재생목록/채널 포함)을 다운로드 → STT → 감정 분석 단계로
+    겹쳐서 처리하는 파이프라인.
+
+    - 다운로드 풀(``download_workers`` 개 스레드): 영상 오디오를 PCM 으로 가져온다.
+    - STT 풀(``stt_workers`` 개 스레드): PCM 을 텍스트로 인식한다.
+    - 감정 분석 단계(스레드 1개): 인식된 텍스트의 감정을 분석한다.
+
+    단계 사이의 큐는 ``queue_size`` 로 크기가 제한되어 있어, 뒤 단계가 느리면
+    앞 단계가 기다리므로 메모리에 쌓이는 PCM 의 양이 제한된다.
+
+    Parameters
+    ----------
+    sorter : MoodSorter
+        STT(``audio_preprocessor``)와 감정 분석(``text_analyzer``)에 사용할 인스턴스.
+    extractor : object, optional
+        ``expand(url)`` 와 ``fetch_pcm(url)`` 를 제공하는 추출기.
+        기본값은 :class:`YtDlpExtractor`.
+    download_workers : int, optional
+        동시에 다운로드할 영상 수. 기본값 4.
+    stt_workers : int, optional
+        동시에 음성 인식할 영상 수. 기본값 2.
+    queue_size : int, optional
+        단계 사이 큐의 최대 길이. 기본값 4.
+
+    Examples
+    --------
+    >>> pipeline = YouTubeBatchPipeline(MoodSorter(), download_workers=4, stt_workers=2)
+    >>> for result in pipeline.run(["https://www.youtube.com/playlist?list=..."]):
+    ...     print(result["url"], result["emotion_label"])
+    """
+
+    def __init__(
+        self,
+        sorter,
+        extractor=None,
+        download_workers: int = 4,
+        stt_workers: int = 2,
+        queue_size: int = 4,
+    ):
+        self.sorter = sorter
+        self.extractor = extractor if extractor is not None else YtDlpExtractor(sorter.youtube_downloader)
+        self.download_workers = max(1, download_workers)
+        self.stt_workers = max(1, stt_workers)
+        self.queue_size = max(1, queue_size)
+
+    def expand_urls(self, urls: Iterable[str]) -> Iterator[str]:
+        """
+        입력 URL 목록의 재생목록/채널을 펼치고, 중복 영상은 한 번만 반환한다.
+
+        펼치지 못한 URL 은 경고를 출력하고 건너뛴 뒤 다음 URL 을 계속 처리한다.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            영상/재생목록/채널 URL 목록.
+
+        Yields
+        ------
+        str
+            개별 영상 URL.
+        """
+        for video_url, error in self._expand(urls):
+            if error is None:
+                yield video_url
+            else:
+                print(f"[WARN] URL 을 펼치지 못했습니다 ({video_url}): {error}")
+
+    def _expand(self, urls: Iterable[str]) -> Iterator[Tuple[str, Optional[Exception]]]:
+        """(영상 URL, None) 또는 펼치지 못한 입력 URL 이면 (입력 URL, 예외)를 내보낸다."""
+        seen = set()
+        for url in urls:
+            url = url.strip()
+            if not url:
+                continue
+            try:
+                for video_url in self.extractor.expand(url):
+                    if video_url not in seen:
+                        seen.add(video_url)
+                        yield video_url, None
+            except Exception as e:
+                # 재생목록/채널 하나가 실패해도 나머지 입력은 계속 처리
+                yield url, e
+
+    def run(self, urls: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        URL 목록을 파이프라인으로 처리하고, 영상별 결과를 완료되는 순서대로 내보낸다.
+
+        결과 딕셔너리는 :meth:`MoodSorter.analyze_youtube` 와 같은 형태이며,
+        ``index`` (펼쳐진 목록에서의 순서)와 ``raw["timings"]``
+        (download_seconds, stt_seconds, sentiment_seconds)가 추가된다.
+        실패한 영상은 ``raw["error"]`` 에 원인이 기록되고 감정 레이블은 "중립"이다.
+
+        제너레이터를 중간에 닫으면 진행 중인 작업이 끝나는 대로 모든 스레드가 멈춘다.
+
+        Parameters
+        ----------
+        urls : Iterable[str]
+            영상/재생목록/채널 URL 목록.
+
+        Yields
+        ------
+        dict
+            영상 하나의 분석 결과.
+        """
+        stop = threading.Event()
+        url_queue: queue.Queue = queue.Queue(self.queue_size)
+        pcm_queue: queue.Queue = queue.Queue(self.queue_size)
+        text_queue: queue.Queue = queue.Queue(self.queue_size)
+        result_queue: queue.Queue = queue.Queue(self.queue_size)
+
+        def put(q: queue.Queue, item) -> bool:
+            # 큐가 가득 찬 동안 중단 요청을 확인하며 대기
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _DONE
+
+        def finish_stage(counter: List[int], lock: threading.Lock, next_queue: queue.Queue, n_next: int) -> None:
+            # 단계의 마지막 워커가 다음 단계 워커 수만큼 종료 표식을 넣는다
+            with lock:
+                counter[0] -= 1
+                last = counter[0] == 0
+            if last:
+                for _ in range(n_next):
+                    put(next_queue, _DONE)
+
+        def feed() -> None:
+            index = 0
+            try:
+                for url, error in self._expand(urls):
+                    if error is not None:
+                        # 펼치지 못한 입력 URL 은 실패 결과로 알리고 다음 입력으로 진행
+                        if not put(result_queue, self._failure(-1, url, f"expand_failed: {error}", {})):
+                            return
+                        continue
+                    if not put(url_queue, (index, url)):
+                        return
+                    index += 1
+            except Exception as e:
+                # 입력 목록 자체를 읽다가 실패한 경우
+                put(result_queue, self._failure(-1, "", f"expand_failed: {e}", {}))
+            finally:
+                for _ in range(self.download_workers):
+                    put(url_queue, _DONE)
+
+        download_left, download_lock = [self.download_workers], threading.Lock()
+
+        def download() -> None:
+            while True:
+                item = get(url_queue)
+                if item is _DONE:
+                    break
+                index, url = item
+                started = time.perf_counter()
+                try:
+                    pcm = self.extractor.fetch_pcm(url)
+                except Exception as e:
+                    print(f"❌ 다운로드 실패 ({url}): {e}")
+                    pcm = None
+                timings = {"download_seconds": round(time.perf_counter() - started, 3)}
+                if pcm is None:
+                    put(result_queue, self._failure(index, url, "download_failed", timings))
+                else:
+                    put(pcm_queue, (index, url, pcm, timings))
+            finish_stage(download_left, download_lock, pcm_queue, self.stt_workers)
+
+        stt_left, stt_lock = [self.stt_workers], threading.Lock()
+        # 지연 생성 속성이므로 STT 스레드를 띄우기 전에 한 번만 만들어 모든 작업자가 공유
+        preprocessor = self.sorter.audio_preprocessor
+
+        def transcribe() -> None:
+            while True:
+                item = get(pcm_queue)
+                if item is _DONE:
+                    break
+                index, url, pcm, timings = item
+                started = time.perf_counter()
+                text = preprocessor.extract_text_from_pcm(pcm)
+                timings["stt_seconds"] = round(time.perf_counter() - started, 3)
+                vad_report = preprocessor.last_vad_report
+                if not text:
+                    put(result_queue, self._failure(index, url, "audio_recognition_failed", timings, vad_report))
+                else:
+                    put(text_queue, (index, url, text, timings, vad_report))
+            finish_stage(stt_left, stt_lock, text_queue, 1)
+
+        def analyze() -> None:
+            while True:
+                item = get(text_queue)
+                if item is _DONE:
+                    break
+                index, url, text, timings, vad_report = item
+                started = time.perf_counter()
+                try:
+                    text_result = self.sorter.text_analyzer.analyze(text)
+                except Exception as e:
+                    put(result_queue, self._failure(index, url, f"sentiment_failed: {e}", timings, vad_report))
+                    continue
+                timings["sentiment_seconds"] = round(time.perf_counter() - started, 3)
+                put(result_queue, {
+                    "type": "youtube",
+                    "index": index,
+                    "url": url,
+                    "emotion_label": text_result.get("label", "중립"),
+                    "raw": {
+                        "recognized_text": text,
+                        "text_analysis": text_result,
+                        "timings": timings,
+                        "vad": vad_report,
+                    },
+                })
+            put(result_queue, _DONE)
+
+        threads = [threading.Thread(target=feed, name="yt-feed", daemon=True)]
+        threads += [
+            threading.Thread(target=download, name=f"yt-download-{i}", daemon=True)
+            for i in range(self.download_workers)
+        ]
+        threads += [
+            threading.Thread(target=transcribe, name=f"yt-stt-{i}", daemon=True)
+            for i in range(self.stt_workers)
+        ]
+        threads.append(threading.Thread(target=analyze, name="yt-sentiment", daemon=True))
+
+        for t in threads:
+            t.start()
+
+        try:
+            while True:
+                result = get(result_queue)
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+
+    @staticmethod
+    def _failure(
+        index: int,
+        url: str,
+        error: str,
+        timings: Dict[str, float],
+        vad_report: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """실패한 영상의 결과 딕셔너리를 만든다."""
+        return {
+            "type": "youtube",
+            "index": index,
+            "url": url,
+            "emotion_label": "중립",
+            "raw": {"error": error, "timings": timings, "vad": vad_report},
+        }
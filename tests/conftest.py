@@ -0,0 +1,76 @@
+import http.server
+import threading
+
+import pytest
+
+
+class FixtureServer:
+    """
+    테스트용 로컬 HTTP/1.1 서버.
+
+    ``pages`` 의 경로 → HTML 을 제공하고, ETag 가 같으면 304 를 응답한다.
+    서버 쪽에서 받아들인 연결 수(``connections``)와 요청 수(``requests``)를 센다.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.etags = {}
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                name = self.path.lstrip("/")
+                body = server.pages.get(name)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = server.etags.get(name)
+                if etag is not None and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                if etag is not None:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}/{name}"
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def http_server():
+    server = FixtureServer()
+    yield server
+    server.close()
@@ -0,0 +1,168 @@
+import errno
+import os
+
+import pytest
+
+from datamood.utils import copy_engine
+from datamood.utils.copy_engine import CopyEngine, fast_copy, file_digest, verify_copy
+
+DATA = os.urandom(3 * 1024 * 1024 + 17)
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.wav"
+    path.write_bytes(DATA)
+    os.chmod(path, 0o640)
+    os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    return path
+
+
+def _leftovers(directory):
+    return [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("method", [name for name, _ in copy_engine._METHODS])
+def test_each_method_copies_content_and_metadata(method, src, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        copy_engine, "_METHODS", [m for m in copy_engine._METHODS if m[0] == method]
+    )
+    dst = tmp_path / "out" / "dst.wav"
+    dst.parent.mkdir()
+    assert fast_copy(src, dst) == len(DATA)
+    assert dst.read_bytes() == DATA
+    st_src, st_dst = os.stat(src), os.stat(dst)
+    assert st_dst.st_mode == st_src.st_mode
+    assert st_dst.st_mtime_ns == st_src.st_mtime_ns
+    assert _leftovers(dst.parent) == []
+
+
+def test_falls_back_on_short_copy(src, tmp_path, monkeypatch):
+    def short(in_fd, out_fd):
+        os.write(out_fd, b"partial")
+        return 7
+
+    monkeypatch.setattr(
+        copy_engine, "_METHODS", [("short", short), ("buffered", copy_engine._buffered)]
+    )
+    dst = tmp_path / "dst.wav"
+    assert fast_copy(src, dst) == len(DATA)
+    assert dst.read_bytes() == DATA
+
+
+@pytest.mark.parametrize("code", [errno.EXDEV, errno.ENOSYS])
+def test_falls_back_on_unsupported_error(code, src, tmp_path, monkeypatch):
+    def unsupported(in_fd, out_fd):
+        raise OSError(code, os.strerror(code))
+
+    monkeypatch.setattr(
+        copy_engine, "_METHODS", [("unsupported", unsupported), ("buffered", copy_engine._buffered)]
+    )
+    dst = tmp_path / "dst.wav"
+    assert fast_copy(src, dst) == len(DATA)
+    assert dst.read_bytes() == DATA
+
+
+def test_other_errors_are_raised(src, tmp_path, monkeypatch):
+    def broken(in_fd, out_fd):
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(
+        copy_engine, "_METHODS", [("broken", broken), ("buffered", copy_engine._buffered)]
+    )
+    with pytest.raises(OSError) as info:
+        fast_copy(src, tmp_path / "dst.wav")
+    assert info.value.errno == errno.EIO
+
+
+def test_interrupted_copy_leaves_no_file(src, tmp_path, monkeypatch):
+    def interrupted(in_fd, out_fd):
+        os.write(out_fd, DATA[:1024])
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(copy_engine, "_METHODS", [("interrupted", interrupted)])
+    dst = tmp_path / "out" / "dst.wav"
+    dst.parent.mkdir()
+    with pytest.raises(KeyboardInterrupt):
+        fast_copy(src, dst)
+    assert os.listdir(dst.parent) == []
+
+
+def test_failed_verification_keeps_existing_dst(src, tmp_path, monkeypatch):
+    dst = tmp_path / "out" / "dst.wav"
+    dst.parent.mkdir()
+    dst.write_bytes(b"old")
+
+    def corrupting(in_fd, out_fd):
+        os.write(out_fd, b"\0" * len(DATA))
+        return len(DATA)
+
+    monkeypatch.setattr(copy_engine, "_METHODS", [("corrupting", corrupting)])
+    with pytest.raises(OSError) as info:
+        fast_copy(src, dst, verify="hash")
+    assert info.value.errno == errno.EIO
+    assert dst.read_bytes() == b"old"
+    assert _leftovers(dst.parent) == []
+
+
+def test_verify_copy(src, tmp_path):
+    same = tmp_path / "same.wav"
+    same.write_bytes(DATA)
+    verify_copy(src, same, "hash")
+    assert file_digest(src) == file_digest(same)
+
+    flipped = tmp_path / "flipped.wav"
+    flipped.write_bytes(DATA[:-1] + bytes([DATA[-1] ^ 0xFF]))
+    verify_copy(src, flipped, "size")
+    with pytest.raises(OSError):
+        verify_copy(src, flipped, "hash")
+    short = tmp_path / "short.wav"
+    short.write_bytes(DATA[:-1])
+    with pytest.raises(OSError):
+        verify_copy(src, short, "size")
+    with pytest.raises(ValueError):
+        verify_copy(src, same, "crc")
+
+
+def test_engine_copies_concurrently_and_counts(src, tmp_path):
+    done = []
+    with CopyEngine(workers=2, verify="size", max_pending=2) as engine:
+        futures = [
+            engine.submit(src, tmp_path / f"dst{i}.wav", callback=done.append) for i in range(5)
+        ]
+    assert [f.result() for f in futures] == [len(DATA)] * 5
+    assert len(done) == 5
+    stats = engine.stats()
+    assert (stats["files"], stats["bytes"], stats["failed"]) == (5, 5 * len(DATA), 0)
+    for i in range(5):
+        assert (tmp_path / f"dst{i}.wav").read_bytes() == DATA
+
+
+def test_engine_inline_and_failures(src, tmp_path):
+    engine = CopyEngine(workers=0)
+    done = []
+    ok = engine.submit(src, tmp_path / "dst.wav", callback=done.append)
+    failed = engine.submit(tmp_path / "missing.wav", tmp_path / "dst2.wav", callback=done.append)
+    assert ok.result() == len(DATA)
+    assert isinstance(failed.exception(), FileNotFoundError)
+    assert done == [ok, failed]
+    assert engine.stats()["failed"] == 1
+    engine.close()
+
+
+def test_engine_releases_slots_on_failure(tmp_path):
+    engine = CopyEngine(workers=1, max_pending=1)
+    for i in range(3):
+        future = engine.submit(tmp_path / "missing.wav", tmp_path / f"dst{i}.wav")
+        assert isinstance(future.exception(timeout=10), FileNotFoundError)
+    engine.close()
+    assert engine.stats()["failed"] == 3
+    with pytest.raises(RuntimeError):
+        engine.submit(tmp_path / "missing.wav", tmp_path / "late.wav")
+    # 넘기지 못한 작업의 자리도 돌려준다
+    assert engine._slots.acquire(blocking=False)
+
+
+def test_engine_rejects_unknown_verify():
+    with pytest.raises(ValueError):
+        CopyEngine(verify="crc")
@@ -0,0 +1,106 @@
+import pytest
+
+from datamood.text import http_cache as http_cache_module
+from datamood.text.http_cache import CACHE_FRESH, CACHE_MISS, CACHE_NOT_MODIFIED, HttpCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(http_cache_module.time, "time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(str(tmp_path / "http.sqlite"), ttl_seconds=100, fresh_seconds=10)
+    yield cache
+    cache.close()
+
+
+def test_store_and_lookup(cache, clock):
+    cache.store("http://a/1", "<html>본문</html>", '"v1"', None, "제목", "본문")
+    entry = cache.lookup("http://a/1")
+    assert entry["html"] == "<html>본문</html>"
+    assert (entry["title"], entry["body"]) == ("제목", "본문")
+    assert entry["fresh"] is True
+    assert cache.lookup("http://a/2") is None
+
+
+def test_fresh_window_and_revalidation(cache, clock):
+    cache.store("http://a/1", "<html/>", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", "t", "b")
+    clock.now += 11
+    entry = cache.lookup("http://a/1")
+    assert entry["fresh"] is False
+    assert HttpCache.conditional_headers(entry) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+    cache.mark_validated("http://a/1", etag='"v2"')
+    entry = cache.lookup("http://a/1")
+    assert entry["fresh"] is True
+    assert entry["etag"] == '"v2"'
+
+
+def test_ttl_expiry(cache, clock):
+    cache.store("http://a/1", "<html/>", None, None, "t", "b")
+    clock.now += 101
+    assert cache.lookup("http://a/1") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_size(tmp_path, clock):
+    cache = HttpCache(str(tmp_path / "http.sqlite"), max_bytes=2500)
+    body = "가" * 300  # 900 바이트
+    for name in ("a", "b"):
+        cache.store(f"http://h/{name}", "<html/>", None, None, "", body)
+        clock.now += 1
+    cache.lookup("http://h/a")  # a 를 최근 사용으로
+    clock.now += 1
+    cache.store("http://h/c", "<html/>", None, None, "", body)
+
+    assert cache.lookup("http://h/b") is None
+    assert cache.lookup("http://h/a") is not None
+    assert cache.lookup("http://h/c") is not None
+    assert cache.stats()["bytes"] <= 2500
+    cache.close()
+
+
+def test_no_conditional_headers_without_validators():
+    assert HttpCache.conditional_headers(None) == {}
+    assert HttpCache.conditional_headers({"etag": None, "last_modified": None}) == {}
+
+
+def test_fetch_page_revalidates_with_304(http_server, tmp_path):
+    pytest.importorskip("requests")
+    pytest.importorskip("bs4")
+    from datamood.text.http_client import build_session
+    from datamood.text.텍스트추출_저장 import Converter_save
+
+    http_server.pages["a"] = "<html><body><p>본문</p></body></html>"
+    http_server.etags["a"] = '"v1"'
+    url = http_server.url("a")
+    cache = HttpCache(str(tmp_path / "http.sqlite"))
+    session = build_session(retries=0)
+
+    first = Converter_save.fetch_page(url, session=session, cache=cache)
+    assert first["cache"] == CACHE_MISS
+    cache.store(url, first["html"], first["etag"], first["last_modified"], "제목", "본문")
+
+    second = Converter_save.fetch_page(url, session=session, cache=cache)
+    assert second["cache"] == CACHE_NOT_MODIFIED
+    assert (second["title"], second["body"]) == ("제목", "본문")
+    assert cache.stats()[CACHE_FRESH] == 0
+    assert cache.stats()["hit_rate"] == 0.5
+    assert http_server.requests == 2
+    session.close()
+    cache.close()
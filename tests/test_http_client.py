@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from datamood.registry import default_registry
+from datamood.text import http_client
+from datamood.text.http_client import build_session, configure_session, connection_stats, get_session
+from datamood.text.텍스트추출_저장 import Converter_save
+
+PAGE = "<html><head><title>제목</title></head><body><article><p>본문 문장입니다.</p></article></body></html>"
+
+
+@pytest.fixture
+def fresh_registry():
+    default_registry.close()
+    yield
+    http_client._session_options.clear()
+    default_registry.close()
+
+
+def test_fetch_page_reuses_one_connection(http_server):
+    for i in range(5):
+        http_server.pages[f"p{i}"] = PAGE
+    session = build_session(retries=0)
+
+    for i in range(5):
+        page = Converter_save.fetch_page(http_server.url(f"p{i}"), session=session)
+        assert "본문" in page["html"]
+
+    assert http_server.requests == 5
+    assert http_server.connections == 1
+    stats = connection_stats(session)
+    (host_stats,) = stats.values()
+    assert host_stats == {"connections": 1, "requests": 5}
+    session.close()
+
+
+def test_fetch_page_uses_shared_session_by_default(http_server, fresh_registry):
+    http_server.pages["a"] = PAGE
+    Converter_save.fetch_page(http_server.url("a"))
+    Converter_save.fetch_page(http_server.url("a"))
+
+    assert http_server.connections == 1
+    assert sum(s["requests"] for s in connection_stats().values()) == 2
+
+
+def test_configure_session_closes_previous_session(fresh_registry):
+    old = get_session()
+    closed = []
+    old.close = lambda: closed.append(True)
+
+    new = configure_session(pool_maxsize=4)
+
+    assert new is not old
+    assert closed == [True]
+    assert get_session() is new
+
+
+def test_configure_session_with_same_options_keeps_session(fresh_registry):
+    session = configure_session(retries=1)
+    assert configure_session(retries=1) is session
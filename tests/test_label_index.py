@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from datamood.label_index import LabelIndex, result_scores
+
+
+def _result(path, label, score, percentage, type="text"):
+    return {
+        "path": str(path),
+        "type": type,
+        "emotion_label": label,
+        "raw": {"score": score, "percentage": percentage},
+    }
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name in ("a.txt", "b.txt", "c.wav", "d.txt"):
+        path = tmp_path / name
+        path.write_text(name, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def index(tmp_path, files):
+    a, b, c, d = files
+    with LabelIndex(tmp_path / "index.sqlite") as index:
+        index.add(_result(a, "부정적", -2.4, 20.0))
+        index.add(_result(b, "부정적", -0.5, 45.0))
+        index.add(_result(c, "긍정적", 1.5, 80.0, type="audio"))
+        index.add(_result(d, "중립", 0.0, 50.0))
+        yield index
+
+
+def test_result_scores_sources():
+    assert result_scores({"raw": {"score": 1.0, "percentage": 60.0}}) == (1.0, 60.0)
+    assert result_scores({"raw": {"text_analysis": {"score": -1.0, "percentage": 30.0}}}) == (-1.0, 30.0)
+    assert result_scores({"raw": {"overall": {"percentage": 55.0}}}) == (None, 55.0)
+    assert result_scores({"raw": {"error": "x"}}) == (None, None)
+
+
+def test_query_filters(index, files):
+    a, b, c, d = (os.path.abspath(p) for p in files)
+    assert [r["path"] for r in index.query(label="부정적")] == [a, b]
+    assert [r["path"] for r in index.query(label="부정적", max_percentage=30)] == [a]
+    assert [r["path"] for r in index.query(label=["긍정적", "중립"])] == [c, d]
+    assert [r["path"] for r in index.query(type="audio")] == [c]
+    assert [r["path"] for r in index.query(min_score=0.0)] == [c, d]
+    assert [r["path"] for r in index.query(min_percentage=45, max_percentage=50)] == [b, d]
+    assert len(index.query(limit=2)) == 2
+
+
+def test_labels_and_len(index):
+    assert index.labels() == {"긍정적": 1, "부정적": 2, "중립": 1}
+    assert len(index) == 4
+
+
+def test_is_current_tracks_size_and_mtime(index, files):
+    a = files[0]
+    assert index.is_current(a)
+    a.write_text("바뀐 내용입니다", encoding="utf-8")
+    assert not index.is_current(a)
+
+
+def test_rename_and_remove(index, files, tmp_path):
+    a = files[0]
+    moved = tmp_path / "moved.txt"
+    index.rename(a, moved)
+    assert index.get(a) is None
+    assert index.get(moved)["label"] == "부정적"
+
+    index.remove(moved)
+    assert index.get(moved) is None
+
+
+def test_pending_records_are_visible_and_persisted(tmp_path, files):
+    path = tmp_path / "index.sqlite"
+    index = LabelIndex(path, batch_size=100, flush_seconds=3600)
+    index.add(_result(files[0], "중립", 0.0, 50.0))
+    assert index.get(files[0])["label"] == "중립"
+    index.close()
+
+    with LabelIndex(path) as reopened:
+        assert reopened.get(files[0])["percentage"] == 50.0
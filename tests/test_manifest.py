@@ -0,0 +1,189 @@
+import os
+import shutil
+
+import pytest
+
+from datamood.manifest import MANIFEST_CHANGED, MANIFEST_NEW, MANIFEST_UNCHANGED, SortManifest
+
+
+def _sorted_result(dst, label="긍정적", link_mode="copy"):
+    return {
+        "type": "text",
+        "emotion_label": label,
+        "raw": {"score": 2.0, "percentage": 70.0},
+        "sorted_path": str(dst),
+        "link_mode": link_mode,
+    }
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "in" / "a.txt"
+    path.parent.mkdir()
+    path.write_text("좋은 하루", encoding="utf-8")
+    return path
+
+
+def _place(source, output_root, label="긍정적"):
+    dst = output_root / label / source.name
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, dst)
+    return dst
+
+
+def test_new_then_unchanged(source, tmp_path):
+    out = tmp_path / "out"
+    with SortManifest(out) as manifest:
+        status, entry = manifest.check(source)
+        assert (status, entry) == (MANIFEST_NEW, None)
+        manifest.record(manifest.stat_source(source), _sorted_result(_place(source, out)))
+
+    with SortManifest(out) as manifest:
+        status, entry = manifest.check(source)
+        assert status == MANIFEST_UNCHANGED
+        assert entry["label"] == "긍정적"
+        assert (entry["score"], entry["percentage"]) == (2.0, 70.0)
+        assert manifest.counts[MANIFEST_UNCHANGED] == 1
+
+
+def test_changed_content_and_missing_destination(source, tmp_path):
+    out = tmp_path / "out"
+    with SortManifest(out) as manifest:
+        dst = _place(source, out)
+        manifest.record(manifest.stat_source(source), _sorted_result(dst))
+
+        source.write_text("나쁜 하루입니다", encoding="utf-8")
+        assert manifest.check(source)[0] == MANIFEST_CHANGED
+
+        manifest.record(manifest.stat_source(source), _sorted_result(dst))
+        assert manifest.check(source)[0] == MANIFEST_UNCHANGED
+        dst.unlink()
+        assert manifest.check(source)[0] == MANIFEST_CHANGED
+
+
+def test_mtime_only_change_is_unchanged_with_hash(source, tmp_path):
+    out = tmp_path / "out"
+    with SortManifest(out, hash_files=True) as manifest:
+        manifest.record(manifest.stat_source(source), _sorted_result(_place(source, out)))
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert manifest.check(source)[0] == MANIFEST_UNCHANGED
+
+
+def test_mtime_only_change_is_changed_without_hash(source, tmp_path):
+    out = tmp_path / "out"
+    with SortManifest(out) as manifest:
+        assert manifest.stat_source(source)["hash"] is None
+        manifest.record(manifest.stat_source(source), _sorted_result(_place(source, out)))
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert manifest.check(source)[0] == MANIFEST_CHANGED
+
+
+def test_records_are_batched_until_flush(source, tmp_path):
+    manifest = SortManifest(tmp_path / "out", batch_size=100, flush_seconds=3600)
+    manifest.record(manifest.stat_source(source), _sorted_result(tmp_path / "x"))
+    rows = manifest._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    assert rows == 0
+    assert len(manifest) == 1
+    manifest.close()
+
+
+def test_recovering_after_unclean_shutdown(tmp_path):
+    out = tmp_path / "out"
+    SortManifest(out).close()
+    assert SortManifest(out).recovering is False  # 이전 실행은 정상 종료
+
+    # 위 인스턴스를 닫지 않았으므로 "open" 표시가 남아 있다
+    manifest = SortManifest(out)
+    assert manifest.recovering is True
+    manifest.close()
+
+
+def test_find_placed_copy(source, tmp_path):
+    out = tmp_path / "out"
+    label_dir = out / "긍정적"
+    label_dir.mkdir(parents=True)
+    (label_dir / "a.txt").write_text("다른 파일", encoding="utf-8")
+    shutil.copy2(source, label_dir / "a_1.txt")
+
+    with SortManifest(out) as manifest:
+        found = manifest.find_placed(source, label_dir / "a.txt", "copy")
+    assert found == (label_dir / "a_1.txt", "copy")
+
+
+def test_find_placed_links(source, tmp_path):
+    out = tmp_path / "out"
+    label_dir = out / "긍정적"
+    label_dir.mkdir(parents=True)
+    with SortManifest(out) as manifest:
+        assert manifest.find_placed(source, label_dir / "a.txt", "symlink") is None
+
+        os.symlink(os.path.abspath(source), label_dir / "a.txt")
+        assert manifest.find_placed(source, label_dir / "a.txt", "symlink") == (label_dir / "a.txt", "symlink")
+
+        os.unlink(label_dir / "a.txt")
+        os.link(source, label_dir / "a.txt")
+        assert manifest.find_placed(source, label_dir / "a.txt", "hardlink") == (label_dir / "a.txt", "hardlink")
+
+        # move 는 원본이 남아 있으면 배치되지 않은 것
+        assert manifest.find_placed(source, label_dir / "a.txt", "move") is None
+
+
+def test_find_placed_ignores_truncated_copy(source, tmp_path):
+    out = tmp_path / "out"
+    label_dir = out / "긍정적"
+    label_dir.mkdir(parents=True)
+    (label_dir / "a.txt").write_bytes(b"")
+    with SortManifest(out) as manifest:
+        assert manifest.find_placed(source, label_dir / "a.txt", "copy") is None
+
+
+def test_upgrades_manifest_without_score_columns(tmp_path):
+    import sqlite3
+
+    out = tmp_path / "out"
+    out.mkdir()
+    conn = sqlite3.connect(str(out / SortManifest.FILENAME))
+    conn.execute(
+        "CREATE TABLE entries (source TEXT PRIMARY KEY, size INTEGER NOT NULL,"
+        " mtime_ns INTEGER NOT NULL, hash TEXT, type TEXT, label TEXT, destination TEXT,"
+        " link_mode TEXT, sorted_at REAL NOT NULL)"
+    )
+    conn.execute("INSERT INTO entries VALUES ('/x', 1, 1, NULL, 'text', '중립', '/d', 'copy', 0)")
+    conn.commit()
+    conn.close()
+
+    with SortManifest(out) as manifest:
+        entry = manifest._entry("/x")
+    assert entry["label"] == "중립"
+    assert entry["score"] is None
+
+
+class _StubAnalyzer:
+    def analyze(self, text):
+        return {"label": "긍정적", "score": 2.0, "percentage": 70.0}
+
+
+def test_sort_file_adopts_placement_after_crash(source, tmp_path):
+    from datamood import MoodSorter
+
+    sorter = MoodSorter()
+    sorter.text_analyzer = _StubAnalyzer()
+    out = tmp_path / "out"
+
+    # 기록을 저장하지 못하고 끝난 실행 (close 하지 않음)
+    crashed = SortManifest(out, flush_seconds=3600)
+    first = sorter.sort_file(source, out, manifest=crashed)
+    crashed._conn.close()
+
+    with SortManifest(out) as manifest:
+        assert manifest.recovering
+        second = sorter.sort_file(source, out, manifest=manifest)
+    assert second["sorted_path"] == first["sorted_path"]
+    assert sorted(p.name for p in (out / "긍정적").iterdir()) == ["a.txt"]
+
+    with SortManifest(out) as manifest:
+        third = sorter.sort_file(source, out, manifest=manifest)
+    assert third["manifest"] == MANIFEST_UNCHANGED
+    assert third["raw"]["percentage"] == 70.0
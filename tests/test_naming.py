@@ -0,0 +1,55 @@
+import os
+import threading
+
+from datamood.utils.naming import NameAllocator
+
+
+def test_allocates_numbered_names(tmp_path):
+    allocator = NameAllocator()
+    target = tmp_path / "긍정적" / "transcript.txt"
+    paths = [allocator.allocate(target) for _ in range(3)]
+    assert [p.name for p in paths] == ["transcript.txt", "transcript_1.txt", "transcript_2.txt"]
+    assert all(p.exists() and p.stat().st_size == 0 for p in paths)
+
+
+def test_skips_existing_and_external_files(tmp_path):
+    (tmp_path / "a.txt").write_text("x")
+    (tmp_path / "a_1.txt").write_text("x")
+    allocator = NameAllocator()
+    assert allocator.allocate(tmp_path / "a.txt").name == "a_2.txt"
+    # 인덱스를 만든 뒤 다른 프로세스가 만든 파일도 건너뛴다
+    (tmp_path / "a_3.txt").write_text("x")
+    assert allocator.allocate(tmp_path / "a.txt").name == "a_4.txt"
+
+
+def test_release_and_forget(tmp_path):
+    allocator = NameAllocator()
+    first = allocator.allocate(tmp_path / "a.txt")
+    second = allocator.allocate(tmp_path / "a.txt")
+    os.unlink(first)
+    allocator.release(first)
+    assert allocator.allocate(tmp_path / "a.txt") == first
+
+    os.unlink(second)
+    allocator.forget(tmp_path)
+    assert allocator.allocate(tmp_path / "a.txt") == second
+
+
+def test_concurrent_allocations_are_unique(tmp_path):
+    allocators = [NameAllocator(), NameAllocator()]
+    results = []
+    lock = threading.Lock()
+
+    def worker(allocator):
+        for _ in range(50):
+            path = allocator.allocate(tmp_path / "t.txt")
+            with lock:
+                results.append(path.name)
+
+    threads = [threading.Thread(target=worker, args=(allocators[i % 2],)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == len(set(results)) == 200
+    assert len(os.listdir(tmp_path)) == 200
@@ -0,0 +1,123 @@
+import csv
+import json
+
+import pytest
+
+from datamood.results import (
+    FIELD_NAMES,
+    CsvResultWriter,
+    JsonlResultWriter,
+    flatten_result,
+    open_result_writer,
+    result_format,
+)
+
+TEXT_RESULT = {
+    "type": "text",
+    "path": "data/a.txt",
+    "emotion_label": "기쁨",
+    "sorted_path": "sorted/기쁨/a.txt",
+    "link_mode": "copy",
+    "moved": False,
+    "manifest": "new",
+    "raw": {"score": 0.82, "percentage": 82.0, "timings": {"analyze_seconds": 0.1, "place_seconds": 0.2}},
+}
+AUDIO_RESULT = {
+    "type": "audio",
+    "path": "data/b.wav",
+    "emotion_label": "슬픔",
+    "raw": {
+        "text_analysis": {"score": -0.4, "percentage": 40.0},
+        "label_source": "acoustic",
+        "timings": {"stt_seconds": 1.5, "sentiment_seconds": 0.25},
+    },
+}
+URL_FAILURE = {
+    "type": "url",
+    "url": "http://example.com/x",
+    "status": "error",
+    "emotion_label": "중립",
+    "raw": {"error": "fetch_failed: timeout", "timings": {"fetch_seconds": 3.0}},
+}
+RESULTS = [TEXT_RESULT, AUDIO_RESULT, URL_FAILURE, {"type": "unknown", "path": "c.bin"}]
+
+
+@pytest.mark.parametrize("result", RESULTS)
+def test_flatten_result_has_fixed_schema(result):
+    assert tuple(flatten_result(result)) == FIELD_NAMES
+
+
+def test_flatten_result_values():
+    text = flatten_result(TEXT_RESULT)
+    assert (text["input"], text["score"], text["percentage"], text["status"]) == (
+        "data/a.txt", 0.82, 82.0, "ok",
+    )
+    assert text["total_seconds"] == pytest.approx(0.3)
+
+    audio = flatten_result(AUDIO_RESULT)
+    assert (audio["score"], audio["percentage"]) == (-0.4, 40.0)
+    assert audio["label_source"] == "acoustic"
+    assert audio["analyze_seconds"] == 0.25
+
+    failure = flatten_result(URL_FAILURE)
+    assert failure["input"] == "http://example.com/x"
+    assert (failure["status"], failure["error"]) == ("error", "fetch_failed: timeout")
+    assert failure["score"] is None
+
+
+def test_result_format():
+    assert result_format("out/results.CSV") == "csv"
+    assert result_format("out/results.parquet") == "parquet"
+    assert result_format("out/results.txt") == "jsonl"
+    assert result_format("out/results.txt", "csv") == "csv"
+    with pytest.raises(ValueError):
+        result_format("out/results.jsonl", "xlsx")
+
+
+def test_jsonl_writer(tmp_path):
+    path = tmp_path / "nested" / "results.jsonl"
+    with open_result_writer(path) as writer:
+        assert isinstance(writer, JsonlResultWriter)
+        for result in RESULTS:
+            writer.write(result)
+        writer.flush()
+        assert len(path.read_text(encoding="utf-8").splitlines()) == len(RESULTS)
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert writer.count == len(RESULTS)
+    assert [r["input"] for r in records] == ["data/a.txt", "data/b.wav", "http://example.com/x", "c.bin"]
+    assert records[0]["emotion_label"] == "기쁨"
+
+
+def test_csv_writer(tmp_path):
+    path = tmp_path / "results.csv"
+    with open_result_writer(path) as writer:
+        assert isinstance(writer, CsvResultWriter)
+        for result in RESULTS:
+            writer.write(result)
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        assert tuple(reader.fieldnames) == FIELD_NAMES
+        rows = list(reader)
+    assert len(rows) == len(RESULTS)
+    assert rows[1]["percentage"] == "40.0"
+    assert rows[2]["error"] == "fetch_failed: timeout"
+
+
+def test_parquet_writer_row_groups(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "results.parquet"
+    with open_result_writer(path, row_group_size=2) as writer:
+        for result in RESULTS + [TEXT_RESULT]:
+            writer.write(result)
+        writer.flush()  # 남은 1행을 바로 row group 으로
+        writer.write(AUDIO_RESULT)
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 6
+    assert [parquet.metadata.row_group(i).num_rows for i in range(parquet.num_row_groups)] == [2, 2, 1, 1]
+    assert tuple(parquet.schema_arrow.names) == FIELD_NAMES
+    table = parquet.read()
+    assert table.column("input").to_pylist()[:2] == ["data/a.txt", "data/b.wav"]
+    assert table.column("moved").to_pylist()[0] is False
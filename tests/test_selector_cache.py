@@ -0,0 +1,87 @@
+import pytest
+
+from datamood.text.selector_cache import SelectorCache, host_of
+
+URL = "https://News.Example.com:8080/a/1"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SelectorCache(str(tmp_path / "selectors.sqlite"), relearn_after=2)
+    yield cache
+    cache.close()
+
+
+def test_host_of():
+    assert host_of(URL) == "news.example.com:8080"
+    assert host_of("Example.com") == "example.com"
+
+
+def test_learn_then_hit(cache):
+    assert cache.lookup(URL) is None
+    assert cache.record(URL, None, "class:token:article_body") is False
+    assert cache.lookup("https://news.example.com:8080/b/2") == "class:token:article_body"
+
+    assert cache.record(URL, "class:token:article_body", "class:token:article_body") is True
+    assert cache.host_stats(URL) == {
+        "selector": "class:token:article_body",
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+    assert cache.stats()["relearned"] == 0
+
+
+def test_relearns_when_layout_changes(cache):
+    cache.record(URL, None, "class:token:article_body")
+    assert cache.record(URL, "class:token:article_body", "id:contains:article") is False
+    assert cache.lookup(URL) == "id:contains:article"
+    assert cache.stats()["relearned"] == 1
+
+
+def test_forgets_after_consecutive_misses(cache):
+    cache.record(URL, None, "class:token:article_body")
+    cache.record(URL, "class:token:article_body", None)
+    assert cache.lookup(URL) == "class:token:article_body"
+    # 적중하면 연속 미스가 초기화된다
+    cache.record(URL, "class:token:article_body", "class:token:article_body")
+    cache.record(URL, "class:token:article_body", None)
+    assert cache.lookup(URL) == "class:token:article_body"
+    cache.record(URL, "class:token:article_body", None)
+    assert cache.lookup(URL) is None
+    assert cache.stats()["learned"] == 0
+
+
+def test_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "selectors.sqlite")
+    cache = SelectorCache(path, flush_every=100)
+    cache.record(URL, None, "class:token:article_body")
+    cache.record(URL, "class:token:article_body", "class:token:article_body")
+    cache.close()
+
+    reopened = SelectorCache(path)
+    assert reopened.lookup(URL) == "class:token:article_body"
+    assert reopened.host_stats(URL)["hits"] == 1
+    reopened.clear()
+    assert reopened.lookup(URL) is None
+    reopened.close()
+
+
+def test_extract_from_html_uses_learned_selector(cache):
+    pytest.importorskip("bs4")
+    from datamood.text.텍스트추출_저장 import Converter_save
+
+    first = "<h1>제목</h1><div class='article_body'>첫번째기사의 본문입니다</div>"
+    title, body = Converter_save.extract_from_html(first, url=URL, selector_cache=cache)
+    assert (title, body) == ("제목", "첫번째기사의 본문입니다")
+    assert cache.lookup(URL) == "class:token:article_body"
+
+    Converter_save.extract_from_html(first, url=URL, selector_cache=cache)
+    assert cache.host_stats(URL)["hits"] == 1
+
+    # 레이아웃이 바뀌면 새 셀렉터로 다시 학습
+    changed = "<h1>제목</h1><div id='main_article'>바뀐레이아웃의 본문입니다</div>"
+    _, body = Converter_save.extract_from_html(changed, url=URL, selector_cache=cache)
+    assert body == "바뀐레이아웃의 본문입니다"
+    assert cache.lookup(URL) == "id:contains:article"
+    assert cache.stats()["relearned"] == 1
@@ -0,0 +1,79 @@
+import pytest
+
+from datamood.audio import transcript_cache as transcript_cache_module
+from datamood.audio.transcript_cache import TranscriptCache, transcript_hasher, transcript_key
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranscriptCache(str(tmp_path / "transcripts.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_incremental_hash_matches_key():
+    pcm = bytes(range(256)) * 40
+    h = transcript_hasher("google", "ko-KR")
+    for start in range(0, len(pcm), 1000):
+        h.update(pcm[start:start + 1000])
+    assert h.hexdigest() == transcript_key(pcm, "google", "ko-KR")
+
+
+def test_key_depends_on_backend_and_language():
+    pcm = b"\x00\x01" * 100
+    key = transcript_key(pcm, "google", "ko-KR")
+    assert key == transcript_key(pcm, "google", "ko-KR")
+    assert key != transcript_key(pcm, "google", "en-US")
+    assert key != transcript_key(pcm, "whisper", "ko-KR")
+    assert key != transcript_key(pcm + b"\x00", "google", "ko-KR")
+
+
+def test_get_put_and_stats(cache):
+    assert cache.get("k1") is None
+    cache.put("k1", "안녕하세요")
+    assert cache.get("k1") == "안녕하세요"
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "entries": 1,
+        "bytes": len("안녕하세요".encode("utf-8")),
+    }
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["hits"] == 0
+
+
+def test_lru_eviction_by_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript_cache_module.time, "time", _Clock().time)
+    cache = TranscriptCache(str(tmp_path / "transcripts.sqlite"), max_bytes=25)
+    cache.put("a", "a" * 10)
+    cache.put("b", "b" * 10)
+    cache.get("a")  # a 를 최근 사용으로
+    cache.put("c", "c" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 10
+    assert cache.get("c") == "c" * 10
+    assert cache.stats()["bytes"] == 20
+    cache.close()
+
+
+def test_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "transcripts.sqlite")
+    cache = TranscriptCache(path)
+    cache.put("k", "텍스트")
+    cache.close()
+
+    reopened = TranscriptCache(path)
+    assert reopened.get("k") == "텍스트"
+    reopened.close()
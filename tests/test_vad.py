@@ -0,0 +1,101 @@
+import wave
+
+import numpy as np
+import pytest
+
+from datamood.audio.vad import (
+    detect_speech_segments,
+    plan_chunks,
+    read_wav_pcm,
+    summarize_segments,
+)
+
+RATE = 16000
+
+
+def _signal(*parts):
+    """(종류, 초) 목록으로 테스트 신호를 만든다. 종류는 "tone" 또는 "silence"."""
+    rng = np.random.default_rng(0)
+    pieces = []
+    for kind, seconds in parts:
+        n = int(RATE * seconds)
+        if kind == "tone":
+            t = np.arange(n) / RATE
+            pieces.append(8000 * np.sin(2 * np.pi * 300 * t))
+        else:
+            pieces.append(rng.normal(0, 5, n))
+    return np.concatenate(pieces).astype(np.int16)
+
+
+def test_detects_speech_between_silence():
+    samples = _signal(("silence", 1.0), ("tone", 1.0), ("silence", 1.5), ("tone", 0.6), ("silence", 1.0))
+    segments = detect_speech_segments(samples, RATE)
+    assert len(segments) == 2
+    (s1, e1), (s2, e2) = segments
+    assert s1 == pytest.approx(0.8, abs=0.05) and e1 == pytest.approx(2.2, abs=0.05)
+    assert s2 == pytest.approx(3.3, abs=0.05) and e2 == pytest.approx(4.3, abs=0.05)
+
+
+def test_short_silence_merges_and_short_bursts_are_dropped():
+    merged = detect_speech_segments(
+        _signal(("silence", 1.0), ("tone", 0.5), ("silence", 0.3), ("tone", 0.5), ("silence", 1.0)), RATE
+    )
+    assert len(merged) == 1
+
+    burst = detect_speech_segments(_signal(("silence", 1.0), ("tone", 0.06), ("silence", 1.0)), RATE)
+    assert burst == []
+
+
+def test_silence_and_empty_input():
+    assert detect_speech_segments(_signal(("silence", 2.0)), RATE) == []
+    assert detect_speech_segments(np.zeros(10, dtype=np.int16), RATE) == []
+
+
+def test_plan_chunks_splits_on_segments():
+    chunks = plan_chunks([(0.0, 20.0), (25.0, 45.0), (50.0, 60.0)], max_chunk_seconds=30.0)
+    assert chunks == [[(0.0, 20.0)], [(25.0, 45.0), (50.0, 60.0)]]
+    chunks = plan_chunks([(0.0, 10.0), (12.0, 22.0), (30.0, 45.0)], max_chunk_seconds=30.0)
+    assert chunks == [[(0.0, 10.0), (12.0, 22.0)], [(30.0, 45.0)]]
+
+
+def test_plan_chunks_splits_long_segment():
+    chunks = plan_chunks([(0.0, 120.0)], max_chunk_seconds=50.0)
+    assert chunks == [[(0.0, 40.0)], [(40.0, 80.0)], [(80.0, 120.0)]]
+
+
+def test_summarize_segments():
+    assert summarize_segments([(0.5, 2.0), (3.0, 4.0)], 10.0) == {
+        "total_seconds": 10.0,
+        "speech_seconds": 2.5,
+        "saved_seconds": 7.5,
+        "segments": 2,
+    }
+
+
+def _write_wav(path, frames: bytes, channels: int, width: int):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(RATE)
+        wf.writeframes(frames)
+
+
+def test_read_wav_pcm_formats(tmp_path):
+    mono = np.array([0, 1000, -1000, 32767], dtype="<i2")
+    _write_wav(tmp_path / "mono.wav", mono.tobytes(), 1, 2)
+    samples, rate = read_wav_pcm(str(tmp_path / "mono.wav"))
+    assert rate == RATE
+    assert samples.tolist() == mono.tolist()
+
+    stereo = np.array([[1000, 3000], [-2000, -4000]], dtype="<i2")
+    _write_wav(tmp_path / "stereo.wav", stereo.tobytes(), 2, 2)
+    samples, _ = read_wav_pcm(str(tmp_path / "stereo.wav"))
+    assert samples.tolist() == [2000, -3000]
+
+    _write_wav(tmp_path / "u8.wav", bytes([128, 255, 0]), 1, 1)
+    samples, _ = read_wav_pcm(str(tmp_path / "u8.wav"))
+    assert samples.tolist() == [0, 127 << 8, -128 << 8]
+
+    _write_wav(tmp_path / "s24.wav", b"\0" * 6, 1, 3)
+    with pytest.raises(ValueError):
+        read_wav_pcm(str(tmp_path / "s24.wav"))
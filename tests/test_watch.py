@@ -0,0 +1,94 @@
+import os
+import time
+
+import pytest
+
+from datamood.watch import InboxWatcher
+
+SETTLE = 0.1
+
+
+def _collect(watcher, seconds):
+    """seconds 동안 poll 해서 나온 파일 이름 목록을 반환한다."""
+    found = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        found += [p.name for p in watcher.poll(timeout=0.02)]
+    return found
+
+
+@pytest.fixture
+def polling(tmp_path):
+    watcher = InboxWatcher(
+        tmp_path, settle_seconds=SETTLE, poll_interval=0.02, use_inotify=False, exclude=["sorted"]
+    )
+    yield watcher
+    watcher.close()
+
+
+@pytest.fixture
+def inotify(tmp_path):
+    watcher = InboxWatcher(tmp_path, settle_seconds=SETTLE)
+    if watcher.mode != "inotify":
+        watcher.close()
+        pytest.skip("inotify 를 사용할 수 없음")
+    yield watcher
+    watcher.close()
+
+
+def test_missing_directory(tmp_path):
+    with pytest.raises(NotADirectoryError):
+        InboxWatcher(tmp_path / "missing", use_inotify=False)
+
+
+def test_existing_files_are_emitted(tmp_path):
+    (tmp_path / "a.txt").write_text("기존 파일", encoding="utf-8")
+    (tmp_path / "skip.bin").write_bytes(b"\0")
+    with InboxWatcher(tmp_path, settle_seconds=SETTLE, use_inotify=False) as watcher:
+        assert [p.name for p in watcher.poll(timeout=0)] == ["a.txt"]
+    with InboxWatcher(tmp_path, settle_seconds=SETTLE, use_inotify=False, existing=False) as watcher:
+        assert watcher.poll(timeout=0) == []
+
+
+def test_polling_waits_until_file_settles(polling, tmp_path):
+    assert polling.mode == "polling"
+    path = tmp_path / "a.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(5):
+            f.write("쓰는 중\n")
+            f.flush()
+            assert _collect(polling, SETTLE / 2) == []
+    assert _collect(polling, SETTLE * 4) == ["a.txt"]
+    # 한 번 내보낸 파일은 다시 바뀔 때까지 내보내지 않는다
+    assert _collect(polling, SETTLE * 2) == []
+    (tmp_path / "sorted").mkdir()
+    (tmp_path / "sorted" / "a.txt").write_text("정렬됨", encoding="utf-8")
+    path.write_text("다시 씀", encoding="utf-8")
+    assert _collect(polling, SETTLE * 4) == ["a.txt"]
+
+
+def test_batches_group_ready_files(polling, tmp_path):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    batch = next(polling.batches(max_batch=2, max_wait=SETTLE))
+    assert len(batch) == 2
+    assert sorted(p.name for p in batch + next(polling.batches())) == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_inotify_waits_for_close(inotify, tmp_path):
+    f = open(tmp_path / "a.txt", "w", encoding="utf-8")
+    try:
+        f.write("쓰는 중")
+        f.flush()
+        assert _collect(inotify, SETTLE * 2) == []
+    finally:
+        f.close()
+    assert _collect(inotify, SETTLE * 2) == ["a.txt"]
+
+
+def test_inotify_emits_files_without_close_event(inotify, tmp_path):
+    source = tmp_path.parent / f"{tmp_path.name}-src.txt"
+    source.write_text("링크 원본", encoding="utf-8")
+    os.link(source, tmp_path / "hard.txt")
+    os.symlink(source, tmp_path / "soft.txt")
+    assert sorted(_collect(inotify, SETTLE * 6)) == ["hard.txt", "soft.txt"]